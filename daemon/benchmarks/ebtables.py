@@ -0,0 +1,131 @@
+"""
+Benchmark counting the processes spawned per WLAN ebtables update, where each
+update toggles a single link, comparing the atomic file commit against a single
+ebtables-restore load, for full chain rebuilds and for delta updates.
+
+Commands are counted rather than ran, so this does not require root or
+ebtables to be installed:
+
+    python benchmarks/ebtables.py --nodes 10 50 100
+"""
+
+import argparse
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from core.nodes import network
+from core.nodes.network import EbtablesQueue
+
+
+class CountingRunner:
+    """
+    Stands in for running commands, counting them and emulating ebtables-save
+    and ebtables-restore.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.saved = "*filter\n:INPUT ACCEPT\n:FORWARD ACCEPT\n:OUTPUT ACCEPT"
+
+    def __call__(self, args, env=None, cwd=None, wait=True, shell=False):
+        self.count += 1
+        if args == "ebtables-save":
+            return self.saved
+        if args.startswith("ebtables-restore "):
+            self.saved = args.split("\n", 1)[1].rsplit("\n", 1)[0]
+        return ""
+
+
+class Interface:
+    def __init__(self, localname):
+        self.localname = localname
+
+
+class Wlan(SimpleNamespace):
+    __hash__ = object.__hash__
+
+
+def create_wlan(nodes):
+    """
+    Create a stand in WLAN with all interfaces linked to each other.
+
+    :param int nodes: number of nodes in the wlan
+    :return: wlan
+    """
+    netifs = [Interface(f"veth{x}.0.1") for x in range(nodes)]
+    linked = {}
+    for i, netif1 in enumerate(netifs):
+        linked[netif1] = {netif2: True for netif2 in netifs[i + 1 :]}
+    session = SimpleNamespace(distributed=SimpleNamespace(servers={}))
+    return Wlan(
+        session=session,
+        brname="b.1.1",
+        policy="DROP",
+        has_ebtables_chain=False,
+        _linked=linked,
+        _linked_lock=threading.Lock(),
+    )
+
+
+def run(nodes, updates, atomic, delta):
+    """
+    Run WLAN updates and count the processes spawned.
+
+    :param int nodes: number of nodes in the wlan
+    :param int updates: number of updates to run
+    :param bool atomic: True to use the atomic file commit
+    :param bool delta: True to update only the changed link, False to rebuild
+    :return: processes per update and seconds per update
+    :rtype: tuple
+    """
+    runner = CountingRunner()
+    queue = EbtablesQueue()
+    wlan = create_wlan(nodes)
+    netif1 = next(iter(wlan._linked))
+    netif2 = next(iter(wlan._linked[netif1]))
+    save_bin = None if atomic else "ebtables-save"
+    restore_bin = None if atomic else "ebtables-restore"
+    with mock.patch.object(network.utils, "cmd", runner), mock.patch.multiple(
+        network, EBTABLES_SAVE_BIN=save_bin, EBTABLES_RESTORE_BIN=restore_bin
+    ):
+        queue.buildcmds(wlan)
+        queue.ebcommit(wlan)
+        runner.count = 0
+        start = time.perf_counter()
+        for _ in range(updates):
+            linked = wlan._linked[netif1]
+            linked[netif2] = not linked[netif2]
+            if delta:
+                queue.ebchange(wlan, netif1, netif2)
+            else:
+                queue.ebchange(wlan)
+            queue.buildcmds(wlan)
+            queue.ebcommit(wlan)
+        elapsed = time.perf_counter() - start
+    return runner.count / updates, elapsed / updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ebtables update benchmark")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--updates", type=int, default=5)
+    args = parser.parse_args()
+    print(
+        f"{'nodes':>6} {'mode':>8} {'update':>8} {'procs/update':>13} {'ms/update':>10}"
+    )
+    for nodes in args.nodes:
+        for mode in ("atomic", "restore"):
+            for update in ("rebuild", "delta"):
+                atomic = mode == "atomic"
+                delta = update == "delta"
+                procs, seconds = run(nodes, args.updates, atomic, delta)
+                print(
+                    f"{nodes:>6} {mode:>8} {update:>8} {procs:>13.0f} "
+                    f"{seconds * 1000:>10.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
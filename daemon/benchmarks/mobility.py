@@ -0,0 +1,114 @@
+"""
+Benchmark the basic range model re-calculating links for rounds where every
+node moves, comparing the scalar calculation against the vectorized numpy
+calculation, and validating both arrive at the same links.
+
+Links are tracked by stand in objects, so this does not require root, but the
+vectorized calculation requires numpy to be installed:
+
+    python benchmarks/mobility.py --nodes 100 500 2000
+"""
+
+import argparse
+import random
+import threading
+import time
+from functools import total_ordering
+from types import SimpleNamespace
+
+from core.location.mobility import BasicRangeModel
+
+CONFIG = {"range": "275", "bandwidth": "0", "delay": "0", "error": "0", "jitter": "0"}
+
+
+@total_ordering
+class Interface:
+    def __init__(self, _id, position):
+        self.id = _id
+        self.position = position
+        self.node = SimpleNamespace(id=_id, getposition=lambda: self.position)
+
+    def __eq__(self, other):
+        return self is other
+
+    def __lt__(self, other):
+        return self.id < other.id
+
+    __hash__ = object.__hash__
+
+
+class Wlan:
+    def __init__(self):
+        self.id = 0
+        self.policy = "DROP"
+        self.links = set()
+        self._linked_lock = threading.Lock()
+
+    def linked(self, netif1, netif2):
+        return (netif1, netif2) in self.links
+
+    def link(self, netif1, netif2):
+        self.links.add((netif1, netif2))
+
+    def unlink(self, netif1, netif2):
+        self.links.discard((netif1, netif2))
+
+
+def run(nodes, rounds, vectorized, size):
+    """
+    Run rounds of moving every node and re-calculating links.
+
+    :param int nodes: number of nodes in the wlan
+    :param int rounds: number of rounds to run
+    :param bool vectorized: True to use the numpy calculation
+    :param int size: width and height of the canvas
+    :return: resulting linked node ids and seconds per round
+    :rtype: tuple
+    """
+    rng = random.Random(nodes)
+    wlan = Wlan()
+    session = SimpleNamespace(
+        get_node=lambda _id: wlan,
+        options=SimpleNamespace(get_config=lambda key: str(vectorized)),
+        broadcast_link=lambda link_data: None,
+    )
+    model = BasicRangeModel(session, wlan.id)
+    model.values_from_config(CONFIG)
+    netifs = []
+    for _id in range(nodes):
+        netif = Interface(_id, (rng.uniform(0, size), rng.uniform(0, size), 0))
+        model.set_position(netif, *netif.position)
+        netifs.append(netif)
+    elapsed = 0
+    for _ in range(rounds):
+        for netif in netifs:
+            x, y, z = netif.position
+            x = min(max(x + rng.uniform(-50, 50), 0), size)
+            y = min(max(y + rng.uniform(-50, 50), 0), size)
+            netif.position = (x, y, z)
+        start = time.perf_counter()
+        model.update(True, list(netifs))
+        elapsed += time.perf_counter() - start
+    links = {(netif1.id, netif2.id) for netif1, netif2 in wlan.links}
+    return links, elapsed / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="range model update benchmark")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--size", type=int, default=5000)
+    args = parser.parse_args()
+    print(f"{'nodes':>6} {'links':>8} {'scalar ms':>10} {'numpy ms':>10} {'match':>6}")
+    for nodes in args.nodes:
+        scalar_links, scalar = run(nodes, args.rounds, False, args.size)
+        numpy_links, vectorized = run(nodes, args.rounds, True, args.size)
+        match = scalar_links == numpy_links
+        print(
+            f"{nodes:>6} {len(scalar_links):>8} {scalar * 1000:>10.2f} "
+            f"{vectorized * 1000:>10.2f} {str(match):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
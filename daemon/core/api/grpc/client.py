@@ -381,17 +381,48 @@ class CoreGrpcClient:
         )
         return self.stub.AddSessionServer(request)
 
-    def events(self, session_id, handler, events=None):
+    def events(
+        self,
+        session_id,
+        handler,
+        events=None,
+        batch_positions=False,
+        position_rate=0,
+        node_ids=None,
+        link_node_ids=None,
+        message_types=None,
+        queue_size=0,
+    ):
         """
         Listen for session events.
 
         :param int session_id: id of session
         :param handler: handler for received events
         :param list events: events to listen to, defaults to all
+        :param bool batch_positions: True to receive moved nodes in batches, as
+            node events with a list of nodes
+        :param float position_rate: maximum batches of moved nodes per second, 0
+            for every batch
+        :param list node_ids: node ids to receive node events for, defaults to all
+        :param list link_node_ids: node ids to receive link events for, when
+            either end of the link is one of them, defaults to all
+        :param list message_types: message types to receive node, link, config
+            and file events for, defaults to all
+        :param int queue_size: maximum events queued for the stream, 0 for the
+            server default, moved nodes are coalesced when full
         :return: stream processing events, can be used to cancel stream
         :raises grpc.RpcError: when session doesn't exist
         """
-        request = core_pb2.EventsRequest(session_id=session_id, events=events)
+        request = core_pb2.EventsRequest(
+            session_id=session_id,
+            events=events,
+            batch_positions=batch_positions,
+            position_rate=position_rate,
+            node_ids=node_ids,
+            link_node_ids=link_node_ids,
+            message_types=message_types,
+            queue_size=queue_size,
+        )
         stream = self.stub.Events(request)
         start_streamer(stream, handler)
         return stream
@@ -648,33 +679,37 @@ class CoreGrpcClient:
         request = core_pb2.GetMobilityConfigsRequest(session_id=session_id)
         return self.stub.GetMobilityConfigs(request)
 
-    def get_mobility_config(self, session_id, node_id):
+    def get_mobility_config(self, session_id, node_id, model=None):
         """
         Get mobility configuration for a node.
 
         :param int session_id: session id
         :param int node_id: node id
+        :param str model: mobility model name, defaults to ns2script
         :return: response with a list of configuration groups
         :rtype: core_pb2.GetMobilityConfigResponse
-        :raises grpc.RpcError: when session or node doesn't exist
+        :raises grpc.RpcError: when session, node or model doesn't exist
         """
         request = core_pb2.GetMobilityConfigRequest(
-            session_id=session_id, node_id=node_id
+            session_id=session_id, node_id=node_id, model=model
         )
         return self.stub.GetMobilityConfig(request)
 
-    def set_mobility_config(self, session_id, node_id, config):
+    def set_mobility_config(self, session_id, node_id, config, model=None):
         """
         Set mobility configuration for a node.
 
         :param int session_id: session id
         :param int node_id: node id
         :param dict[str, str] config: mobility configuration
+        :param str model: mobility model name, defaults to ns2script
         :return: response with result of success or failure
         :rtype: core_pb2.SetMobilityConfigResponse
-        :raises grpc.RpcError: when session or node doesn't exist
+        :raises grpc.RpcError: when session, node or model doesn't exist
         """
-        mobility_config = core_pb2.MobilityConfig(node_id=node_id, config=config)
+        mobility_config = core_pb2.MobilityConfig(
+            node_id=node_id, config=config, model=model
+        )
         request = core_pb2.SetMobilityConfigRequest(
             session_id=session_id, mobility_config=mobility_config
         )
@@ -1,5 +1,6 @@
+import collections
 import logging
-from queue import Empty, Queue
+import threading
 
 from core.api.grpc import core_pb2
 from core.api.grpc.grpcutils import convert_value
@@ -11,6 +12,12 @@ from core.emulator.data import (
     LinkData,
     NodeData,
 )
+from core.emulator.eventbus import OverflowPolicy, position_key
+
+# default maximum events queued for a stream
+DEFAULT_QUEUE_SIZE = 1024
+# default maximum converted events kept for other streams
+DEFAULT_CACHE_SIZE = 4096
 
 
 def handle_node_event(event):
@@ -34,6 +41,18 @@ def handle_node_event(event):
     return core_pb2.NodeEvent(node=node_proto, source=event.source)
 
 
+def handle_node_position(node_data):
+    """
+    Handle a node position within a batch of node positions
+
+    :param core.emulator.data.NodeData node_data: node data for moved node
+    :return: node with the node id, name and position
+    :rtype: core.api.grpc.core_pb2.Node
+    """
+    position = core_pb2.Position(x=node_data.x_position, y=node_data.y_position)
+    return core_pb2.Node(id=node_data.id, name=node_data.name, position=position)
+
+
 def handle_link_event(event):
     """
     Handle link event when there is a link event
@@ -174,86 +193,257 @@ def handle_file_event(event):
     )
 
 
+class EventCache:
+    """
+    Converts session events to grpc events once, for all streams receiving them.
+
+    Session events are published as the same data object to every stream, so
+    converted events are kept by data object, for the other streams to reuse.
+    Converted events are shared and must not be modified.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        """
+        Create an EventCache instance.
+
+        :param int maxsize: maximum converted events kept
+        """
+        self.maxsize = maxsize
+        self.events = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, kind, data):
+        """
+        Get a converted event or node kept for a data object.
+
+        :param type kind: kind of conversion kept
+        :param data: event data
+        :return: converted event or node, None if not kept
+        """
+        with self.lock:
+            cached = self.events.get((kind, id(data)))
+            # the data object is kept with its event, so its id is not reused
+            if cached is not None and cached[0] is data:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        return None
+
+    def _put(self, kind, data, value):
+        """
+        Keep a converted event or node for a data object.
+
+        :param type kind: kind of conversion kept
+        :param data: event data
+        :param value: converted event or node
+        :return: nothing
+        """
+        with self.lock:
+            self.events[(kind, id(data))] = (data, value)
+            while len(self.events) > self.maxsize:
+                self.events.popitem(last=False)
+
+    def node(self, node_data):
+        """
+        Convert a node position within a batch of node positions.
+
+        :param core.emulator.data.NodeData node_data: node data for moved node
+        :return: node with the node id, name and position
+        :rtype: core.api.grpc.core_pb2.Node
+        """
+        node = self._get(core_pb2.Node, node_data)
+        if node is None:
+            node = handle_node_position(node_data)
+            self._put(core_pb2.Node, node_data, node)
+        return node
+
+    def get(self, session_id, data):
+        """
+        Convert session event data to a grpc event.
+
+        :param int session_id: id of session the event is from
+        :param data: event data, or a batch of node positions
+        :return: grpc event, or None when invalid event
+        :rtype: core.api.grpc.core_pb2.Event
+        """
+        event = self._get(core_pb2.Event, data)
+        if event is not None:
+            return event
+        event = core_pb2.Event(session_id=session_id)
+        if isinstance(data, NodeData):
+            event.node_event.CopyFrom(handle_node_event(data))
+        elif isinstance(data, list):
+            # batches may be reduced per stream, nodes are still shared
+            event.node_event.nodes.extend(self.node(x) for x in data)
+        elif isinstance(data, LinkData):
+            event.link_event.CopyFrom(handle_link_event(data))
+        elif isinstance(data, EventData):
+            event.session_event.CopyFrom(handle_session_event(data))
+        elif isinstance(data, ConfigData):
+            event.config_event.CopyFrom(handle_config_event(data))
+        elif isinstance(data, ExceptionData):
+            event.exception_event.CopyFrom(handle_exception_event(data))
+        elif isinstance(data, FileData):
+            event.file_event.CopyFrom(handle_file_event(data))
+        else:
+            logging.error("unknown event: %s", data)
+            return None
+        self._put(core_pb2.Event, data, event)
+        return event
+
+    def stats(self):
+        """
+        Provides metrics for converted events.
+
+        :return: kept events, events reused and events converted
+        :rtype: dict
+        """
+        with self.lock:
+            return {"size": len(self.events), "hits": self.hits, "misses": self.misses}
+
+
 class EventStreamer:
     """
     Processes session events to generate grpc events.
     """
 
-    def __init__(self, session, event_types):
+    def __init__(
+        self,
+        session,
+        event_types,
+        batch_positions=False,
+        position_rate=0,
+        node_ids=None,
+        link_node_ids=None,
+        message_types=None,
+        queue_size=0,
+        cache=None,
+    ):
         """
         Create a EventStreamer instance.
 
         :param core.emulator.session.Session session: session to process events for
         :param set event_types: types of events to process
+        :param bool batch_positions: True to receive node positions in batches,
+            rather than a node event per moved node
+        :param float position_rate: maximum batches of node positions per second,
+            0 for every batch
+        :param set node_ids: node ids to process node events for, empty for all
+        :param set link_node_ids: node ids to process link events for, when either
+            end of the link is one of them, empty for all
+        :param set message_types: message types to process node, link, config and
+            file events for, empty for all
+        :param int queue_size: maximum queued events, 0 for the default, position
+            updates are coalesced by node when full
+        :param EventCache cache: converted events shared with other streams, None
+            to convert events for this stream only
         """
         self.session = session
         self.event_types = event_types
-        self.queue = Queue()
+        self.batch_positions = batch_positions
+        self.position_rate = position_rate
+        self.node_ids = set(node_ids or [])
+        self.link_node_ids = set(link_node_ids or [])
+        self.message_types = set(message_types or [])
+        self.queue_size = queue_size or DEFAULT_QUEUE_SIZE
+        self.cache = cache or EventCache()
+        self.subscriber = None
         self.add_handlers()
 
     def add_handlers(self):
         """
-        Add a session event handler for desired event types.
+        Subscribe to session events for desired event types.
 
         :return: nothing
         """
+        data_types = {}
         if core_pb2.EventType.NODE in self.event_types:
-            self.session.node_handlers.append(self.queue.put)
+            data_types[NodeData] = None
+            if self.batch_positions:
+                data_types[list] = None
         if core_pb2.EventType.LINK in self.event_types:
-            self.session.link_handlers.append(self.queue.put)
+            data_types[LinkData] = None
         if core_pb2.EventType.CONFIG in self.event_types:
-            self.session.config_handlers.append(self.queue.put)
+            data_types[ConfigData] = None
         if core_pb2.EventType.FILE in self.event_types:
-            self.session.file_handlers.append(self.queue.put)
+            data_types[FileData] = None
         if core_pb2.EventType.EXCEPTION in self.event_types:
-            self.session.exception_handlers.append(self.queue.put)
+            data_types[ExceptionData] = None
         if core_pb2.EventType.SESSION in self.event_types:
-            self.session.event_handlers.append(self.queue.put)
+            data_types[EventData] = None
+        self.subscriber = self.session.bus.subscribe(
+            f"grpc events {id(self)}",
+            data_types,
+            maxsize=self.queue_size,
+            policy=OverflowPolicy.COALESCE,
+            key=position_key,
+            select=self.select,
+            position_rate=self.position_rate,
+            deliver=False,
+        )
+
+    def is_message_type(self, message_type):
+        """
+        Check if a message type is one of the message types being watched.
+
+        :param int message_type: message flags of event
+        :return: True if watched, False otherwise
+        :rtype: bool
+        """
+        if not self.message_types:
+            return True
+        if not message_type:
+            return core_pb2.MessageType.NONE in self.message_types
+        return any(message_type & x for x in self.message_types)
+
+    def select(self, data):
+        """
+        Filter an event by the node ids and message types being watched.
+
+        :param data: event data
+        :return: event data to process, node position batches are reduced to the
+            watched nodes, or None to skip it
+        """
+        if isinstance(data, list):
+            if not self.is_message_type(0):
+                return None
+            if self.node_ids:
+                data = [x for x in data if x.id in self.node_ids]
+            return data or None
+        elif isinstance(data, NodeData):
+            if self.node_ids and data.id not in self.node_ids:
+                return None
+        elif isinstance(data, LinkData):
+            if (
+                self.link_node_ids
+                and data.node1_id not in self.link_node_ids
+                and data.node2_id not in self.link_node_ids
+            ):
+                return None
+        if isinstance(data, (NodeData, LinkData, ConfigData, FileData)):
+            if not self.is_message_type(data.message_type):
+                return None
+        return data
 
     def process(self):
         """
         Process the next event in the queue.
 
-        :return: grpc event, or None when invalid event or queue timeout
+        :return: grpc event, shared with other streams, or None when invalid event
+            or queue timeout
         :rtype: core.api.grpc.core_pb2.Event
         """
-        event = core_pb2.Event(session_id=self.session.id)
-        try:
-            data = self.queue.get(timeout=1)
-            if isinstance(data, NodeData):
-                event.node_event.CopyFrom(handle_node_event(data))
-            elif isinstance(data, LinkData):
-                event.link_event.CopyFrom(handle_link_event(data))
-            elif isinstance(data, EventData):
-                event.session_event.CopyFrom(handle_session_event(data))
-            elif isinstance(data, ConfigData):
-                event.config_event.CopyFrom(handle_config_event(data))
-            elif isinstance(data, ExceptionData):
-                event.exception_event.CopyFrom(handle_exception_event(data))
-            elif isinstance(data, FileData):
-                event.file_event.CopyFrom(handle_file_event(data))
-            else:
-                logging.error("unknown event: %s", data)
-                event = None
-        except Empty:
-            event = None
-        return event
+        data = self.subscriber.get(timeout=1)
+        if data is None:
+            return None
+        return self.cache.get(self.session.id, data)
 
     def remove_handlers(self):
         """
-        Remove session event handlers for events being watched.
+        Unsubscribe from session events.
 
         :return: nothing
         """
-        if core_pb2.EventType.NODE in self.event_types:
-            self.session.node_handlers.remove(self.queue.put)
-        if core_pb2.EventType.LINK in self.event_types:
-            self.session.link_handlers.remove(self.queue.put)
-        if core_pb2.EventType.CONFIG in self.event_types:
-            self.session.config_handlers.remove(self.queue.put)
-        if core_pb2.EventType.FILE in self.event_types:
-            self.session.file_handlers.remove(self.queue.put)
-        if core_pb2.EventType.EXCEPTION in self.event_types:
-            self.session.exception_handlers.remove(self.queue.put)
-        if core_pb2.EventType.SESSION in self.event_types:
-            self.session.event_handlers.remove(self.queue.put)
+        self.session.bus.unsubscribe(self.subscriber)
@@ -1,33 +1,31 @@
 import atexit
 import logging
 import os
-import re
 import tempfile
 import time
 from concurrent import futures
+from queue import Empty
 
 import grpc
 
 from core.api.grpc import core_pb2, core_pb2_grpc, grpcutils
-from core.api.grpc.events import EventStreamer
-from core.api.grpc.grpcutils import (
-    get_config_options,
-    get_emane_model_id,
-    get_links,
-    get_net_stats,
-)
+from core.api.grpc.events import EventCache, EventStreamer
+from core.api.grpc.grpcutils import get_config_options, get_emane_model_id, get_links
 from core.emane.nodes import EmaneNet
 from core.emulator.data import LinkData
 from core.emulator.emudata import LinkOptions, NodeOptions
 from core.emulator.enumerations import EventTypes, LinkTypes, MessageFlags
 from core.errors import CoreCommandError, CoreError
-from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
+from core.location.mobility import (
+    BasicRangeModel,
+    Ns2ScriptedMobility,
+    WayPointMobility,
+)
 from core.nodes.docker import DockerNode
 from core.nodes.lxd import LxcNode
 from core.services.coreservices import ServiceManager
 
 _ONE_DAY_IN_SECONDS = 60 * 60 * 24
-_INTERFACE_REGEX = re.compile(r"veth(?P<node>[0-9a-fA-F]+)")
 
 
 class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
@@ -42,6 +40,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         self.coreemu = coreemu
         self.running = True
         self.server = None
+        self.event_cache = EventCache()
         atexit.register(self._exit_handler)
 
     def _exit_handler(self):
@@ -97,6 +96,23 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         except CoreError:
             context.abort(grpc.StatusCode.NOT_FOUND, f"node {node_id} not found")
 
+    def get_mobility_model(self, session, name, context):
+        """
+        Retrieve mobility model class given its name, defaulting to the ns-2
+        script model when no name is given
+
+        :param core.emulator.session.Session session: session to get model from
+        :param str name: mobility model name
+        :param grpc.ServicerContext context:
+        :return: mobility model class. If model not found then raise an exception.
+        :rtype: class
+        """
+        name = name or Ns2ScriptedMobility.name
+        model = session.mobility.models.get(name)
+        if not model or not issubclass(model, WayPointMobility):
+            context.abort(grpc.StatusCode.NOT_FOUND, f"mobility model {name} not found")
+        return model
+
     def StartSession(self, request, context):
         """
         Start a session.
@@ -144,9 +160,8 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
 
         # mobility configs
         for config in request.mobility_configs:
-            session.mobility.set_model_config(
-                config.node_id, Ns2ScriptedMobility.name, config.config
-            )
+            model = self.get_mobility_model(session, config.model, context)
+            session.mobility.set_model_config(config.node_id, model.name, config.config)
 
         # service configs
         for config in request.service_configs:
@@ -455,7 +470,17 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         if not event_types:
             event_types = set(core_pb2.EventType.Enum.values())
 
-        streamer = EventStreamer(session, event_types)
+        streamer = EventStreamer(
+            session,
+            event_types,
+            request.batch_positions,
+            request.position_rate,
+            request.node_ids,
+            request.link_node_ids,
+            request.message_types,
+            request.queue_size,
+            self.event_cache,
+        )
         while self._is_running(context):
             event = streamer.process()
             if event:
@@ -466,71 +491,34 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
 
     def Throughputs(self, request, context):
         """
-        Calculate average throughput after every certain amount of delay time
+        Stream average throughput of session interfaces and bridges, sampled at the
+        session throughput interval by a sampler shared with other streams
 
         :param core.api.grpc.core_pb2.ThroughputsRequest request: throughputs request
         :param grpc.SrevicerContext context: context object
         :return: nothing
         """
         session = self.get_session(request.session_id, context)
-        delay = 3
-        last_check = None
-        last_stats = None
-
-        while self._is_running(context):
-            now = time.monotonic()
-            stats = get_net_stats()
-
-            # calculate average
-            if last_check is not None:
-                interval = now - last_check
+        queue = session.throughputs.subscribe()
+        try:
+            while self._is_running(context):
+                try:
+                    interfaces, bridges = queue.get(timeout=1)
+                except Empty:
+                    continue
                 throughputs_event = core_pb2.ThroughputsEvent(session_id=session.id)
-                for key in stats:
-                    current_rxtx = stats[key]
-                    previous_rxtx = last_stats.get(key)
-                    if not previous_rxtx:
-                        continue
-                    rx_kbps = (
-                        (current_rxtx["rx"] - previous_rxtx["rx"]) * 8.0 / interval
-                    )
-                    tx_kbps = (
-                        (current_rxtx["tx"] - previous_rxtx["tx"]) * 8.0 / interval
-                    )
-                    throughput = rx_kbps + tx_kbps
-                    if key.startswith("veth"):
-                        key = key.split(".")
-                        node_id = _INTERFACE_REGEX.search(key[0]).group("node")
-                        node_id = int(node_id, base=16)
-                        interface_id = int(key[1], base=16)
-                        session_id = int(key[2], base=16)
-                        if session.id != session_id:
-                            continue
-                        interface_throughput = (
-                            throughputs_event.interface_throughputs.add()
-                        )
-                        interface_throughput.node_id = node_id
-                        interface_throughput.interface_id = interface_id
-                        interface_throughput.throughput = throughput
-                    elif key.startswith("b."):
-                        try:
-                            key = key.split(".")
-                            node_id = int(key[1], base=16)
-                            session_id = int(key[2], base=16)
-                            if session.id != session_id:
-                                continue
-                            bridge_throughput = (
-                                throughputs_event.bridge_throughputs.add()
-                            )
-                            bridge_throughput.node_id = node_id
-                            bridge_throughput.throughput = throughput
-                        except ValueError:
-                            pass
-
+                for (node_id, interface_id), throughput in interfaces.items():
+                    interface_throughput = throughputs_event.interface_throughputs.add()
+                    interface_throughput.node_id = node_id
+                    interface_throughput.interface_id = interface_id
+                    interface_throughput.throughput = throughput
+                for node_id, throughput in bridges.items():
+                    bridge_throughput = throughputs_event.bridge_throughputs.add()
+                    bridge_throughput.node_id = node_id
+                    bridge_throughput.throughput = throughput
                 yield throughputs_event
-
-            last_check = now
-            last_stats = stats
-            time.sleep(delay)
+        finally:
+            session.throughputs.unsubscribe(queue)
 
     def AddNode(self, request, context):
         """
@@ -823,10 +811,11 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             if node_id == -1:
                 continue
             for model_name in model_config:
-                if model_name != Ns2ScriptedMobility.name:
+                model = session.mobility.models.get(model_name)
+                if not model or not issubclass(model, WayPointMobility):
                     continue
                 current_config = session.mobility.get_model_config(node_id, model_name)
-                config = get_config_options(current_config, Ns2ScriptedMobility)
+                config = get_config_options(current_config, model)
                 mapped_config = core_pb2.MappedConfig(config=config)
                 response.configs[node_id].CopyFrom(mapped_config)
         return response
@@ -843,10 +832,9 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         """
         logging.debug("get mobility config: %s", request)
         session = self.get_session(request.session_id, context)
-        current_config = session.mobility.get_model_config(
-            request.node_id, Ns2ScriptedMobility.name
-        )
-        config = get_config_options(current_config, Ns2ScriptedMobility)
+        model = self.get_mobility_model(session, request.model, context)
+        current_config = session.mobility.get_model_config(request.node_id, model.name)
+        config = get_config_options(current_config, model)
         return core_pb2.GetMobilityConfigResponse(config=config)
 
     def SetMobilityConfig(self, request, context):
@@ -862,8 +850,9 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         logging.debug("set mobility config: %s", request)
         session = self.get_session(request.session_id, context)
         mobility_config = request.mobility_config
+        model = self.get_mobility_model(session, mobility_config.model, context)
         session.mobility.set_model_config(
-            mobility_config.node_id, Ns2ScriptedMobility.name, mobility_config.config
+            mobility_config.node_id, model.name, mobility_config.config
         )
         return core_pb2.SetMobilityConfigResponse(result=True)
 
@@ -902,8 +891,9 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         """
         logging.debug("get services: %s", request)
         services = []
-        for name in ServiceManager.services:
-            service = ServiceManager.services[name]
+        all_services = ServiceManager.all_services()
+        for name in all_services:
+            service = all_services[name]
             service_proto = core_pb2.Service(group=service.group, name=service.name)
             services.append(service_proto)
         return core_pb2.GetServicesResponse(services=services)
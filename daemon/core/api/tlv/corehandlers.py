@@ -16,7 +16,14 @@ from queue import Empty, Queue
 from core import utils
 from core.api.tlv import coreapi, dataconversion, structutils
 from core.config import ConfigShim
-from core.emulator.data import ConfigData, EventData, ExceptionData, FileData
+from core.emulator.data import (
+    ConfigData,
+    EventData,
+    ExceptionData,
+    FileData,
+    LinkData,
+    NodeData,
+)
 from core.emulator.emudata import InterfaceData, LinkOptions, NodeOptions
 from core.emulator.enumerations import (
     ConfigDataTypes,
@@ -36,6 +43,7 @@ from core.emulator.enumerations import (
     RegisterTlvs,
     SessionTlvs,
 )
+from core.emulator.eventbus import OverflowPolicy
 from core.errors import CoreCommandError, CoreError
 from core.location.mobility import BasicRangeModel
 from core.nodes.network import WlanNode
@@ -84,6 +92,7 @@ class CoreHandler(socketserver.BaseRequestHandler):
             thread.start()
 
         self.session = None
+        self.subscriber = None
         self.session_clients = {}
         self.coreemu = server.coreemu
         utils.close_onexec(request.fileno())
@@ -327,6 +336,22 @@ class CoreHandler(socketserver.BaseRequestHandler):
         except IOError:
             logging.exception("error sending node message")
 
+    def handle_broadcast_nodes(self, nodes):
+        """
+        Callback to handle a batch of node positions broadcast out from a session,
+        sent as node messages in a single write.
+
+        :param list[core.emulator.data.NodeData] nodes: node data to handle
+        :return: nothing
+        """
+        logging.debug("handling broadcast nodes: %s", len(nodes))
+        messages = b"".join(dataconversion.convert_node(x) for x in nodes)
+
+        try:
+            self.sendall(messages)
+        except IOError:
+            logging.exception("error sending node messages")
+
     def handle_broadcast_link(self, link_data):
         """
         Callback to handle an link broadcast out from a session.
@@ -650,21 +675,26 @@ class CoreHandler(socketserver.BaseRequestHandler):
 
     def add_session_handlers(self):
         logging.debug("adding session broadcast handlers")
-        self.session.event_handlers.append(self.handle_broadcast_event)
-        self.session.exception_handlers.append(self.handle_broadcast_exception)
-        self.session.node_handlers.append(self.handle_broadcast_node)
-        self.session.link_handlers.append(self.handle_broadcast_link)
-        self.session.file_handlers.append(self.handle_broadcast_file)
-        self.session.config_handlers.append(self.handle_broadcast_config)
+        # broadcasts are sent from a queue, so a slow client does not hold up the
+        # session, coalescing node moves and link changes while it is behind
+        self.subscriber = self.session.bus.subscribe(
+            f"tlv {self.client_address}",
+            {
+                EventData: self.handle_broadcast_event,
+                ExceptionData: self.handle_broadcast_exception,
+                NodeData: self.handle_broadcast_node,
+                list: self.handle_broadcast_nodes,
+                LinkData: self.handle_broadcast_link,
+                FileData: self.handle_broadcast_file,
+                ConfigData: self.handle_broadcast_config,
+            },
+            maxsize=4096,
+            policy=OverflowPolicy.COALESCE,
+        )
 
     def remove_session_handlers(self):
         logging.debug("removing session broadcast handlers")
-        self.session.event_handlers.remove(self.handle_broadcast_event)
-        self.session.exception_handlers.remove(self.handle_broadcast_exception)
-        self.session.node_handlers.remove(self.handle_broadcast_node)
-        self.session.link_handlers.remove(self.handle_broadcast_link)
-        self.session.file_handlers.remove(self.handle_broadcast_file)
-        self.session.config_handlers.remove(self.handle_broadcast_config)
+        self.session.bus.unsubscribe(self.subscriber)
 
     def handle_node_message(self, message):
         """
@@ -1190,15 +1220,16 @@ class CoreHandler(socketserver.BaseRequestHandler):
             # send back a list of available services
             if opaque is None:
                 type_flag = ConfigFlags.NONE.value
+                all_services = ServiceManager.all_services()
                 data_types = tuple(
-                    repeat(ConfigDataTypes.BOOL.value, len(ServiceManager.services))
+                    repeat(ConfigDataTypes.BOOL.value, len(all_services))
                 )
 
                 # sort groups by name and map services to groups
                 groups = set()
                 group_map = {}
-                for name in ServiceManager.services:
-                    service_name = ServiceManager.services[name]
+                for name in all_services:
+                    service_name = all_services[name]
                     group = service_name.group
                     groups.add(group)
                     group_map.setdefault(group, []).append(service_name)
@@ -77,6 +77,8 @@ class EmaneManager(ModelManager):
         )
         self.doeventloop = False
         self.eventmonthread = None
+        # last location event and its converted coordinates by nem id
+        self._locations = {}
 
         # model for global EMANE configuration options
         self.emane_config = EmaneGlobalModel(session)
@@ -374,6 +376,7 @@ class EmaneManager(ModelManager):
         """
         with self._emane_node_lock:
             self._emane_nets.clear()
+        self._locations.clear()
 
         self.platformport = self.session.options.get_config_int(
             "emane_platform_port", 8100
@@ -746,12 +749,14 @@ class EmaneManager(ModelManager):
             alt = attrs["altitude"]
             logging.debug("emane location event: %s,%s,%s", lat, lon, alt)
             self.handlelocationeventtoxyz(txnemid, lat, lon, alt)
+        # broadcast all nodes moved by this event together
+        self.session.positions.flush()
 
     def handlelocationeventtoxyz(self, nemid, lat, lon, alt):
         """
         Convert the (NEM ID, lat, long, alt) from a received location event
-        into a node and x,y,z coordinate values, sending a Node Message.
-        Returns True if successfully parsed and a Node Message was sent.
+        into a node and x,y,z coordinate values, queueing a node position update.
+        Returns True if successfully parsed and a position update was queued.
         """
         # convert nemid to node number
         _emanenode, netif = self.nemlookup(nemid)
@@ -760,11 +765,16 @@ class EmaneManager(ModelManager):
             return False
 
         n = netif.node.id
-        # convert from lat/long/alt to x,y,z coordinates
-        x, y, z = self.session.location.getxyz(lat, lon, alt)
-        x = int(x)
-        y = int(y)
-        z = int(z)
+        # convert from lat/long/alt to x,y,z coordinates, unless unchanged
+        location = self._locations.get(nemid)
+        if location and location[0] == (lat, lon, alt):
+            x, y, z = location[1]
+        else:
+            x, y, z = self.session.location.getxyz(lat, lon, alt)
+            x = int(x)
+            y = int(y)
+            z = int(z)
+            self._locations[nemid] = ((lat, lon, alt), (x, y, z))
         logging.info(
             "location event NEM %s (%s, %s, %s) -> (%s, %s, %s)",
             nemid,
@@ -800,8 +810,7 @@ class EmaneManager(ModelManager):
 
         # don"t use node.setposition(x,y,z) which generates an event
         node.position.set(x, y, z)
-        node_data = node.data(message_type=0, lat=str(lat), lon=str(lon), alt=str(alt))
-        self.session.broadcast_node(node_data)
+        self.session.positions.update(node, str(lat), str(lon), str(alt))
         return True
 
     def emanerunning(self, node):
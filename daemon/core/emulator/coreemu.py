@@ -58,6 +58,11 @@ class CoreEmu:
         atexit.register(self.shutdown)
 
     def load_services(self):
+        # directory for service indexes, empty to always import service modules
+        cache_dir = self.config.get("services_cache_dir")
+        if cache_dir is not None:
+            ServiceManager.cache_dir = cache_dir or None
+
         # load default services
         self.service_errors = core.services.load()
 
@@ -0,0 +1,395 @@
+"""
+eventbus.py: delivers session broadcasts to subscribers from their own queue and
+thread, so slow subscribers do not hold up the threads producing broadcasts.
+"""
+
+import collections
+import itertools
+import logging
+import threading
+import time
+from enum import Enum
+
+from core.emulator.data import LinkData, NodeData
+
+
+class OverflowPolicy(Enum):
+    """
+    What a subscriber does with a new broadcast when its queue is full.
+    """
+
+    # wait for the queue to have room, up to the block timeout
+    BLOCK = "block"
+    # drop the oldest queued broadcast
+    DROP_OLDEST = "drop_oldest"
+    # replace a queued broadcast with the same key as broadcasts arrive, and drop
+    # the oldest when full
+    COALESCE = "coalesce"
+
+
+def broadcast_key(data):
+    """
+    Provides the key broadcasts are coalesced by, node position updates by node,
+    link updates by link and node position batches together, other broadcasts,
+    including node and link adds and deletes, are never coalesced.
+
+    :param data: broadcast data
+    :return: key or None
+    """
+    if isinstance(data, NodeData):
+        # node adds and deletes are kept
+        if data.message_type == 0:
+            return NodeData, data.id
+        return None
+    elif isinstance(data, LinkData):
+        # link adds and deletes are kept
+        if data.message_type != 0:
+            return None
+        return (
+            LinkData,
+            data.node1_id,
+            data.node2_id,
+            data.interface1_id,
+            data.interface2_id,
+        )
+    elif isinstance(data, list):
+        return list
+    return None
+
+
+def position_key(data):
+    """
+    Provides the key broadcasts are coalesced by, only coalescing node position
+    updates by node and node position batches together.
+
+    :param data: broadcast data
+    :return: key or None
+    """
+    if isinstance(data, list):
+        return list
+    elif isinstance(data, NodeData) and data.message_type == 0:
+        return NodeData, data.id
+    return None
+
+
+class Subscriber:
+    """
+    Queues broadcasts for a subscriber, delivered by its own thread to handlers
+    by data type, or taken from the queue with get() when not delivering.
+    """
+
+    def __init__(
+        self,
+        name,
+        handlers,
+        maxsize=1024,
+        policy=OverflowPolicy.DROP_OLDEST,
+        key=broadcast_key,
+        block_timeout=1.0,
+        select=None,
+        position_rate=None,
+        deliver=True,
+    ):
+        """
+        Create a Subscriber instance.
+
+        :param str name: name of subscriber, for logging and metrics
+        :param dict handlers: handlers mapped by the data type they handle, node
+            position batches are a list of node data, handlers are None when not
+            delivering
+        :param int maxsize: maximum queued broadcasts
+        :param OverflowPolicy policy: what to do when the queue is full
+        :param key: function providing the key to coalesce broadcasts by
+        :param float block_timeout: maximum seconds to wait for room when
+            blocking, the broadcast is dropped after this
+        :param select: function returning the broadcast to queue, possibly
+            reduced, or None to skip it
+        :param float position_rate: maximum node position batches taken per
+            second, None for no limit, batches held back keep coalescing
+            whatever the overflow policy
+        :param bool deliver: True to deliver broadcasts to handlers from a thread,
+            False to take them with get()
+        """
+        self.name = name
+        self.handlers = handlers
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.block_timeout = block_timeout
+        self.select = select
+        self.position_interval = 1.0 / position_rate if position_rate else 0.0
+        self.last_positions = None
+        self.deliver = deliver
+        self.queue = collections.OrderedDict()
+        self.condition = threading.Condition()
+        self.counter = itertools.count()
+        self.thread = None
+        self.running = True
+        # queue metrics
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.max_depth = 0
+
+    def accepts(self, data_type):
+        """
+        Check if this subscriber handles a data type.
+
+        :param type data_type: data type to check
+        :return: True if handled, False otherwise
+        :rtype: bool
+        """
+        return data_type in self.handlers
+
+    def put(self, data):
+        """
+        Queue a broadcast for delivery, applying the overflow policy when full.
+
+        :param data: broadcast data
+        :return: nothing
+        """
+        if self.select:
+            data = self.select(data)
+            if data is None:
+                return
+        with self.condition:
+            if not self.running:
+                return
+            key = None
+            if self.policy == OverflowPolicy.COALESCE:
+                key = self.key(data)
+            elif self.position_interval and isinstance(data, list):
+                # batches held back by the position rate always coalesce
+                key = list
+            if key is not None and key in self.queue:
+                previous = self.queue[key]
+                if isinstance(data, list) and isinstance(previous, list):
+                    # merge node position batches, keeping the latest by node
+                    nodes = {x.id: x for x in previous}
+                    nodes.update((x.id, x) for x in data)
+                    data = list(nodes.values())
+                self.queue[key] = data
+                self.coalesced += 1
+                return
+            if len(self.queue) >= self.maxsize:
+                if self.policy == OverflowPolicy.BLOCK:
+                    self.condition.wait_for(
+                        lambda: len(self.queue) < self.maxsize or not self.running,
+                        self.block_timeout,
+                    )
+                if len(self.queue) >= self.maxsize:
+                    if self.policy == OverflowPolicy.BLOCK:
+                        self.dropped += 1
+                        logging.warning("subscriber(%s) full, dropping", self.name)
+                        return
+                    self.queue.popitem(last=False)
+                    self.dropped += 1
+            if key is None:
+                key = next(self.counter)
+            self.queue[key] = data
+            self.max_depth = max(self.max_depth, len(self.queue))
+            if self.deliver and self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+
+    def _next(self, now):
+        """
+        Find the next queued broadcast that can be taken, holding back node
+        position batches until the position rate allows.
+
+        :param float now: current time
+        :return: key of the next broadcast, and the time a held back batch can
+            be taken, or None
+        :rtype: tuple
+        """
+        due = None
+        if self.last_positions is not None and self.position_interval:
+            due = self.last_positions + self.position_interval
+            if due <= now:
+                due = None
+        for key, data in self.queue.items():
+            if due is None or not isinstance(data, list):
+                return key, None
+        return None, due
+
+    def get(self, timeout=None):
+        """
+        Take the next queued broadcast.
+
+        :param float timeout: maximum seconds to wait, None to wait until stopped
+        :return: broadcast data, or None on timeout or when stopped
+        """
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        with self.condition:
+            while self.running:
+                key, due = self._next(now)
+                if key is not None:
+                    data = self.queue.pop(key)
+                    if isinstance(data, list):
+                        self.last_positions = now
+                    self.condition.notify_all()
+                    return data
+                wait = None
+                if due is not None:
+                    wait = due - now
+                if deadline is not None:
+                    if deadline <= now:
+                        return None
+                    wait = deadline - now if wait is None else min(wait, deadline - now)
+                self.condition.wait(wait)
+                now = time.monotonic()
+        return None
+
+    def run(self):
+        """
+        Deliver queued broadcasts to handlers until stopped.
+
+        :return: nothing
+        """
+        while True:
+            data = self.get()
+            if data is None:
+                return
+            handler = self.handlers.get(type(data))
+            try:
+                handler(data)
+            except Exception:
+                logging.exception("subscriber(%s) error handling: %s", self.name, data)
+            self.delivered += 1
+
+    def stop(self):
+        """
+        Stop delivering broadcasts, dropping any still queued.
+
+        :return: nothing
+        """
+        with self.condition:
+            self.running = False
+            self.queue.clear()
+            self.condition.notify_all()
+
+    def stats(self):
+        """
+        Provides queue metrics for this subscriber.
+
+        :return: queued broadcasts, maximum queued, delivered, dropped and
+            coalesced broadcasts
+        :rtype: dict
+        """
+        with self.condition:
+            return {
+                "depth": len(self.queue),
+                "max_depth": self.max_depth,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+            }
+
+
+class EventBus:
+    """
+    Delivers session broadcasts to subscribers, queueing them per subscriber, so
+    broadcasting never waits on handlers.
+    """
+
+    def __init__(self):
+        """
+        Create an EventBus instance.
+        """
+        self.subscribers = []
+        self.lock = threading.Lock()
+
+    def subscribe(self, name, handlers, **kwargs):
+        """
+        Subscribe handlers to broadcasts.
+
+        :param str name: name of subscriber, for logging and metrics
+        :param dict handlers: handlers mapped by the data type they handle, node
+            position batches are a list of node data
+        :param kwargs: queue options for the subscriber
+        :return: created subscriber, used to unsubscribe
+        :rtype: Subscriber
+        """
+        subscriber = Subscriber(name, handlers, **kwargs)
+        with self.lock:
+            self.subscribers = self.subscribers + [subscriber]
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """
+        Remove a subscriber and stop its delivery thread.
+
+        :param Subscriber subscriber: subscriber to remove
+        :return: nothing
+        """
+        with self.lock:
+            self.subscribers = [x for x in self.subscribers if x is not subscriber]
+        subscriber.stop()
+
+    def publish(self, data):
+        """
+        Queue a broadcast for all subscribers handling its data type.
+
+        :param data: broadcast data
+        :return: nothing
+        """
+        data_type = type(data)
+        for subscriber in self.subscribers:
+            if subscriber.accepts(data_type):
+                subscriber.put(data)
+
+    def publish_positions(self, nodes, node_data=None):
+        """
+        Queue a batch of node positions, as a batch for subscribers handling
+        batches, otherwise as node data for each node.
+
+        :param list[core.emulator.data.NodeData] nodes: node positions for moved
+            nodes
+        :param list[core.emulator.data.NodeData] node_data: full node data for
+            moved nodes, for subscribers not handling batches, defaults to the
+            node positions
+        :return: nothing
+        """
+        if node_data is None:
+            node_data = nodes
+        for subscriber in self.subscribers:
+            if subscriber.accepts(list):
+                subscriber.put(nodes)
+            elif subscriber.accepts(NodeData):
+                for data in node_data:
+                    subscriber.put(data)
+
+    def node_subscribed(self):
+        """
+        Check if any subscriber takes node data for moved nodes, rather than
+        batches of node positions.
+
+        :return: True if subscribed, False otherwise
+        :rtype: bool
+        """
+        return any(
+            not x.accepts(list) and x.accepts(NodeData) for x in self.subscribers
+        )
+
+    def stats(self):
+        """
+        Provides queue metrics for all subscribers.
+
+        :return: queue metrics by subscriber name
+        :rtype: dict
+        """
+        return {x.name: x.stats() for x in self.subscribers}
+
+    def shutdown(self):
+        """
+        Remove all subscribers and stop their delivery threads.
+
+        :return: nothing
+        """
+        with self.lock:
+            subscribers = self.subscribers
+            self.subscribers = []
+        for subscriber in subscribers:
+            subscriber.stop()
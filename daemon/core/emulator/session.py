@@ -3,6 +3,7 @@ session.py: defines the Session class used by the core-daemon daemon program
 that manages a CORE session.
 """
 
+import functools
 import logging
 import os
 import pwd
@@ -26,15 +27,19 @@ from core.emulator.emudata import (
     link_config,
 )
 from core.emulator.enumerations import EventTypes, ExceptionLevels, LinkTypes, NodeTypes
+from core.emulator.eventbus import EventBus
 from core.emulator.sessionconfig import SessionConfig
+from core.emulator.throughputs import ThroughputSampler
 from core.errors import CoreError
 from core.location.corelocation import CoreLocation
 from core.location.event import EventLoop
 from core.location.mobility import BasicRangeModel, MobilityManager
+from core.location.positions import PositionPipeline
 from core.nodes.base import CoreNetworkBase, CoreNode, CoreNodeBase
 from core.nodes.docker import DockerNode
 from core.nodes.ipaddress import MacAddress
 from core.nodes.lxd import LxcNode
+from core.nodes.netlink import LinkWaiter
 from core.nodes.network import (
     CtrlNet,
     GreTapBridge,
@@ -46,7 +51,7 @@ from core.nodes.network import (
 )
 from core.nodes.physical import PhysicalNode, Rj45Node
 from core.plugins.sdt import Sdt
-from core.services.coreservices import CoreServices
+from core.services.coreservices import CoreServices, ServiceBootScheduler
 from core.xml import corexml, corexmldeployment
 from core.xml.corexml import CoreXmlReader, CoreXmlWriter
 
@@ -100,6 +105,8 @@ class Session:
         self.node_id_gen = IdGen()
         self.nodes = {}
         self._nodes_lock = threading.Lock()
+        # changed when nodes or node interfaces are added or removed
+        self.netif_version = 0
 
         # TODO: should the default state be definition?
         self.state = EventTypes.NONE.value
@@ -113,7 +120,9 @@ class Session:
             state=EventTypes.RUNTIME_STATE.value, hook=self.runtime_state_hook
         )
 
-        # handlers for broadcasting information
+        # handlers for broadcasting information, called by the broadcasting
+        # thread, while bus subscribers are called from their own thread
+        self.bus = EventBus()
         self.event_handlers = []
         self.exception_handlers = []
         self.node_handlers = []
@@ -137,9 +146,12 @@ class Session:
         # initialize session feature helpers
         self.location = CoreLocation()
         self.mobility = MobilityManager(session=self)
+        self.positions = PositionPipeline(session=self)
         self.services = CoreServices(session=self)
         self.emane = EmaneManager(session=self)
         self.sdt = Sdt(session=self)
+        self.throughputs = ThroughputSampler(session=self)
+        self.link_waiter = LinkWaiter()
 
         # initialize default node services
         self.services.default_services = {
@@ -934,6 +946,13 @@ class Session:
         # shutdown sdt
         self.sdt.shutdown()
 
+        # stop delivering broadcasts to subscribers
+        self.bus.shutdown()
+        self.throughputs.shutdown()
+
+        # stop waiting on devices
+        self.link_waiter.close()
+
         # remove this sessions working directory
         preserve = self.options.get_config("preservedir") == "1"
         if not preserve:
@@ -950,7 +969,7 @@ class Session:
         :param core.data.EventData event_data: event data to send out
         :return: nothing
         """
-
+        self.bus.publish(event_data)
         for handler in self.event_handlers:
             handler(event_data)
 
@@ -961,7 +980,7 @@ class Session:
         :param core.emulator.data.ExceptionData exception_data: exception data to send out
         :return: nothing
         """
-
+        self.bus.publish(exception_data)
         for handler in self.exception_handlers:
             handler(exception_data)
 
@@ -972,7 +991,7 @@ class Session:
         :param core.emulator.data.ExceptionData node_data: node data to send out
         :return: nothing
         """
-
+        self.bus.publish(node_data)
         for handler in self.node_handlers:
             handler(node_data)
 
@@ -983,7 +1002,7 @@ class Session:
         :param core.data.FileData file_data: file data to send out
         :return: nothing
         """
-
+        self.bus.publish(file_data)
         for handler in self.file_handlers:
             handler(file_data)
 
@@ -994,7 +1013,7 @@ class Session:
         :param core.emulator.data.ConfigData config_data: config data to send out
         :return: nothing
         """
-
+        self.bus.publish(config_data)
         for handler in self.config_handlers:
             handler(config_data)
 
@@ -1005,7 +1024,7 @@ class Session:
         :param core.emulator.data.ExceptionData link_data: link data to send out
         :return: nothing
         """
-
+        self.bus.publish(link_data)
         for handler in self.link_handlers:
             handler(link_data)
 
@@ -1329,6 +1348,7 @@ class Session:
                 node.shutdown()
                 raise CoreError(f"duplicate node id {node.id} for {node.name}")
             self.nodes[node.id] = node
+            self.netif_version += 1
 
         return node
 
@@ -1359,6 +1379,7 @@ class Session:
         with self._nodes_lock:
             if _id in self.nodes:
                 node = self.nodes.pop(_id)
+                self.netif_version += 1
 
         if node:
             node.shutdown()
@@ -1375,6 +1396,7 @@ class Session:
             while self.nodes:
                 _, node = self.nodes.popitem()
                 funcs.append((node.shutdown, [], {}))
+            self.netif_version += 1
             utils.threadpool(funcs)
         self.node_id_gen.id = 0
 
@@ -1512,6 +1534,7 @@ class Session:
         """
         # stop event loop
         self.event_loop.stop()
+        self.positions.reset()
 
         # stop node services
         with self._nodes_lock:
@@ -1582,17 +1605,25 @@ class Session:
         :return: service boot exceptions
         :rtype: list[core.services.coreservices.ServiceBootError]
         """
+        workers = self.options.get_config_int("boot_workers", default=0)
+        scheduler = ServiceBootScheduler(self.services, workers)
         with self._nodes_lock:
-            funcs = []
             start = time.monotonic()
             for _id in self.nodes:
                 node = self.nodes[_id]
                 if isinstance(node, CoreNodeBase) and not isinstance(node, Rj45Node):
-                    args = (node,)
-                    funcs.append((self.boot_node, args, {}))
-            results, exceptions = utils.threadpool(funcs)
+                    setup = functools.partial(
+                        self.add_remove_control_interface, node=node, remove=False
+                    )
+                    scheduler.add(node, setup)
+            exceptions = scheduler.run()
             total = time.monotonic() - start
-            logging.debug("boot run time: %s", total)
+            logging.debug(
+                "boot run time: %s, workers: %s, tasks: %s",
+                total,
+                scheduler.workers,
+                len(scheduler.tasks),
+            )
         if not exceptions:
             self.update_control_interface_hosts()
         return exceptions
@@ -57,6 +57,25 @@ class SessionConfig(ConfigurableManager, ConfigurableOptions):
             default=Sdt.DEFAULT_SDT_URL,
             label="SDT3D URL",
         ),
+        Configuration(
+            _id="throughput_interval",
+            _type=ConfigDataTypes.FLOAT,
+            default="3",
+            label="Throughput Interval (s)",
+        ),
+        Configuration(
+            _id="boot_workers",
+            _type=ConfigDataTypes.UINT32,
+            default="0",
+            label="Boot Workers (0 for auto)",
+        ),
+        Configuration(
+            _id="service_scripts",
+            _type=ConfigDataTypes.BOOL,
+            default="0",
+            options=["On", "Off"],
+            label="Run service commands as one script",
+        ),
     ]
     config_type = RegisterTlvs.UTILITY.value
 
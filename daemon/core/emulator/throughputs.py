@@ -0,0 +1,207 @@
+"""
+throughputs.py: samples throughput of session interfaces and bridges, shared by
+all subscribers to session throughputs.
+"""
+
+import logging
+import threading
+import time
+from queue import Empty, Full, Queue
+
+from core.nodes import netlink
+from core.nodes.base import CoreNetworkBase
+
+# default seconds between samples
+DEFAULT_INTERVAL = 3.0
+
+
+class ThroughputSampler:
+    """
+    Samples throughput of session interfaces and bridges from a single thread,
+    running while there are subscribers, and queues each sample for all of them.
+
+    Host interface names are mapped to nodes and interfaces when session nodes
+    or interfaces change, rather than parsed from the name on every sample, and
+    byte counts are read from a netlink link dump over a socket kept open while
+    sampling.
+    """
+
+    def __init__(self, session):
+        """
+        Create a ThroughputSampler instance.
+
+        :param core.emulator.session.Session session: session to sample
+        """
+        self.session = session
+        self.subscribers = []
+        self.condition = threading.Condition()
+        self.thread = None
+        # host interface name to node id and interface id, or node id for bridges
+        self.interfaces = {}
+        self.bridges = {}
+        self.netif_version = None
+
+    def interval(self):
+        """
+        Seconds between samples, from the session throughput interval option.
+
+        :return: seconds between samples
+        :rtype: float
+        """
+        value = self.session.options.get_config("throughput_interval")
+        try:
+            return max(float(value), 0.1)
+        except (TypeError, ValueError):
+            return DEFAULT_INTERVAL
+
+    def subscribe(self, maxsize=10):
+        """
+        Subscribe to samples, starting sampling if not already running.
+
+        :param int maxsize: maximum samples queued, the oldest is dropped when full
+        :return: queue receiving samples, used to unsubscribe
+        :rtype: queue.Queue
+        """
+        queue = Queue(maxsize=maxsize)
+        with self.condition:
+            self.subscribers = self.subscribers + [queue]
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+        return queue
+
+    def unsubscribe(self, queue):
+        """
+        Unsubscribe from samples, stopping sampling when no subscribers are left.
+
+        :param queue.Queue queue: queue returned when subscribing
+        :return: nothing
+        """
+        with self.condition:
+            self.subscribers = [x for x in self.subscribers if x is not queue]
+            if not self.subscribers:
+                self.thread = None
+                self.condition.notify_all()
+
+    def shutdown(self):
+        """
+        Remove all subscribers and stop sampling.
+
+        :return: nothing
+        """
+        with self.condition:
+            self.subscribers = []
+            self.thread = None
+            self.condition.notify_all()
+
+    def update_names(self):
+        """
+        Map host interface names to session nodes and interfaces, when session
+        nodes or interfaces have changed since last mapped.
+
+        :return: nothing
+        """
+        netif_version = self.session.netif_version
+        if netif_version == self.netif_version:
+            return
+        self.netif_version = netif_version
+        interfaces = {}
+        bridges = {}
+        for node in list(self.session.nodes.values()):
+            if isinstance(node, CoreNetworkBase):
+                brname = getattr(node, "brname", None)
+                if brname:
+                    bridges[brname] = node.id
+                continue
+            for netif in node.netifs():
+                localname = getattr(netif, "localname", None)
+                if localname:
+                    interfaces[localname] = (node.id, netif.netindex)
+        self.interfaces = interfaces
+        self.bridges = bridges
+
+    def sample(self, requests, previous, interval):
+        """
+        Sample session interfaces and bridges.
+
+        :param core.nodes.netlink.NetlinkSocket requests: socket to request link
+            statistics on
+        :param dict previous: received and sent bytes from the previous sample
+        :param float interval: seconds since the previous sample
+        :return: received and sent bytes by host interface name, throughput by
+            node id and interface id, and throughput by bridge node id
+        :rtype: tuple
+        """
+        self.update_names()
+        names = self.interfaces.keys() | self.bridges.keys()
+        stats = netlink.link_stats(requests, names)
+        interfaces = {}
+        bridges = {}
+        for name, (rx, tx) in stats.items():
+            previous_rxtx = previous.get(name)
+            if not previous_rxtx or not interval:
+                continue
+            throughput = ((rx - previous_rxtx[0]) + (tx - previous_rxtx[1])) * 8.0
+            throughput /= interval
+            if name in self.interfaces:
+                interfaces[self.interfaces[name]] = throughput
+            else:
+                bridges[self.bridges[name]] = throughput
+        return stats, interfaces, bridges
+
+    def run(self):
+        """
+        Sample at the session throughput interval, queueing samples for all
+        subscribers, until there are no subscribers.
+
+        :return: nothing
+        """
+        thread = threading.current_thread()
+        previous = None
+        requests = None
+        try:
+            while True:
+                with self.condition:
+                    if self.thread is not thread:
+                        return
+                now = time.monotonic()
+                try:
+                    if requests is None:
+                        requests = netlink.NetlinkSocket()
+                    stats, interfaces, bridges = self.sample(
+                        requests,
+                        previous[1] if previous else {},
+                        now - previous[0] if previous else 0.0,
+                    )
+                except (OSError, ValueError):
+                    logging.exception("error sampling throughputs")
+                    stats, interfaces, bridges = {}, {}, {}
+                if previous is not None:
+                    for queue in self.subscribers:
+                        self.put(queue, (interfaces, bridges))
+                previous = now, stats
+                with self.condition:
+                    if self.thread is thread:
+                        self.condition.wait(self.interval())
+        finally:
+            if requests is not None:
+                requests.close()
+
+    @staticmethod
+    def put(queue, sample):
+        """
+        Queue a sample, dropping the oldest sample when full.
+
+        :param queue.Queue queue: subscriber queue
+        :param tuple sample: throughput by interface and by bridge
+        :return: nothing
+        """
+        while True:
+            try:
+                queue.put_nowait(sample)
+                return
+            except Full:
+                try:
+                    queue.get_nowait()
+                except Empty:
+                    pass
@@ -186,11 +186,10 @@ class CoreClient:
     def handle_node_event(self, event):
         if event.source == GUI_SOURCE:
             return
-        node_id = event.node.id
-        x = event.node.position.x
-        y = event.node.position.y
-        canvas_node = self.canvas_nodes[node_id]
-        canvas_node.move(x, y)
+        nodes = event.nodes or [event.node]
+        for node in nodes:
+            canvas_node = self.canvas_nodes[node.id]
+            canvas_node.move(node.position.x, node.position.y)
 
     def enable_throughputs(self):
         self.handling_throughputs = self.client.throughputs(
@@ -230,7 +229,7 @@ class CoreClient:
             session = response.session
             self.state = session.state
             self.handling_events = self.client.events(
-                self.session_id, self.handle_events
+                self.session_id, self.handle_events, batch_positions=True
             )
 
             # get location
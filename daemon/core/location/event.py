@@ -1,74 +1,14 @@
 """
-event.py: event loop implementation using a heap queue and threads.
+event.py: event loop implementation using a heap queue and a dispatcher thread.
 """
 
 import heapq
+import logging
 import threading
 import time
 from functools import total_ordering
 
 
-class Timer(threading.Thread):
-    """
-    Based on threading.Timer but cancel() returns if the timer was
-    already running.
-    """
-
-    def __init__(self, interval, function, args=None, kwargs=None):
-        """
-        Create a Timer instance.
-
-        :param interval: time interval
-        :param function: function to call when timer finishes
-        :param args: function arguments
-        :param kwargs: function keyword arguments
-        """
-        super().__init__()
-        self.interval = interval
-        self.function = function
-
-        self.finished = threading.Event()
-        self._running = threading.Lock()
-
-        # validate arguments were provided
-        if args:
-            self.args = args
-        else:
-            self.args = []
-
-        # validate keyword arguments were provided
-        if kwargs:
-            self.kwargs = kwargs
-        else:
-            self.kwargs = {}
-
-    def cancel(self):
-        """
-        Stop the timer if it hasn't finished yet.  Return False if
-        the timer was already running.
-
-        :return: True if canceled, False otherwise
-        :rtype: bool
-        """
-        locked = self._running.acquire(False)
-        if locked:
-            self.finished.set()
-            self._running.release()
-        return locked
-
-    def run(self):
-        """
-        Run the timer.
-
-        :return: nothing
-        """
-        self.finished.wait(self.interval)
-        with self._running:
-            if not self.finished.is_set():
-                self.function(*self.args, **self.kwargs)
-            self.finished.set()
-
-
 @total_ordering
 class Event:
     """
@@ -93,10 +33,7 @@ class Event:
         self.canceled = False
 
     def __lt__(self, other):
-        result = self.time < other.time
-        if result:
-            result = self.eventnum < other.eventnum
-        return result
+        return (self.time, self.eventnum) < (other.time, other.eventnum)
 
     def run(self):
         """
@@ -120,62 +57,86 @@ class Event:
 
 class EventLoop:
     """
-    Provides an event loop for running events.
+    Provides an event loop for running events, using a single dispatcher thread
+    that waits for the earliest event, rather than a timer thread per event.
     """
 
-    def __init__(self):
+    def __init__(self, overrun=0.1):
         """
         Creates a EventLoop instance.
+
+        :param float overrun: seconds an event may run late before it is
+            counted as an overrun
         """
         self.lock = threading.RLock()
+        self.condition = threading.Condition(self.lock)
         self.queue = []
         self.eventnum = 0
-        self.timer = None
+        self.thread = None
         self.running = False
         self.start = None
+        # how far behind the loop is running events
+        self.overrun = overrun
+        self.events = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.overruns = 0
 
     def __run_events(self):
         """
-        Run events.
+        Run events as they become due, until the event loop is stopped.
 
         :return: nothing
         """
-        schedule = False
+        thread = threading.current_thread()
         while True:
             with self.lock:
-                if not self.running or not self.queue:
-                    break
-                now = time.monotonic()
-                if self.queue[0].time > now:
-                    schedule = True
-                    break
+                while True:
+                    if self.thread is not thread:
+                        return
+                    now = time.monotonic()
+                    if self.queue and self.queue[0].time <= now:
+                        break
+                    timeout = self.queue[0].time - now if self.queue else None
+                    self.condition.wait(timeout)
                 event = heapq.heappop(self.queue)
-            if event.time > now:
-                raise ValueError("invalid event time: %s > %s", event.time, now)
-            event.run()
-
-        with self.lock:
-            self.timer = None
-            if schedule:
-                self.__schedule_event()
+                self.__record_lag(now - event.time)
+            try:
+                event.run()
+            except Exception:
+                logging.exception("error running event: %s", event.func)
 
-    def __schedule_event(self):
+    def __record_lag(self, lag):
         """
-        Schedule event.
+        Record how late an event is run.
 
+        :param float lag: seconds the event is run after its time
         :return: nothing
         """
+        self.events += 1
+        self.lag = lag
+        if lag > self.max_lag:
+            self.max_lag = lag
+        if lag > self.overrun:
+            self.overruns += 1
+            logging.debug("event loop running %.3fs behind", lag)
+
+    def stats(self):
+        """
+        Provides statistics for how far behind the event loop is running.
+
+        :return: events run, the lag of the last event, the maximum lag, events
+            run later than the overrun time, and queued events
+        :rtype: dict
+        """
         with self.lock:
-            if not self.running:
-                raise ValueError("scheduling event while not running")
-            if not self.queue:
-                return
-            delay = self.queue[0].time - time.monotonic()
-            if self.timer:
-                raise ValueError("timer was already set")
-            self.timer = Timer(delay, self.__run_events)
-            self.timer.daemon = True
-            self.timer.start()
+            return {
+                "events": self.events,
+                "lag": self.lag,
+                "max_lag": self.max_lag,
+                "overruns": self.overruns,
+                "queued": len(self.queue),
+            }
 
     def run(self):
         """
@@ -190,7 +151,12 @@ class EventLoop:
             self.start = time.monotonic()
             for event in self.queue:
                 event.time += self.start
-            self.__schedule_event()
+            self.events = 0
+            self.lag = 0.0
+            self.max_lag = 0.0
+            self.overruns = 0
+            self.thread = threading.Thread(target=self.__run_events, daemon=True)
+            self.thread.start()
 
     def stop(self):
         """
@@ -201,11 +167,12 @@ class EventLoop:
         with self.lock:
             if not self.running:
                 return
+            logging.debug("event loop stopping: %s", self.stats())
             self.queue = []
             self.eventnum = 0
-            if self.timer is not None:
-                self.timer.cancel()
-                self.timer = None
+            # the dispatcher exits once it wakes, after any running event
+            self.thread = None
+            self.condition.notify()
             self.running = False
             self.start = None
 
@@ -227,17 +194,8 @@ class EventLoop:
             if self.running:
                 evtime += time.monotonic()
             event = Event(eventnum, evtime, func, *args, **kwds)
-
-            if self.queue:
-                prevhead = self.queue[0]
-            else:
-                prevhead = None
-
             heapq.heappush(self.queue, event)
-            head = self.queue[0]
-            if prevhead is not None and prevhead != head:
-                if self.timer is not None and self.timer.cancel():
-                    self.timer = None
-            if self.running and self.timer is None:
-                self.__schedule_event()
+            # wake the dispatcher when its next deadline changed
+            if self.running and self.queue[0] is event:
+                self.condition.notify()
         return event
@@ -3,9 +3,13 @@ mobility.py: mobility helpers for moving nodes and calculating wireless range.
 """
 
 import heapq
+import itertools
 import logging
 import math
+import mmap
 import os
+import random
+import tempfile
 import threading
 import time
 from functools import total_ordering
@@ -21,6 +25,18 @@ from core.emulator.enumerations import (
     RegisterTlvs,
 )
 from core.errors import CoreError
+from core.location.timeline import (
+    LinkTimeline,
+    RangeCrossings,
+    create_segment,
+    segment_position,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+    logging.debug("numpy not installed, vectorized range calculation disabled")
 
 
 class MobilityManager(ModelManager):
@@ -42,6 +58,9 @@ class MobilityManager(ModelManager):
         self.session = session
         self.models[BasicRangeModel.name] = BasicRangeModel
         self.models[Ns2ScriptedMobility.name] = Ns2ScriptedMobility
+        self.models[RandomWaypointMobility.name] = RandomWaypointMobility
+        self.models[RandomWalkMobility.name] = RandomWalkMobility
+        self.models[GaussMarkovMobility.name] = GaussMarkovMobility
 
     def reset(self):
         """
@@ -307,6 +326,20 @@ class BasicRangeModel(WirelessModel):
         self.wlan = session.get_node(_id)
         self._netifs = {}
         self._netifslock = threading.Lock()
+        # uniform grid of interfaces, using cells the size of the range, so only
+        # interfaces in adjacent cells can be in range
+        self._grid = {}
+        self._cells = {}
+        # interfaces linked to each interface, as calculated by this model
+        self._links = {}
+        # interface positions as an array, for calculating batches of moved
+        # interfaces using numpy, rebuilt when interfaces are added
+        self.vectorized = session.options.get_config("numpy") == "True"
+        if self.vectorized and numpy is None:
+            logging.warning("numpy not found, using scalar range calculation")
+            self.vectorized = False
+        self._positions = None
+        self._index = {}
 
         self.range = 0
         self.bw = None
@@ -327,6 +360,11 @@ class BasicRangeModel(WirelessModel):
             self.wlan.id,
             self.range,
         )
+        with self._netifslock:
+            self._grid.clear()
+            self._cells.clear()
+            for netif in self._netifs:
+                self._grid_update(netif)
         self.bw = int(config["bandwidth"])
         if self.bw == 0:
             self.bw = None
@@ -380,10 +418,12 @@ class BasicRangeModel(WirelessModel):
         """
         self._netifslock.acquire()
         self._netifs[netif] = (x, y, z)
+        self._grid_update(netif)
+        self._array_update(netif)
         if x is None or y is None:
             self._netifslock.release()
             return
-        for netif2 in self._netifs:
+        for netif2 in self._candidates(netif):
             self.calclink(netif, netif2)
         self._netifslock.release()
 
@@ -401,16 +441,178 @@ class BasicRangeModel(WirelessModel):
         :return: nothing
         """
         with self._netifslock:
+            if self.vectorized and self.wlan.policy == "DROP":
+                self._update_vectorized(moved_netifs)
+                return
+            pending = set(moved_netifs)
             while len(moved_netifs):
                 netif = moved_netifs.pop()
+                pending.discard(netif)
                 nx, ny, nz = netif.node.getposition()
                 if netif in self._netifs:
                     self._netifs[netif] = (nx, ny, nz)
-                for netif2 in self._netifs:
-                    if netif2 in moved_netifs:
+                    self._grid_update(netif)
+                for netif2 in self._candidates(netif):
+                    if netif2 in pending:
                         continue
                     self.calclink(netif, netif2)
 
+    def _array_update(self, netif):
+        """
+        Update the position array for an interface, expects the lock to be held.
+
+        :param netif: interface to update
+        :return: nothing
+        """
+        if self._positions is None:
+            return
+        index = self._index.get(netif)
+        if index is None:
+            # new interface, rebuild the array when next needed
+            self._positions = None
+        else:
+            self._positions[index] = [
+                numpy.nan if value is None else value for value in self._netifs[netif]
+            ]
+
+    def _update_vectorized(self, moved_netifs):
+        """
+        Re-calculate links for a batch of moved interfaces using numpy, by
+        calculating the distance from every moved interface to all interfaces at
+        once, and comparing the resulting link bitmap against the current links.
+        Expects the lock to be held and a DROP policy, so only pairs linked by
+        this model are currently linked.
+
+        :param list moved_netifs: moved network interfaces
+        :return: nothing
+        """
+        moved = []
+        while len(moved_netifs):
+            netif = moved_netifs.pop()
+            if netif not in self._netifs:
+                logging.error("error getting interface during update: %s", netif)
+                continue
+            self._netifs[netif] = netif.node.getposition()
+            self._grid_update(netif)
+            moved.append(netif)
+        if not moved:
+            return
+        positions = [
+            [numpy.nan if value is None else value for value in self._netifs[netif]]
+            for netif in moved
+        ]
+        if self._positions is None or any(netif not in self._index for netif in moved):
+            netifs = list(self._netifs)
+            self._index = {netif: index for index, netif in enumerate(netifs)}
+            self._positions = numpy.array(
+                [
+                    [numpy.nan if value is None else value for value in position]
+                    for position in self._netifs.values()
+                ],
+                dtype=float,
+            ).reshape(len(netifs), 3)
+        netifs = list(self._index)
+        rows = numpy.array([self._index[netif] for netif in moved])
+        self._positions[rows] = positions
+
+        # squared distance from each moved interface to all interfaces, a missing
+        # z is ignored, while a missing x or y never changes a link
+        x, y, z = self._positions.T
+        dx = x[rows, None] - x
+        dy = y[rows, None] - y
+        dz = z[rows, None] - z
+        dz[numpy.isnan(dz)] = 0.0
+        squared = dx * dx + dy * dy + dz * dz
+        valid = ~numpy.isnan(squared)
+        valid[numpy.arange(len(moved)), rows] = False
+        limit = float(self.range) ** 2
+        in_range = valid & (squared <= limit)
+
+        # distances this close to the range may round differently, so these are
+        # compared using the same calculation as calclink()
+        border = valid & (numpy.abs(squared - limit) <= limit * 1e-9)
+        for row, index in zip(*(axis.tolist() for axis in numpy.nonzero(border))):
+            p1 = self._netifs[moved[row]]
+            p2 = self._netifs[netifs[index]]
+            in_range[row, index] = self.calcdistance(p1, p2) <= self.range
+
+        # current links for the moved interfaces
+        current = numpy.zeros(in_range.shape, dtype=bool)
+        linked_rows = []
+        linked_indexes = []
+        for row, netif in enumerate(moved):
+            for netif2 in self._links.get(netif, ()):
+                index = self._index.get(netif2)
+                if index is not None:
+                    linked_rows.append(row)
+                    linked_indexes.append(index)
+        current[linked_rows, linked_indexes] = True
+
+        # moved pairs appear twice, so collect ordered pairs before applying
+        links = set()
+        changed = numpy.nonzero(in_range & ~current)
+        for row, index in zip(*(axis.tolist() for axis in changed)):
+            netif, netif2 = moved[row], netifs[index]
+            links.add((min(netif, netif2), max(netif, netif2)))
+        unlinks = set()
+        changed = numpy.nonzero(valid & ~in_range & current)
+        for row, index in zip(*(axis.tolist() for axis in changed)):
+            netif, netif2 = moved[row], netifs[index]
+            unlinks.add((min(netif, netif2), max(netif, netif2)))
+        for a, b in unlinks:
+            with self.wlan._linked_lock:
+                linked = self.wlan.linked(a, b)
+            self._unlink(a, b, linked)
+        for a, b in links:
+            with self.wlan._linked_lock:
+                linked = self.wlan.linked(a, b)
+            self._link(a, b, linked)
+
+    def _grid_update(self, netif):
+        """
+        Move an interface to the grid cell for its current position, expects the
+        lock to be held.
+
+        :param netif: interface to update
+        :return: nothing
+        """
+        cell = None
+        x, y, _ = self._netifs[netif]
+        if self.range > 0 and x is not None and y is not None:
+            cell = (int(x // self.range), int(y // self.range))
+        current = self._cells.get(netif)
+        if cell == current:
+            return
+        if current is not None:
+            netifs = self._grid[current]
+            netifs.discard(netif)
+            if not netifs:
+                del self._grid[current]
+            del self._cells[netif]
+        if cell is not None:
+            self._grid.setdefault(cell, set()).add(netif)
+            self._cells[netif] = cell
+
+    def _candidates(self, netif):
+        """
+        Retrieve the interfaces that may need a link change with an interface:
+        those in its own or adjacent grid cells, and those currently linked with
+        it, which may have moved out of range. Expects the lock to be held.
+
+        :param netif: interface to get candidates for
+        :return: candidate interfaces
+        """
+        cell = self._cells.get(netif)
+        if cell is None or self.wlan.policy != "DROP":
+            # pairs not calculated yet would default to linked
+            return list(self._netifs)
+        candidates = set(self._links.get(netif, ()))
+        cx, cy = cell
+        for x in range(cx - 1, cx + 2):
+            for y in range(cy - 1, cy + 2):
+                candidates.update(self._grid.get((x, y), ()))
+        return candidates
+
     def calclink(self, netif, netif2):
         """
         Helper used by set_position() and update() to
@@ -442,18 +644,64 @@ class BasicRangeModel(WirelessModel):
                 linked = self.wlan.linked(a, b)
 
             if d > self.range:
-                if linked:
-                    logging.debug("was linked, unlinking")
-                    self.wlan.unlink(a, b)
-                    self.sendlinkmsg(a, b, unlink=True)
+                self._unlink(a, b, linked)
             else:
-                if not linked:
-                    logging.debug("was not linked, linking")
-                    self.wlan.link(a, b)
-                    self.sendlinkmsg(a, b)
+                self._link(a, b, linked)
         except KeyError:
             logging.exception("error getting interfaces during calclinkS")
 
+    def _link(self, a, b, linked):
+        """
+        Link an ordered pair of interfaces found to be in range.
+
+        :param a: lower interface
+        :param b: higher interface
+        :param bool linked: True if the interfaces are currently linked
+        :return: nothing
+        """
+        self._links.setdefault(a, set()).add(b)
+        self._links.setdefault(b, set()).add(a)
+        if not linked:
+            logging.debug("was not linked, linking")
+            self.wlan.link(a, b)
+            self.sendlinkmsg(a, b)
+
+    def _unlink(self, a, b, linked):
+        """
+        Unlink an ordered pair of interfaces found to be out of range.
+
+        :param a: lower interface
+        :param b: higher interface
+        :param bool linked: True if the interfaces are currently linked
+        :return: nothing
+        """
+        self._links.get(a, set()).discard(b)
+        self._links.get(b, set()).discard(a)
+        if linked:
+            logging.debug("was linked, unlinking")
+            self.wlan.unlink(a, b)
+            self.sendlinkmsg(a, b, unlink=True)
+
+    def setlinked(self, netif, netif2, linked):
+        """
+        Link or unlink two interfaces without calculating their distance, used
+        when replaying precomputed link changes.
+
+        :param netif: interface one
+        :param netif2: interface two
+        :param bool linked: True to link, False to unlink
+        :return: nothing
+        """
+        a = min(netif, netif2)
+        b = max(netif, netif2)
+        with self._netifslock:
+            with self.wlan._linked_lock:
+                current = self.wlan.linked(a, b)
+            if linked:
+                self._link(a, b, current)
+            else:
+                self._unlink(a, b, current)
+
     @staticmethod
     def calcdistance(p1, p2):
         """
@@ -555,16 +803,175 @@ class WayPoint:
         self.speed = speed
 
     def __eq__(self, other):
-        return (self.time, self.nodenum) == (other.time, other.nodedum)
+        return (self.time, self.nodenum) == (other.time, other.nodenum)
 
     def __ne__(self, other):
         return not self == other
 
     def __lt__(self, other):
-        result = self.time < other.time
-        if result:
-            result = self.nodenum < other.nodenum
-        return result
+        return (self.time, self.nodenum) < (other.time, other.nodenum)
+
+
+class WayPointEngine:
+    """
+    Moves nodes towards their current waypoints, keeping the position, target
+    and speed of all nodes in numpy arrays, so every node is stepped at once,
+    rather than calculating each node separately.
+    """
+
+    def __init__(self):
+        """
+        Create a WayPointEngine instance.
+        """
+        self.ids = []
+        self.index = {}
+        self.positions = numpy.zeros((0, 3))
+        self.targets = numpy.zeros((0, 3))
+        # linear speeds, with velocity vectors when velocity is set
+        self.speeds = numpy.zeros(0)
+        self.velocities = numpy.zeros((0, 2))
+        self.velocity = numpy.zeros(0, dtype=bool)
+        # nodes with a current waypoint, and positions to reload from nodes
+        self.active = numpy.zeros(0, dtype=bool)
+        self.stale = numpy.zeros(0, dtype=bool)
+        # rows for the nodes last stepped
+        self._nodes = None
+        self._present = numpy.zeros(0, dtype=bool)
+
+    def _row(self, node_id):
+        """
+        Retrieve the array row for a node, adding one for new nodes.
+
+        :param int node_id: node id to get row for
+        :return: row index
+        :rtype: int
+        """
+        row = self.index.get(node_id)
+        if row is None:
+            row = len(self.ids)
+            self.ids.append(node_id)
+            self.index[node_id] = row
+            self.positions = numpy.vstack((self.positions, numpy.zeros(3)))
+            self.targets = numpy.vstack((self.targets, numpy.zeros(3)))
+            self.speeds = numpy.append(self.speeds, 0.0)
+            self.velocities = numpy.vstack((self.velocities, numpy.zeros(2)))
+            self.velocity = numpy.append(self.velocity, False)
+            self.active = numpy.append(self.active, False)
+            self.stale = numpy.append(self.stale, True)
+        return row
+
+    def set_waypoint(self, node_id, coords, speed):
+        """
+        Set the current waypoint for a node, the node position is loaded from the
+        node on its next step.
+
+        :param int node_id: node id to set waypoint for
+        :param tuple coords: waypoint coordinates
+        :param speed: linear speed or velocity vector
+        :return: nothing
+        """
+        row = self._row(node_id)
+        x, y, z = coords
+        self.targets[row] = (x, y, numpy.nan if z is None else z)
+        if isinstance(speed, (float, int)):
+            self.speeds[row] = speed
+            self.velocity[row] = False
+        else:
+            self.velocities[row] = speed[:2]
+            self.velocity[row] = True
+        self.active[row] = True
+        self.stale[row] = True
+
+    def clear_waypoint(self, node_id):
+        """
+        Remove the current waypoint for a node.
+
+        :param int node_id: node id to remove waypoint for
+        :return: nothing
+        """
+        row = self.index.get(node_id)
+        if row is not None:
+            self.active[row] = False
+
+    def invalidate(self, node_id=None):
+        """
+        Reload node positions on their next step, used when nodes have been
+        moved elsewhere.
+
+        :param int node_id: node id to reload position for, None for all nodes
+        :return: nothing
+        """
+        if node_id is None:
+            self.stale[:] = True
+            return
+        row = self.index.get(node_id)
+        if row is not None:
+            self.stale[row] = True
+
+    def step(self, nodes, dt):
+        """
+        Move all given nodes with a current waypoint towards it.
+
+        :param dict nodes: nodes to move, mapped by node id, expected to be the
+            same dict until these nodes change
+        :param float dt: elapsed time to move nodes for
+        :return: moved node ids with their new position, node ids that moved
+            directly to their waypoint, and node ids that had already reached
+            their waypoint and did not move
+        :rtype: tuple
+        """
+        if nodes is not self._nodes or len(self._present) != len(self.ids):
+            self._nodes = nodes
+            self._present = numpy.fromiter(
+                (node_id in nodes for node_id in self.ids), bool, len(self.ids)
+            )
+        rows = numpy.flatnonzero(self.active & self._present)
+        if not len(rows):
+            return [], [], []
+        for row in rows[self.stale[rows]].tolist():
+            x, y, z = nodes[self.ids[row]].getposition()
+            self.positions[row] = (x or 0.0, y or 0.0, numpy.nan if z is None else z)
+            self.stale[row] = False
+
+        x1, y1 = self.positions[rows, 0], self.positions[rows, 1]
+        ex = self.targets[rows, 0] - x1
+        ey = self.targets[rows, 1] - y1
+        alpha = numpy.arctan2(ey, ex)
+        speeds = self.speeds[rows]
+        velocity = self.velocity[rows]
+        sx = numpy.where(velocity, self.velocities[rows, 0], speeds * numpy.cos(alpha))
+        sy = numpy.where(velocity, self.velocities[rows, 1], speeds * numpy.sin(alpha))
+
+        # calculate dt * speed = distance moved, preventing overshoot
+        dx = sx * dt
+        dy = sy * dt
+        dx = numpy.where(numpy.abs(dx) > numpy.abs(ex), ex, dx)
+        dy = numpy.where(numpy.abs(dy) > numpy.abs(ey), ey, dy)
+        instant = ~velocity & (speeds == 0)
+        reached = ~instant & (dx == 0.0) & (dy == 0.0)
+        dx = numpy.where(x1 + dx < 0.0, 0.0 - x1, dx)
+        dy = numpy.where(y1 + dy < 0.0, 0.0 - y1, dy)
+
+        # instantaneous moves go directly to the waypoint
+        arrived = rows[instant]
+        self.positions[arrived] = self.targets[arrived]
+        moving = rows[~instant & ~reached]
+        step = ~instant & ~reached
+        self.positions[moving, 0] += dx[step]
+        self.positions[moving, 1] += dy[step]
+        stopped = rows[reached]
+        self.active[arrived] = False
+        self.active[stopped] = False
+
+        moved = []
+        moved_rows = rows[~reached]
+        for row, (x, y, z) in zip(
+            moved_rows.tolist(), self.positions[moved_rows].tolist()
+        ):
+            moved.append((self.ids[row], (x, y, None if z != z else z)))
+        arrived = [self.ids[row] for row in arrived.tolist()]
+        stopped = [self.ids[row] for row in stopped.tolist()]
+        return moved, arrived, stopped
 
 
 class WayPointMobility(WirelessModel):
@@ -602,6 +1009,20 @@ class WayPointMobility(WirelessModel):
         # flag whether to stop scheduling when queue is empty
         #  (ns-3 sets this to False as new waypoints may be added from trace)
         self.empty_queue_stop = True
+        # waypoints read as needed by readahead(), when self.queue only holds
+        # those up to the current time
+        self._waypoints = iter(())
+        self._readtime = 0
+        # step all nodes at once using numpy, when enabled
+        self.engine = None
+        self._wlan_netifs = None
+        self._node_netifs = {}
+        self._nodes = {}
+        if session.options.get_config("numpy") == "True":
+            if numpy is None:
+                logging.warning("numpy not found, moving mobility nodes per node")
+            else:
+                self.engine = WayPointEngine()
 
     def runround(self):
         """
@@ -643,13 +1064,7 @@ class WayPointMobility(WirelessModel):
                 return self.run()
 
         # only move netifs attached to self.wlan, or all nodenum in script?
-        moved = []
-        moved_netifs = []
-        for netif in self.wlan.netifs():
-            node = netif.node
-            if self.movenode(node, dt):
-                moved.append(node)
-                moved_netifs.append(netif)
+        moved, moved_netifs = self.movenodes(dt)
 
         # calculate all ranges after moving nodes; this saves calculations
         self.session.mobility.updatewlans(moved, moved_netifs)
@@ -670,6 +1085,49 @@ class WayPointMobility(WirelessModel):
         self.runround()
         self.session.mobility.sendevent(self)
 
+    def movenodes(self, dt):
+        """
+        Move all nodes attached to the wlan with a current waypoint, stepping
+        all of them at once when using the waypoint engine.
+
+        :param dt: move factor
+        :return: moved nodes and their moved network interfaces
+        :rtype: tuple
+        """
+        if not self.engine:
+            moved = []
+            moved_netifs = []
+            for netif in self.wlan.netifs():
+                node = netif.node
+                if self.movenode(node, dt):
+                    moved.append(node)
+                    moved_netifs.append(netif)
+            return moved, moved_netifs
+        wlan_netifs = self.wlan.netifs()
+        if wlan_netifs != self._wlan_netifs:
+            self._wlan_netifs = wlan_netifs
+            self._node_netifs = {netif.node.id: netif for netif in wlan_netifs}
+            self._nodes = {netif.node.id: netif.node for netif in wlan_netifs}
+        netifs = self._node_netifs
+        nodes = self._nodes
+        moved, arrived, stopped = self.engine.step(nodes, dt)
+        for node_id in arrived:
+            self.points.pop(node_id, None)
+        if stopped:
+            # the last node to reach the last waypoint determines this
+            # script's endtime
+            self.endtime = max(self.endtime, self.lasttime - self.timezero)
+            for node_id in stopped:
+                self.points.pop(node_id, None)
+        moved_nodes = []
+        moved_netifs = []
+        for node_id, (x, y, z) in moved:
+            node = nodes[node_id]
+            self.setnodeposition(node, x, y, z)
+            moved_nodes.append(node)
+            moved_netifs.append(netifs[node_id])
+        return moved_nodes, moved_netifs
+
     def movenode(self, node, dt):
         """
         Calculate next node location and update its coordinates.
@@ -739,8 +1197,21 @@ class WayPointMobility(WirelessModel):
             self.setnodeposition(node, x, y, z)
             moved.append(node)
             moved_netifs.append(netif)
+        if self.engine:
+            self.engine.invalidate()
         self.session.mobility.updatewlans(moved, moved_netifs)
 
+    def node_moved(self, node):
+        """
+        A node has been moved other than by this model, its position is reloaded
+        when the waypoint engine next steps it.
+
+        :param core.nodes.base.CoreNodeBase node: moved node
+        :return: nothing
+        """
+        if self.engine:
+            self.engine.invalidate(node.id)
+
     def addwaypoint(self, time, nodenum, x, y, z, speed):
         """
         Waypoints are pushed to a heapq, sorted by time.
@@ -769,18 +1240,38 @@ class WayPointMobility(WirelessModel):
         wp = WayPoint(0, nodenum, coords=(x, y, z), speed=0)
         self.initial[nodenum] = wp
 
+    def readahead(self, now):
+        """
+        Read waypoints that are read as needed into self.queue, up to the current
+        time and the first waypoint after it.
+
+        :param now: current timestamp
+        :return: nothing
+        """
+        if self.queue and self._readtime > now:
+            return
+        for wp in self._waypoints:
+            heapq.heappush(self.queue, wp)
+            self._readtime = wp.time
+            if wp.time > now:
+                break
+
     def updatepoints(self, now):
         """
-        Move items from self.queue to self.points when their time has come.
+        Move items from self.queue to self.points when their time has come,
+        keeping the waypoint engine up-to-date.
 
         :param int now: current timestamp
         :return: nothing
         """
+        self.readahead(now)
         while len(self.queue):
             if self.queue[0].time > now:
                 break
             wp = heapq.heappop(self.queue)
             self.points[wp.nodenum] = wp
+            if self.engine:
+                self.engine.set_waypoint(wp.nodenum, wp.coords, wp.speed)
 
     def copywaypoints(self):
         """
@@ -801,9 +1292,9 @@ class WayPointMobility(WirelessModel):
 
     def setnodeposition(self, node, x, y, z):
         """
-        Helper to move a node, notify any GUI (connected session handlers),
-        without invoking the interface poshook callback that may perform
-        range calculation.
+        Helper to move a node, notify any GUI (connected session handlers) with the
+        next batch of node positions, without invoking the interface poshook
+        callback that may perform range calculation.
 
         :param core.netns.vnode.CoreNode node: node to set position for
         :param x: x position
@@ -812,8 +1303,7 @@ class WayPointMobility(WirelessModel):
         :return: nothing
         """
         node.position.set(x, y, z)
-        node_data = node.data(message_type=0)
-        self.session.broadcast_node(node_data)
+        self.session.positions.update(node)
 
     def setendtime(self):
         """
@@ -874,6 +1364,291 @@ class WayPointMobility(WirelessModel):
         self.lasttime = time.monotonic()
 
 
+class Ns2Script:
+    """
+    Reads waypoints from an ns-2 mobility script lazily, in time order, from a
+    memory mapped file, rather than loading the whole script.
+
+    The script is indexed once into runs of lines already in time order, scripts
+    from setdest are usually a single run, while BonnMotion writes a run per
+    node. Waypoints are read by merging the runs, so memory is bounded by the
+    number of runs instead of the script size, and reading again from the start
+    is only a seek. Scripts with more than MAX_RUNS runs are sorted into a
+    temporary file once, merging sorted chunks at most MAX_RUNS at a time.
+    """
+
+    # maximum runs merged when reading waypoints
+    MAX_RUNS = 64
+    # maximum waypoint lines sorted in memory at once
+    SORT_LINES = 10000
+
+    def __init__(self, filename, nodemap):
+        """
+        Create a Ns2Script instance, indexing the script file.
+
+        :param str filename: script file to read
+        :param dict nodemap: mapping of script node numbers to node ids
+        :raises IOError: when the script file can not be read
+        """
+        self.filename = filename
+        self.nodemap = nodemap
+        self.initial = {}
+        self.runs = []
+        self.count = 0
+        self.endtime = 0
+        self._mmap = None
+        self._stat = None
+        # waypoint lines sorted by time, when the script has too many runs
+        self._sorted = None
+        self._sorted_mmap = None
+        self.index()
+
+    def map(self, nodenum):
+        """
+        Map one node number (from a script file) to another.
+
+        :param bytes nodenum: node number to map
+        :return: mapped value or the node number itself
+        :rtype: int
+        """
+        nodenum = int(nodenum)
+        return self.nodemap.get(nodenum, nodenum)
+
+    def parse(self, line):
+        """
+        Parse a waypoint line.
+
+        :param bytes line: line to parse, e.g.
+            $ns_ at 1.00 "$node_(6) setdest 500.0 178.0 25.0"
+        :return: waypoint
+        :rtype: WayPoint
+        :raises ValueError: when the line is not a valid waypoint
+        """
+        parts = line.split()
+        time = float(parts[2])
+        nodenum = parts[3][1 + parts[3].index(b"(") : parts[3].index(b")")]
+        x = float(parts[5])
+        y = float(parts[6])
+        speed = float(parts[7].strip(b'"'))
+        return WayPoint(time, self.map(nodenum), coords=(x, y, None), speed=speed)
+
+    def index(self):
+        """
+        Map the script file and scan it once, recording initial positions, the
+        end time, and the offsets of runs of waypoints in time order.
+
+        :return: nothing
+        :raises IOError: when the script file can not be read
+        """
+        self.close()
+        with open(self.filename, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self._stat = (stat.st_mtime_ns, stat.st_size)
+            if stat.st_size:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.initial = {}
+        self.runs = []
+        self.count = 0
+        self.endtime = 0
+        if self._mmap is None:
+            return
+        ln = 0
+        ix = iy = iz = None
+        inodenum = None
+        start = 0
+        last = None
+        offset = 0
+        for line in iter(self._mmap.readline, b""):
+            ln += 1
+            line_offset = offset
+            offset += len(line)
+            if line[:2] != b"$n":
+                continue
+            try:
+                if line[:8] == b"$ns_ at ":
+                    if ix is not None and iy is not None:
+                        self.initial[self.map(inodenum)] = (ix, iy, iz)
+                        ix = iy = iz = None
+                    wp = self.parse(line)
+                    if last is not None and wp.time < last:
+                        # out of order, start a new run
+                        self.runs.append((start, line_offset))
+                        start = line_offset
+                    last = wp.time
+                    self.count += 1
+                    self.endtime = max(self.endtime, wp.time)
+                elif line[:7] == b"$node_(":
+                    # initial position (time=0, speed=0):
+                    #    $node_(6) set X_ 780.0
+                    parts = line.split()
+                    nodenum = parts[0][1 + parts[0].index(b"(") : parts[0].index(b")")]
+                    if parts[2] == b"X_":
+                        if ix is not None and iy is not None:
+                            self.initial[self.map(inodenum)] = (ix, iy, iz)
+                            ix = iy = iz = None
+                        ix = float(parts[3])
+                    elif parts[2] == b"Y_":
+                        iy = float(parts[3])
+                    elif parts[2] == b"Z_":
+                        iz = float(parts[3])
+                        self.initial[self.map(nodenum)] = (ix, iy, iz)
+                        ix = iy = iz = None
+                    inodenum = nodenum
+                else:
+                    raise ValueError
+            except ValueError:
+                logging.exception(
+                    "skipping line %d of file %s '%s'",
+                    ln,
+                    self.filename,
+                    line.decode(errors="replace"),
+                )
+                continue
+        if ix is not None and iy is not None:
+            self.initial[self.map(inodenum)] = (ix, iy, iz)
+        if last is not None:
+            self.runs.append((start, offset))
+        if len(self.runs) > self.MAX_RUNS:
+            logging.info(
+                "sorting ns-2 script with %d runs: %s", len(self.runs), self.filename
+            )
+            self.sort()
+
+    def sort(self):
+        """
+        Write the waypoint lines of the script to a temporary file in time order,
+        as a single run. Chunks of at most SORT_LINES lines are sorted in memory,
+        and sorted files are merged at most MAX_RUNS at a time, so memory is
+        bounded regardless of the order of the script.
+
+        :return: nothing
+        """
+
+        def key(line):
+            try:
+                return float(line.split()[2])
+            except (IndexError, ValueError):
+                # invalid lines are skipped when read
+                return math.inf
+
+        def merge(files):
+            merged = tempfile.TemporaryFile()
+            for f in files:
+                f.seek(0)
+            merged.writelines(heapq.merge(*files, key=key))
+            for f in files:
+                f.close()
+            return merged
+
+        # sorted files by merge level, merged into the next level when full
+        levels = [[]]
+        lines = []
+        data = self._mmap
+        for line in itertools.chain(self.lines(data, 0, len(data)), [None]):
+            if line is not None:
+                lines.append(line)
+                if len(lines) < self.SORT_LINES:
+                    continue
+            if lines:
+                lines.sort(key=key)
+                f = tempfile.TemporaryFile()
+                f.writelines(lines)
+                levels[0].append(f)
+                lines = []
+            for level, files in enumerate(levels):
+                if len(files) < self.MAX_RUNS:
+                    break
+                if level + 1 == len(levels):
+                    levels.append([])
+                levels[level + 1].append(merge(files))
+                levels[level] = []
+        files = [f for files in levels for f in files]
+        self._sorted = merge(files)
+        self._sorted.flush()
+        size = self._sorted.seek(0, os.SEEK_END)
+        self.runs = []
+        if size:
+            self._sorted_mmap = mmap.mmap(
+                self._sorted.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self.runs = [(0, size)]
+
+    def close(self):
+        """
+        Unmap the script file and remove any sorted copy.
+
+        :return: nothing
+        """
+        for data in (self._mmap, self._sorted_mmap, self._sorted):
+            if data is not None:
+                data.close()
+        self._mmap = None
+        self._sorted_mmap = None
+        self._sorted = None
+
+    @staticmethod
+    def lines(data, start, end):
+        """
+        Read the waypoint lines of a run.
+
+        :param mmap.mmap data: mapped script file
+        :param int start: offset of the run
+        :param int end: offset the run ends at
+        :return: waypoint lines, ending with a newline
+        :rtype: collections.abc.Iterator[bytes]
+        """
+        while start < end:
+            try:
+                stop = data.find(b"\n", start, end)
+                if stop < 0:
+                    stop = end
+                line = data[start:stop]
+            except ValueError:
+                # unmapped, the script has been indexed again
+                return
+            start = stop + 1
+            if line[:8] == b"$ns_ at ":
+                yield line + b"\n"
+
+    def read(self, data, start, end):
+        """
+        Read the waypoints of a run.
+
+        :param mmap.mmap data: mapped script file
+        :param int start: offset of the run
+        :param int end: offset the run ends at
+        :return: waypoints in time order
+        :rtype: collections.abc.Iterator[WayPoint]
+        """
+        for line in self.lines(data, start, end):
+            try:
+                yield self.parse(line)
+            except ValueError:
+                continue
+
+    def waypoints(self):
+        """
+        Read all waypoints from the start of the script, in time order. The
+        script is indexed again when its modification time or size has changed.
+
+        :return: waypoints in time order
+        :rtype: collections.abc.Iterator[WayPoint]
+        """
+        try:
+            stat = os.stat(self.filename)
+            current = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            current = self._stat
+        if current != self._stat:
+            logging.info("ns-2 script file changed, indexing: %s", self.filename)
+            self.index()
+        data = self._mmap
+        if self._sorted_mmap is not None:
+            data = self._sorted_mmap
+        runs = [self.read(data, start, end) for start, end in self.runs]
+        return heapq.merge(*runs, key=lambda wp: wp.time)
+
+
 class Ns2ScriptedMobility(WayPointMobility):
     """
     Handles the ns-2 script format, generated by scengen/setdest or
@@ -923,6 +1698,20 @@ class Ns2ScriptedMobility(WayPointMobility):
             _type=ConfigDataTypes.STRING,
             label="script file to run upon stop",
         ),
+        Configuration(
+            _id="link_events",
+            _type=ConfigDataTypes.BOOL,
+            default="0",
+            options=["On", "Off"],
+            label="schedule range calculations by link changes",
+        ),
+        Configuration(
+            _id="timeline",
+            _type=ConfigDataTypes.BOOL,
+            default="0",
+            options=["On", "Off"],
+            label="replay precomputed link timeline",
+        ),
     ]
 
     @classmethod
@@ -950,6 +1739,22 @@ class Ns2ScriptedMobility(WayPointMobility):
         self.script_start = None
         self.script_pause = None
         self.script_stop = None
+        # calculate ranges only when a link may change, with node positions
+        # moving linearly along segments, sent to observers every refresh_ms
+        self.link_events = False
+        self.segments = {}
+        self.crossings = None
+        self._link_round = 0
+        self._position_round = 0
+        # replay link changes and positions calculated once from the script,
+        # cached next to the script
+        self.use_timeline = False
+        self.timeline = None
+        self.frames = {}
+        self._link_index = 0
+        self._frame_index = 0
+        # waypoints are read from the script as needed
+        self.script = None
 
     def update_config(self, config):
         self.file = config["file"]
@@ -965,76 +1770,361 @@ class Ns2ScriptedMobility(WayPointMobility):
         self.script_start = config["script_start"]
         self.script_pause = config["script_pause"]
         self.script_stop = config["script_stop"]
+        self.link_events = config.get("link_events", "0") == "1"
+        self.use_timeline = config.get("timeline", "0") == "1"
+        self.timeline = None
         self.readscriptfile()
-        self.copywaypoints()
         self.setendtime()
 
+    def loopwaypoints(self):
+        """
+        Read waypoints from the start of the script again when looping.
+
+        :return: True when looping, False otherwise
+        :rtype: bool
+        """
+        self.queue = []
+        self._waypoints = iter(())
+        if self.script:
+            self._waypoints = self.script.waypoints()
+        self.readahead(0)
+        return self.loop
+
+    def setendtime(self):
+        """
+        Set self.endtime to the time of the last waypoint in the script. This is
+        just an estimate, adjusted after one round of the script has run.
+
+        :return: nothing
+        """
+        self.endtime = self.script.endtime if self.script else 0
+
     def readscriptfile(self):
         """
-        Read in mobility script from a file. This adds waypoints to a
-        priority queue, sorted by waypoint time. Initial waypoints are
-        stored in a separate dict.
+        Index the mobility script file, waypoints are read from it in time order
+        as they are needed. Initial waypoints are stored in a separate dict.
 
         :return: nothing
         """
+        if self.script:
+            self.script.close()
+        self.script = None
+        self.initial = {}
+        self.queue = []
+        self._waypoints = iter(())
         filename = self.findfile(self.file)
+        logging.info("reading ns-2 script file: %s", filename)
         try:
-            f = open(filename, "r")
+            self.script = Ns2Script(filename, self.nodemap)
         except IOError:
             logging.exception(
                 "ns-2 scripted mobility failed to load file: %s", self.file
             )
             return
-        logging.info("reading ns-2 script file: %s", filename)
-        ln = 0
-        ix = iy = iz = None
-        inodenum = None
-        for line in f:
-            ln += 1
-            if line[:2] != "$n":
+        for nodenum, (x, y, z) in self.script.initial.items():
+            self.addinitial(nodenum, x, y, z)
+        self.loopwaypoints()
+
+    def movenodesinitial(self):
+        """
+        Move nodes to their initial positions. Then calculate the ranges.
+
+        :return: nothing
+        """
+        super().movenodesinitial()
+        self.segments.clear()
+        self.frames.clear()
+        self._link_index = 0
+        self._frame_index = 0
+
+    def runround(self):
+        """
+        Advance script time and move nodes, when scheduling by link changes the
+        next round is scheduled for when a link may change, rather than every
+        refresh_ms.
+
+        :return: nothing
+        """
+        if self.timeline:
+            self._link_round += 1
+            self.timelineround(self._link_round)
+        elif self.link_events:
+            # motion may have changed while not running
+            self.crossings = None
+            self._link_round += 1
+            self.linkround(self._link_round)
+        else:
+            return super().runround()
+        self._position_round += 1
+        self.positionround(self._position_round)
+
+    def linkround(self, link_round):
+        """
+        Move nodes along their segments, re-calculate ranges for moved nodes, and
+        schedule the next round for the earliest time a node reaches its
+        waypoint, a new waypoint starts, or a pair of nodes crosses the range.
+
+        :param int link_round: round this was scheduled for, later rounds
+            replace any earlier scheduled round
+        :return: nothing
+        """
+        if self.state != self.STATE_RUNNING or link_round != self._link_round:
+            return
+        self.lasttime = time.monotonic()
+        now = self.lasttime - self.timezero
+        netifs = {netif.node.id: netif for netif in self.wlan.netifs()}
+
+        # move nodes along their segments, ending finished segments
+        moved = {}
+        changed = set()
+        for node_id, segment in list(self.segments.items()):
+            netif = netifs.get(node_id)
+            if netif is None:
+                continue
+            wp, end = segment[0], segment[7]
+            x, y, z = segment_position(segment, now)
+            if end <= now:
+                # the last node to reach the last waypoint determines this
+                # script's endtime
+                self.endtime = max(self.endtime, now)
+                del self.segments[node_id]
+                if self.points.get(node_id) is wp:
+                    del self.points[node_id]
+                self.setnodeposition(netif.node, x, y, z)
+                changed.add(node_id)
+            else:
+                # observers are sent positions of moving nodes by position rounds
+                netif.node.position.set(x, y, z)
+            moved[node_id] = netif
+
+        # start segments for new waypoints
+        self.updatepoints(now)
+        for node_id, wp in list(self.points.items()):
+            segment = self.segments.get(node_id)
+            netif = netifs.get(node_id)
+            if netif is None or (segment and segment[0] is wp):
+                continue
+            changed.add(node_id)
+            node = netif.node
+            if wp.speed == 0:
+                # instantaneous move
+                x, y, z = wp.coords
+                self.setnodeposition(node, x, y, z)
+                moved[node_id] = netif
+                self.segments.pop(node_id, None)
+                del self.points[node_id]
                 continue
+            x, y, z = node.getposition()
+            segment = create_segment(wp, now, x or 0.0, y or 0.0, z)
+            if segment is None:
+                # already at the waypoint
+                self.endtime = max(self.endtime, now)
+                self.segments.pop(node_id, None)
+                del self.points[node_id]
+                continue
+            self.segments[node_id] = segment
+        if moved:
+            moved_netifs = list(moved.values())
+            moved_nodes = [netif.node for netif in moved_netifs]
+            self.session.mobility.updatewlans(moved_nodes, moved_netifs)
+
+        if not self.points and not len(self.queue):
+            # no more waypoints or queued items, loop?
+            if not self.loopwaypoints():
+                return self.stop(move_initial=False)
+            if not len(self.queue):
+                # prevent busy loop
+                return
+            return self.run()
+
+        # schedule the next round
+        nexttime = self.nextcrossing(netifs, changed, now)
+        if len(self.queue):
+            nexttime = min(nexttime, self.queue[0].time)
+        for segment in self.segments.values():
+            nexttime = min(nexttime, segment[7])
+        if math.isinf(nexttime):
+            # waypoints for nodes not in this wlan, check back as movenode() would
+            nexttime = now + 0.001 * self.refresh_ms
+        self._link_round += 1
+        delay = max(nexttime - now, 0.0) + 0.001
+        self.session.event_loop.add_event(delay, self.linkround, self._link_round)
+
+    def positionround(self, position_round):
+        """
+        Send positions of nodes moving along segments to observers, every
+        refresh_ms, without calculating ranges.
+
+        :param int position_round: round this was scheduled for, later rounds
+            replace any earlier scheduled round
+        :return: nothing
+        """
+        if self.state != self.STATE_RUNNING or position_round != self._position_round:
+            return
+        now = time.monotonic() - self.timezero
+        positions = []
+        for node_id, segment in self.segments.items():
+            positions.append((node_id, segment_position(segment, now)))
+        for node_id, frame in self.frames.items():
+            positions.append((node_id, self.frameposition(frame, now)))
+        for node_id, (x, y, z) in positions:
             try:
-                if line[:8] == "$ns_ at ":
-                    if ix is not None and iy is not None:
-                        self.addinitial(self.map(inodenum), ix, iy, iz)
-                        ix = iy = iz = None
-                    # waypoints:
-                    #    $ns_ at 1.00 "$node_(6) setdest 500.0 178.0 25.0"
-                    parts = line.split()
-                    time = float(parts[2])
-                    nodenum = parts[3][1 + parts[3].index("(") : parts[3].index(")")]
-                    x = float(parts[5])
-                    y = float(parts[6])
-                    z = None
-                    speed = float(parts[7].strip('"'))
-                    self.addwaypoint(time, self.map(nodenum), x, y, z, speed)
-                elif line[:7] == "$node_(":
-                    # initial position (time=0, speed=0):
-                    #    $node_(6) set X_ 780.0
-                    parts = line.split()
-                    time = 0.0
-                    nodenum = parts[0][1 + parts[0].index("(") : parts[0].index(")")]
-                    if parts[2] == "X_":
-                        if ix is not None and iy is not None:
-                            self.addinitial(self.map(inodenum), ix, iy, iz)
-                            ix = iy = iz = None
-                        ix = float(parts[3])
-                    elif parts[2] == "Y_":
-                        iy = float(parts[3])
-                    elif parts[2] == "Z_":
-                        iz = float(parts[3])
-                        self.addinitial(self.map(nodenum), ix, iy, iz)
-                        ix = iy = iz = None
-                    inodenum = nodenum
-                else:
-                    raise ValueError
-            except ValueError:
-                logging.exception(
-                    "skipping line %d of file %s '%s'", ln, self.file, line
-                )
+                node = self.session.get_node(node_id)
+            except CoreError:
                 continue
-        if ix is not None and iy is not None:
-            self.addinitial(self.map(inodenum), ix, iy, iz)
+            self.setnodeposition(node, x, y, z)
+        self._position_round += 1
+        self.session.event_loop.add_event(
+            0.001 * self.refresh_ms, self.positionround, self._position_round
+        )
+
+    def timelineround(self, link_round):
+        """
+        Replay link changes and position keyframes from the timeline that are
+        due, and schedule the next round for the next change.
+
+        :param int link_round: round this was scheduled for, later rounds
+            replace any earlier scheduled round
+        :return: nothing
+        """
+        if self.state != self.STATE_RUNNING or link_round != self._link_round:
+            return
+        self.lasttime = time.monotonic()
+        now = self.lasttime - self.timezero
+        netifs = {netif.node.id: netif for netif in self.wlan.netifs()}
+        links = self.timeline.links
+        positions = self.timeline.positions
+
+        # move nodes to position keyframes, stopped nodes are sent immediately
+        while self._frame_index < len(positions):
+            frame = positions[self._frame_index]
+            if frame[0] > now:
+                break
+            self._frame_index += 1
+            node_id = frame[1]
+            netif = netifs.get(node_id)
+            if netif is None:
+                continue
+            if frame[7] > frame[0]:
+                self.frames[node_id] = frame
+            else:
+                self.frames.pop(node_id, None)
+                x, y, z = frame[2:5]
+                self.setnodeposition(netif.node, x, y, z)
+
+        # apply link changes
+        while self._link_index < len(links):
+            change_time, node_id, node_id2, up = links[self._link_index]
+            if change_time > now:
+                break
+            self._link_index += 1
+            netif = netifs.get(node_id)
+            netif2 = netifs.get(node_id2)
+            if netif is None or netif2 is None:
+                continue
+            self.wlan.model.setlinked(netif, netif2, up)
+
+        nexttime = math.inf
+        if self._frame_index < len(positions):
+            nexttime = positions[self._frame_index][0]
+        if self._link_index < len(links):
+            nexttime = min(nexttime, links[self._link_index][0])
+        if math.isinf(nexttime):
+            # timeline finished, loop?
+            self.frames.clear()
+            if not self.loopwaypoints():
+                return self.stop(move_initial=False)
+            return self.run()
+        self._link_round += 1
+        delay = max(nexttime - now, 0.0)
+        self.session.event_loop.add_event(delay, self.timelineround, self._link_round)
+
+    @staticmethod
+    def frameposition(frame, now):
+        """
+        Calculate the position of a node moving from a position keyframe.
+
+        :param list frame: position keyframe
+        :param float now: current script time
+        :return: x, y, z position
+        :rtype: tuple
+        """
+        start, _, x, y, z, sx, sy, end = frame
+        dt = min(max(now, start), end) - start
+        return x + sx * dt, y + sy * dt, z
+
+    def findtimeline(self):
+        """
+        Load the cached timeline for the script, wlan nodes and range, or
+        calculate and cache it when missing or out of date.
+
+        :return: timeline, None when the wlan has no range model
+        :rtype: core.location.timeline.LinkTimeline
+        """
+        model_range = getattr(self.wlan.model, "range", None)
+        if model_range is None or not hasattr(self.wlan.model, "setlinked"):
+            logging.warning("no range model for %s, not using timeline", self.wlan.name)
+            return None
+        positions = {}
+        for netif in self.wlan.netifs():
+            node = netif.node
+            wp = self.initial.get(node.id)
+            positions[node.id] = wp.coords if wp else node.getposition()
+        filename = self.findfile(self.file)
+        try:
+            status = os.stat(filename)
+        except OSError:
+            logging.exception("unable to find ns-2 script file: %s", filename)
+            return None
+        key = LinkTimeline.create_key(
+            os.path.abspath(filename),
+            status.st_mtime_ns,
+            status.st_size,
+            model_range,
+            sorted(self.nodemap.items()),
+            sorted(positions.items()),
+        )
+        if self.timeline and self.timeline.key == key:
+            return self.timeline
+        path = f"{filename}.timeline"
+        timeline = LinkTimeline.load(path, key)
+        if timeline is None:
+            logging.info("calculating ns-2 script timeline: %s", path)
+            waypoints = self.script.waypoints() if self.script else []
+            timeline = LinkTimeline.calculate(key, positions, waypoints, model_range)
+            timeline.save(path)
+        return timeline
+
+    def nextcrossing(self, netifs, changed, now):
+        """
+        Calculate the earliest time a pair of nodes crosses the range of the wlan
+        range model. Crossings are kept until either node changes its motion, so
+        only pairs with a changed node are calculated.
+
+        :param dict netifs: wlan interfaces mapped by node id
+        :param set changed: ids of nodes that changed their motion
+        :param float now: current script time
+        :return: script time of the next crossing, the next refresh when there is
+            no range model to calculate crossings with
+        :rtype: float
+        """
+        model_range = getattr(self.wlan.model, "range", None)
+        if model_range is None:
+            return now + 0.001 * self.refresh_ms
+        if self.crossings is None or self.crossings.distance != model_range:
+            self.crossings = RangeCrossings(model_range)
+            changed = set(netifs)
+        motions = {}
+        for node_id, netif in netifs.items():
+            x, y, z = netif.node.getposition()
+            if x is None or y is None:
+                continue
+            sx = sy = 0.0
+            segment = self.segments.get(node_id)
+            if segment:
+                sx, sy = segment[5], segment[6]
+            motions[node_id] = (x, y, z, sx, sy)
+        return self.crossings.update(motions, changed, now)
 
     def findfile(self, file_name):
         """
@@ -1140,6 +2230,8 @@ class Ns2ScriptedMobility(WayPointMobility):
 
         :return: nothing
         """
+        if self.use_timeline:
+            self.timeline = self.findtimeline()
         super().run()
         self.statescript("run")
 
@@ -1183,3 +2275,362 @@ class Ns2ScriptedMobility(WayPointMobility):
         utils.cmd(
             args, cwd=self.session.session_dir, env=self.session.get_environment()
         )
+
+
+class RandomMobility(WayPointMobility):
+    """
+    Abstract class for mobility models that generate random waypoints for the
+    nodes of a wlan from a seed and movement parameters, as they are needed,
+    rather than reading them from a script.
+    """
+
+    name = "random"
+    options = [
+        Configuration(
+            _id="seed", _type=ConfigDataTypes.UINT32, default="1", label="random seed"
+        ),
+        Configuration(
+            _id="refresh_ms",
+            _type=ConfigDataTypes.UINT32,
+            default="50",
+            label="refresh time (ms)",
+        ),
+        Configuration(
+            _id="loop",
+            _type=ConfigDataTypes.BOOL,
+            default="1",
+            options=["On", "Off"],
+            label="loop",
+        ),
+        Configuration(
+            _id="autostart",
+            _type=ConfigDataTypes.STRING,
+            label="auto-start seconds (0.0 for runtime)",
+        ),
+        Configuration(
+            _id="duration",
+            _type=ConfigDataTypes.FLOAT,
+            default="0",
+            label="duration seconds (0 for no end)",
+        ),
+        Configuration(
+            _id="width",
+            _type=ConfigDataTypes.FLOAT,
+            default="1000",
+            label="area width (pixels)",
+        ),
+        Configuration(
+            _id="height",
+            _type=ConfigDataTypes.FLOAT,
+            default="750",
+            label="area height (pixels)",
+        ),
+        Configuration(
+            _id="min_speed",
+            _type=ConfigDataTypes.FLOAT,
+            default="5",
+            label="minimum speed (pixels/s)",
+        ),
+        Configuration(
+            _id="max_speed",
+            _type=ConfigDataTypes.FLOAT,
+            default="20",
+            label="maximum speed (pixels/s)",
+        ),
+        Configuration(
+            _id="pause",
+            _type=ConfigDataTypes.FLOAT,
+            default="0",
+            label="pause seconds between moves",
+        ),
+    ]
+    label = "Random Mobility"
+
+    @classmethod
+    def config_groups(cls):
+        return [ConfigGroup(f"{cls.label} Parameters", 1, len(cls.configurations()))]
+
+    def __init__(self, session, _id):
+        """
+        Creates a RandomMobility instance.
+
+        :param core.emulator.session.Session session: CORE session instance
+        :param int _id: object id
+        """
+        super().__init__(session, _id)
+        self.seed = 1
+        self.autostart = None
+        self.duration = 0.0
+        self.width = 1000.0
+        self.height = 750.0
+        self.min_speed = 5.0
+        self.max_speed = 20.0
+        self.pause_time = 0.0
+
+    def update_config(self, config):
+        self.seed = int(config["seed"])
+        self.refresh_ms = int(config["refresh_ms"])
+        self.loop = config["loop"].lower() == "on"
+        self.autostart = config["autostart"]
+        self.duration = float(config["duration"])
+        self.width = float(config["width"])
+        self.height = float(config["height"])
+        self.min_speed = float(config["min_speed"])
+        self.max_speed = max(self.min_speed, float(config["max_speed"]))
+        self.pause_time = float(config["pause"])
+        logging.info(
+            "%s mobility configured for WLAN %d using seed: %s",
+            self.name,
+            self.id,
+            self.seed,
+        )
+        self.setendtime()
+
+    def setendtime(self):
+        """
+        Set self.endtime to the configured duration.
+
+        :return: nothing
+        """
+        self.endtime = self.duration
+
+    def loopwaypoints(self):
+        """
+        Generate waypoints from the start again, for the nodes currently
+        attached to the wlan, when looping or stopping.
+
+        :return: True when looping, False otherwise
+        :rtype: bool
+        """
+        self.queue = []
+        self.initial = {}
+        walks = []
+        for netif in self.wlan.netifs():
+            node_id = netif.node.id
+            # a generator per node, so each node moves the same for a seed
+            rng = random.Random(f"{self.seed}:{node_id}")
+            x = rng.uniform(0.0, self.width)
+            y = rng.uniform(0.0, self.height)
+            self.addinitial(node_id, x, y, None)
+            walks.append(self.waypoints(node_id, rng, x, y))
+        self._waypoints = heapq.merge(*walks, key=lambda wp: wp.time)
+        self.readahead(0)
+        return self.loop
+
+    def waypoints(self, node_id, rng, x, y):
+        """
+        Generate the waypoints of a node, in time order, until the duration ends.
+
+        :param int node_id: node id to generate waypoints for
+        :param random.Random rng: random number generator for this node
+        :param float x: initial x position
+        :param float y: initial y position
+        :return: waypoints in time order
+        :rtype: collections.abc.Iterator[WayPoint]
+        """
+        now = 0.0
+        for x, y, speed, wait in self.walk(rng, x, y):
+            if self.duration and now > self.duration:
+                return
+            yield WayPoint(now, node_id, coords=(x, y, None), speed=speed)
+            now += wait
+
+    def walk(self, rng, x, y):
+        """
+        Generate the moves of a node.
+
+        :param random.Random rng: random number generator for this node
+        :param float x: initial x position
+        :param float y: initial y position
+        :return: destination x, y, the speed to move there and the time until the
+            next move
+        :rtype: collections.abc.Iterator[tuple]
+        """
+        raise NotImplementedError
+
+    def speed(self, rng):
+        """
+        Draw a speed from the configured speed range.
+
+        :param random.Random rng: random number generator to use
+        :return: speed
+        :rtype: float
+        """
+        return rng.uniform(self.min_speed, self.max_speed)
+
+    def reflect(self, x, y):
+        """
+        Reflect a position off the area bounds, back into the area.
+
+        :param float x: x position
+        :param float y: y position
+        :return: reflected x, y position
+        :rtype: tuple
+        """
+        x = abs(x) % (2 * self.width) if self.width else 0.0
+        y = abs(y) % (2 * self.height) if self.height else 0.0
+        if x > self.width:
+            x = 2 * self.width - x
+        if y > self.height:
+            y = 2 * self.height - y
+        return x, y
+
+    def startup(self):
+        """
+        Start moving nodes if autostart is enabled. Ignore the model if
+        autostart is an empty string (can still be started via GUI controls).
+
+        :return: nothing
+        """
+        if self.autostart == "":
+            logging.info("not auto-starting %s for %s", self.name, self.wlan.name)
+            return
+        try:
+            t = float(self.autostart)
+        except ValueError:
+            logging.exception(
+                "Invalid auto-start seconds specified '%s' for %s",
+                self.autostart,
+                self.wlan.name,
+            )
+            return
+        self.loopwaypoints()
+        self.movenodesinitial()
+        logging.info(
+            "scheduling %s for %s autostart at %s", self.name, self.wlan.name, t
+        )
+        self.state = self.STATE_RUNNING
+        self.session.event_loop.add_event(t, self.run)
+
+
+class RandomWaypointMobility(RandomMobility):
+    """
+    Random waypoint model, nodes move to a random destination within the area
+    at a random speed, then pause before choosing the next destination.
+    """
+
+    name = "random_waypoint"
+    label = "Random Waypoint"
+
+    def walk(self, rng, x, y):
+        while True:
+            x2 = rng.uniform(0.0, self.width)
+            y2 = rng.uniform(0.0, self.height)
+            speed = self.speed(rng)
+            travel = math.hypot(x2 - x, y2 - y) / speed if speed else 0.0
+            yield x2, y2, speed, travel + self.pause_time
+            x, y = x2, y2
+
+
+class RandomWalkMobility(RandomMobility):
+    """
+    Random walk model, nodes move in a random direction at a random speed for
+    a fixed interval, reflecting off the area bounds.
+    """
+
+    name = "random_walk"
+    label = "Random Walk"
+    options = RandomMobility.options + [
+        Configuration(
+            _id="interval",
+            _type=ConfigDataTypes.FLOAT,
+            default="10",
+            label="seconds per move",
+        )
+    ]
+
+    def __init__(self, session, _id):
+        """
+        Creates a RandomWalkMobility instance.
+
+        :param core.emulator.session.Session session: CORE session instance
+        :param int _id: object id
+        """
+        super().__init__(session, _id)
+        self.interval = 10.0
+
+    def update_config(self, config):
+        self.interval = float(config["interval"])
+        super().update_config(config)
+
+    def walk(self, rng, x, y):
+        while True:
+            direction = rng.uniform(0.0, 2 * math.pi)
+            speed = self.speed(rng)
+            distance = speed * self.interval
+            x2, y2 = self.reflect(
+                x + distance * math.cos(direction), y + distance * math.sin(direction)
+            )
+            yield x2, y2, speed, self.interval + self.pause_time
+            x, y = x2, y2
+
+
+class GaussMarkovMobility(RandomMobility):
+    """
+    Gauss-Markov model, the speed and direction of nodes are updated every
+    interval from their previous values, a mean and a random gaussian value,
+    with alpha setting how much of their previous motion is kept. Nodes turn
+    towards the center of the area near its edges.
+    """
+
+    name = "gauss_markov"
+    label = "Gauss-Markov"
+    options = RandomMobility.options + [
+        Configuration(
+            _id="interval",
+            _type=ConfigDataTypes.FLOAT,
+            default="1",
+            label="seconds per update",
+        ),
+        Configuration(
+            _id="alpha",
+            _type=ConfigDataTypes.FLOAT,
+            default="0.75",
+            label="alpha (0 random, 1 linear)",
+        ),
+    ]
+
+    def __init__(self, session, _id):
+        """
+        Creates a GaussMarkovMobility instance.
+
+        :param core.emulator.session.Session session: CORE session instance
+        :param int _id: object id
+        """
+        super().__init__(session, _id)
+        self.interval = 1.0
+        self.alpha = 0.75
+
+    def update_config(self, config):
+        self.interval = float(config["interval"])
+        self.alpha = min(max(float(config["alpha"]), 0.0), 1.0)
+        super().update_config(config)
+
+    def walk(self, rng, x, y):
+        alpha = self.alpha
+        noise = math.sqrt(1 - alpha * alpha)
+        mean_speed = (self.min_speed + self.max_speed) / 2
+        deviation = (self.max_speed - self.min_speed) / 2
+        speed = self.speed(rng)
+        direction = mean_direction = rng.uniform(0.0, 2 * math.pi)
+        edge_x = self.width * 0.1
+        edge_y = self.height * 0.1
+        while True:
+            distance = speed * self.interval
+            x2 = min(max(x + distance * math.cos(direction), 0.0), self.width)
+            y2 = min(max(y + distance * math.sin(direction), 0.0), self.height)
+            yield x2, y2, speed, self.interval + self.pause_time
+            x, y = x2, y2
+            if not (edge_x < x < self.width - edge_x) or not (
+                edge_y < y < self.height - edge_y
+            ):
+                mean_direction = math.atan2(self.height / 2 - y, self.width / 2 - x)
+            speed = (
+                alpha * speed
+                + (1 - alpha) * mean_speed
+                + noise * rng.gauss(0.0, deviation)
+            )
+            speed = min(max(speed, self.min_speed), self.max_speed)
+            # blend towards the mean direction the short way around
+            turn = (mean_direction - direction + math.pi) % (2 * math.pi) - math.pi
+            direction += (1 - alpha) * turn + noise * rng.gauss(0.0, math.pi / 4)
@@ -0,0 +1,109 @@
+"""
+positions.py: collects node position updates and broadcasts them in batches.
+"""
+
+import threading
+
+from core.emulator.data import NodeData
+
+
+class PositionPipeline:
+    """
+    Collects node moves, keeping the last position of each node, and broadcasts
+    them when flushed, as a single batch of node positions on the session event
+    bus, and as full node data to session node handlers and bus subscribers not
+    taking batches.
+
+    While the session event loop is running, moves are flushed by an event
+    scheduled on the first move, so all moves made by the current event are
+    broadcast together.
+    """
+
+    def __init__(self, session):
+        """
+        Create a PositionPipeline instance.
+
+        :param core.emulator.session.Session session: session to broadcast for
+        """
+        self.session = session
+        self.moves = {}
+        self.scheduled = False
+        self.lock = threading.Lock()
+
+    def reset(self):
+        """
+        Drop collected moves and any scheduled flush, used when the event loop
+        has stopped.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.moves = {}
+            self.scheduled = False
+
+    def update(self, node, lat=None, lon=None, alt=None):
+        """
+        Collect a node move to broadcast on the next flush, replacing any earlier
+        move of the node.
+
+        :param core.nodes.base.NodeBase node: moved node
+        :param str lat: latitude
+        :param str lon: longitude
+        :param str alt: altitude
+        :return: nothing
+        """
+        with self.lock:
+            self.moves[node.id] = (node, lat, lon, alt)
+            if self.scheduled:
+                return
+            event_loop = self.session.event_loop
+            if event_loop.running:
+                self.scheduled = True
+                event_loop.add_event(0.0, self.flush)
+                return
+        self.flush()
+
+    def flush(self):
+        """
+        Broadcast all collected moves.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.scheduled = False
+            if not self.moves:
+                return
+            moves = self.moves
+            self.moves = {}
+        batch = []
+        moved = []
+        for node_id, (node, lat, lon, alt) in moves.items():
+            if node.apitype is None:
+                continue
+            x, y, _ = node.position.get()
+            node_data = NodeData(
+                message_type=0,
+                id=node_id,
+                name=node.name,
+                x_position=x,
+                y_position=y,
+                latitude=lat,
+                longitude=lon,
+                altitude=alt,
+            )
+            batch.append(node_data)
+            moved.append((node, lat, lon, alt))
+        if not batch:
+            return
+
+        # full node data only for handlers and subscribers not taking batches
+        handlers = self.session.node_handlers
+        bus = self.session.bus
+        node_data = []
+        if handlers or bus.node_subscribed():
+            for node, lat, lon, alt in moved:
+                node_data.append(node.data(0, lat=lat, lon=lon, alt=alt))
+        bus.publish_positions(batch, node_data)
+        for data in node_data:
+            for handler in handlers:
+                handler(data)
@@ -0,0 +1,379 @@
+"""
+timeline.py: link timelines precomputed from waypoints, for replaying mobility
+scripts without range calculations.
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import math
+import os
+
+TIMELINE_VERSION = 1
+
+
+def create_segment(wp, now, x, y, z):
+    """
+    Create a linear segment for a node moving from its position towards a
+    waypoint at the waypoint speed.
+
+    :param core.location.mobility.WayPoint wp: waypoint the node is moving to
+    :param float now: script time the segment starts
+    :param float x: x position
+    :param float y: y position
+    :param z: z position
+    :return: waypoint, start time, start position, velocity and end time,
+        None when already at the waypoint
+    :rtype: tuple
+    """
+    x2, y2, _ = wp.coords
+    x2 = max(x2, 0.0)
+    y2 = max(y2, 0.0)
+    speed = wp.speed
+    if not isinstance(speed, (float, int)):
+        speed = math.hypot(speed[0], speed[1])
+    distance = math.hypot(x2 - x, y2 - y)
+    if distance == 0 or speed == 0:
+        return None
+    sx = speed * (x2 - x) / distance
+    sy = speed * (y2 - y) / distance
+    return wp, now, x, y, z, sx, sy, now + distance / speed
+
+
+def segment_position(segment, now):
+    """
+    Calculate the position of a node along a segment.
+
+    :param tuple segment: segment the node is moving along
+    :param float now: script time to get position for
+    :return: x, y, z position
+    :rtype: tuple
+    """
+    wp, start, x, y, z, sx, sy, end = segment
+    if now >= end:
+        x2, y2, _ = wp.coords
+        return max(x2, 0.0), max(y2, 0.0), z
+    dt = max(now - start, 0.0)
+    return x + sx * dt, y + sy * dt, z
+
+
+def distance(p1, p2):
+    """
+    Calculate the distance between two positions, as the basic range model does,
+    ignoring z unless both positions have one.
+
+    :param tuple p1: position one
+    :param tuple p2: position two
+    :return: distance between the positions
+    :rtype: float
+    """
+    a = p1[0] - p2[0]
+    b = p1[1] - p2[1]
+    c = 0
+    if p1[2] is not None and p2[2] is not None:
+        c = p1[2] - p2[2]
+    return math.hypot(math.hypot(a, b), c)
+
+
+class RangeCrossings:
+    """
+    Tracks when pairs of linearly moving nodes cross a range. Crossings are kept
+    until either node changes its motion, so only pairs with a changed node are
+    calculated again.
+    """
+
+    def __init__(self, distance):
+        """
+        Create a RangeCrossings instance.
+
+        :param float distance: range to calculate crossings for
+        """
+        self.distance = distance
+        self.crossings = []
+        self.versions = {}
+
+    def update(self, motions, changed, now):
+        """
+        Calculate crossings for pairs with a node that changed its motion, and
+        retrieve the time of the next crossing.
+
+        :param dict motions: x, y, z position and sx, sy velocity by node id
+        :param changed: ids of nodes that changed their motion
+        :param float now: current time
+        :return: time of the next crossing, math.inf when there are none
+        :rtype: float
+        """
+        for node_id in changed:
+            self.versions[node_id] = self.versions.get(node_id, 0) + 1
+        limit = self.distance * self.distance
+        calculated = set()
+        for node_id in changed:
+            calculated.add(node_id)
+            if node_id not in motions:
+                continue
+            x, y, z, sx, sy = motions[node_id]
+            version = self.versions[node_id]
+            for node_id2, (x2, y2, z2, sx2, sy2) in motions.items():
+                if node_id2 in calculated:
+                    continue
+                # solve |d + w * t| = range for crossings in and out of range
+                wx, wy = sx2 - sx, sy2 - sy
+                a = wx * wx + wy * wy
+                if a == 0:
+                    continue
+                dx, dy = x2 - x, y2 - y
+                dz = 0
+                if z is not None and z2 is not None:
+                    dz = z2 - z
+                b = 2 * (dx * wx + dy * wy)
+                c = dx * dx + dy * dy + dz * dz - limit
+                discriminant = b * b - 4 * a * c
+                if discriminant < 0:
+                    continue
+                root = math.sqrt(discriminant)
+                version2 = self.versions.get(node_id2, 0)
+                for t in ((-b - root) / (2 * a), (-b + root) / (2 * a)):
+                    if t > 0:
+                        crossing = (now + t, node_id, version, node_id2, version2)
+                        heapq.heappush(self.crossings, crossing)
+
+        # drop crossings that have passed, or for nodes that changed since
+        if len(self.crossings) > len(motions) * len(motions):
+            self.crossings = [x for x in self.crossings if self.valid(x, now)]
+            heapq.heapify(self.crossings)
+        while self.crossings:
+            if self.valid(self.crossings[0], now):
+                return self.crossings[0][0]
+            heapq.heappop(self.crossings)
+        return math.inf
+
+    def due(self, now):
+        """
+        Remove and retrieve the node pairs that cross the range by now.
+
+        :param float now: current time
+        :return: node id pairs
+        :rtype: list[tuple]
+        """
+        pairs = []
+        while self.crossings and self.crossings[0][0] <= now:
+            crossing = heapq.heappop(self.crossings)
+            if self.valid(crossing, -math.inf):
+                pairs.append((crossing[1], crossing[3]))
+        return pairs
+
+    def valid(self, crossing, now):
+        """
+        Check if a calculated crossing is still to come, for the current motion of
+        its nodes.
+
+        :param tuple crossing: crossing time, node ids and their versions
+        :param float now: current time
+        :return: True if valid, False otherwise
+        :rtype: bool
+        """
+        crossing_time, node_id, version, node_id2, version2 = crossing
+        return (
+            crossing_time > now
+            and self.versions.get(node_id, 0) == version
+            and self.versions.get(node_id2, 0) == version2
+        )
+
+
+class LinkTimeline:
+    """
+    Time sorted link changes and node position keyframes, calculated once from
+    the waypoints of a mobility script and the range of a wireless network.
+    """
+
+    def __init__(self, key, links, positions, endtime):
+        """
+        Create a LinkTimeline instance.
+
+        :param str key: key for the inputs this timeline was calculated from
+        :param list links: link changes as time, node id, node id and up
+        :param list positions: positions as time, node id, x, y, z, velocity sx,
+            sy and the time the node stops
+        :param float endtime: time of the last change
+        """
+        self.key = key
+        self.links = links
+        self.positions = positions
+        self.endtime = endtime
+
+    @staticmethod
+    def create_key(*args):
+        """
+        Create a key from the inputs a timeline is calculated from.
+
+        :param args: json serializable inputs
+        :return: key
+        :rtype: str
+        """
+        data = json.dumps([TIMELINE_VERSION, *args], sort_keys=True)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    @classmethod
+    def load(cls, path, key):
+        """
+        Load a cached timeline.
+
+        :param str path: path to load from
+        :param str key: expected key for the timeline
+        :return: timeline, None when missing or calculated from other inputs
+        :rtype: LinkTimeline
+        """
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return None
+        if data.get("key") != key:
+            return None
+        return cls(key, data["links"], data["positions"], data["endtime"])
+
+    def save(self, path):
+        """
+        Cache this timeline.
+
+        :param str path: path to save to
+        :return: nothing
+        """
+        data = {
+            "key": self.key,
+            "links": self.links,
+            "positions": self.positions,
+            "endtime": self.endtime,
+        }
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except IOError:
+            logging.warning("unable to cache mobility timeline: %s", path)
+
+    @classmethod
+    def calculate(cls, key, positions, waypoints, distance_range):
+        """
+        Calculate a timeline by moving nodes linearly between waypoints, from
+        their initial positions, as scheduling by link changes would.
+
+        :param str key: key for the inputs the timeline is calculated from
+        :param dict positions: initial x, y, z positions by node id, for all
+            nodes in the wireless network
+        :param waypoints: waypoints in time order, those for nodes not in
+            positions are ignored
+        :param float distance_range: range nodes are linked within
+        :return: timeline
+        :rtype: LinkTimeline
+        """
+        positions = {
+            node_id: position
+            for node_id, position in positions.items()
+            if position[0] is not None and position[1] is not None
+        }
+        linked = set()
+        node_ids = sorted(positions)
+        for index, node_id in enumerate(node_ids):
+            for node_id2 in node_ids[index + 1 :]:
+                if distance(positions[node_id], positions[node_id2]) <= distance_range:
+                    linked.add((node_id, node_id2))
+        links = []
+        keyframes = []
+        segments = {}
+        crossings = RangeCrossings(distance_range)
+        changed = set(positions)
+        waypoints = iter(waypoints)
+        nextwp = next(waypoints, None)
+        now = 0.0
+        endtime = 0.0
+
+        def setlinked(time, node_id, node_id2, up):
+            pair = (min(node_id, node_id2), max(node_id, node_id2))
+            if up == (pair in linked):
+                return
+            if up:
+                linked.add(pair)
+            else:
+                linked.discard(pair)
+            links.append([time, pair[0], pair[1], up])
+
+        while True:
+            motions = {}
+            for node_id, (x, y, z) in positions.items():
+                sx = sy = 0.0
+                segment = segments.get(node_id)
+                if segment:
+                    x, y, z = segment_position(segment, now)
+                    sx, sy = segment[5], segment[6]
+                motions[node_id] = (x, y, z, sx, sy)
+            nexttime = crossings.update(motions, changed, now)
+            while nextwp is not None and nextwp.nodenum not in positions:
+                nextwp = next(waypoints, None)
+            if nextwp is not None:
+                nexttime = min(nexttime, nextwp.time)
+            for segment in segments.values():
+                nexttime = min(nexttime, segment[7])
+            if math.isinf(nexttime):
+                break
+            now = max(nexttime, now)
+            endtime = now
+            changed = set()
+
+            # links for nodes crossing the range, just after crossing
+            for node_id, node_id2 in crossings.due(now):
+                p1, p2 = [
+                    segment_position(segments[x], now + 1e-6)
+                    if x in segments
+                    else positions[x]
+                    for x in (node_id, node_id2)
+                ]
+                up = distance(p1, p2) <= distance_range
+                setlinked(now, node_id, node_id2, up)
+
+            # end finished segments
+            for node_id, segment in list(segments.items()):
+                if segment[7] <= now:
+                    positions[node_id] = segment_position(segment, now)
+                    del segments[node_id]
+                    changed.add(node_id)
+                    x, y, z = positions[node_id]
+                    keyframes.append([now, node_id, x, y, z, 0.0, 0.0, now])
+
+            # start new waypoints
+            while nextwp is not None and nextwp.time <= now:
+                wp = nextwp
+                nextwp = next(waypoints, None)
+                node_id = wp.nodenum
+                if node_id not in positions:
+                    continue
+                segment = segments.pop(node_id, None)
+                if segment:
+                    positions[node_id] = segment_position(segment, now)
+                changed.add(node_id)
+                if wp.speed == 0:
+                    # instantaneous move, links change immediately
+                    positions[node_id] = wp.coords
+                    x, y, z = wp.coords
+                    keyframes.append([now, node_id, x, y, z, 0.0, 0.0, now])
+                    for node_id2, position in positions.items():
+                        if node_id2 == node_id:
+                            continue
+                        segment2 = segments.get(node_id2)
+                        if segment2:
+                            position = segment_position(segment2, now)
+                        up = distance(wp.coords, position) <= distance_range
+                        setlinked(now, node_id, node_id2, up)
+                    continue
+                x, y, z = positions[node_id]
+                segment = create_segment(wp, now, x, y, z)
+                if segment is None:
+                    keyframes.append([now, node_id, x, y, z, 0.0, 0.0, now])
+                    continue
+                segments[node_id] = segment
+                keyframes.append(
+                    [now, node_id, x, y, z, segment[5], segment[6], segment[7]]
+                )
+        return cls(key, links, keyframes, endtime)
@@ -61,7 +61,14 @@ class NodeBase:
         self.position = Position()
 
         use_ovs = session.options.get_config("ovs") == "True"
-        self.net_client = get_net_client(use_ovs, self.host_cmd)
+        # netlink only reaches the local host, network nodes also run their host
+        # commands on distributed servers
+        use_netlink = (
+            server is None
+            and not session.distributed.servers
+            and session.options.get_config("netlink") == "True"
+        )
+        self.net_client = get_net_client(use_ovs, self.host_cmd, use_netlink)
 
     def startup(self):
         """
@@ -295,6 +302,7 @@ class CoreNodeBase(NodeBase):
             raise ValueError(f"ifindex {ifindex} already exists")
         self._netif[ifindex] = netif
         netif.netindex = ifindex
+        self.session.netif_version += 1
 
     def delnetif(self, ifindex):
         """
@@ -306,6 +314,7 @@ class CoreNodeBase(NodeBase):
         if ifindex not in self._netif:
             raise ValueError(f"ifindex {ifindex} does not exist")
         netif = self._netif.pop(ifindex)
+        self.session.netif_version += 1
         netif.shutdown()
         del netif
 
@@ -358,6 +367,10 @@ class CoreNodeBase(NodeBase):
         if changed:
             for netif in self.netifs(sort=True):
                 netif.setposition(x, y, z)
+                # mobility models may be stepping this node from its last position
+                mobility = getattr(netif.net, "mobility", None)
+                if mobility:
+                    mobility.node_moved(self)
 
     def commonnets(self, obj, want_ctrl=False):
         """
@@ -393,6 +406,18 @@ class CoreNodeBase(NodeBase):
         """
         raise NotImplementedError
 
+    def privatedir_cmd(self, path):
+        """
+        Command creating a private directory, to run within the node along with
+        other commands.
+
+        :param str path: path to create
+        :return: command to run within the node
+        :rtype: str
+        :raises ValueError: when the path is not fully qualified
+        """
+        raise NotImplementedError
+
     def termcmdstring(self, sh):
         """
         Create a terminal command string.
@@ -459,7 +484,10 @@ class CoreNode(CoreNodeBase):
         :param bool use_ovs: True for OVS bridges, False for Linux bridges
         :return:node network client
         """
-        return get_net_client(use_ovs, self.cmd)
+        use_netlink = (
+            self.server is None and self.session.options.get_config("netlink") == "True"
+        )
+        return get_net_client(use_ovs, self.cmd, use_netlink, lambda: self.pid)
 
     def alive(self):
         """
@@ -503,8 +531,13 @@ class CoreNode(CoreNodeBase):
             self.pid = int(output)
             logging.debug("node(%s) pid: %s", self.name, self.pid)
 
-            # create vnode client
-            self.client = client.VnodeClient(self.name, self.ctrlchnlname)
+            # create vnode client, local nodes may keep a persistent channel open
+            persistent = self.server is None and self.session.options.get_config_bool(
+                "vnode_channel", default=False
+            )
+            self.client = client.VnodeClient(
+                self.name, self.ctrlchnlname, persistent=persistent
+            )
 
             # bring up the loopback interface
             logging.debug("bringing up loopback interface")
@@ -556,6 +589,7 @@ class CoreNode(CoreNodeBase):
                 # clear interface data, close client, and mark self and not up
                 self._netif.clear()
                 self.client.close()
+                self.node_net_client.close()
                 self.up = False
             except OSError:
                 logging.exception("error during shutdown")
@@ -608,6 +642,25 @@ class CoreNode(CoreNodeBase):
         self.host_cmd(f"mkdir -p {hostpath}")
         self.mount(hostpath, path)
 
+    def privatedir_cmd(self, path):
+        """
+        Command creating a private directory, to run within the node along with
+        other commands.
+
+        :param str path: path to create
+        :return: command to run within the node
+        :rtype: str
+        :raises ValueError: when the path is not fully qualified
+        """
+        if path[0] != "/":
+            raise ValueError(f"path not fully qualified: {path}")
+        hostpath = os.path.join(
+            self.nodedir, os.path.normpath(path).strip("/").replace("/", ".")
+        )
+        hostpath = os.path.abspath(hostpath)
+        self._mounts.append((hostpath, path))
+        return f"mkdir -p {hostpath} {path} && {MOUNT_BIN} -n --bind {hostpath} {path}"
+
     def mount(self, source, target):
         """
         Create and mount a directory.
@@ -817,13 +870,14 @@ class CoreNode(CoreNodeBase):
             if net is not None:
                 self.attachnet(ifindex, net)
 
-            if hwaddr:
-                self.sethwaddr(ifindex, hwaddr)
+            with self.node_net_client.batch():
+                if hwaddr:
+                    self.sethwaddr(ifindex, hwaddr)
 
-            for address in utils.make_tuple(addrlist):
-                self.addaddr(ifindex, address)
+                for address in utils.make_tuple(addrlist):
+                    self.addaddr(ifindex, address)
 
-            self.ifup(ifindex)
+                self.ifup(ifindex)
             return ifindex
 
     def addfile(self, srcname, filename):
@@ -971,6 +1025,8 @@ class CoreNetworkBase(NodeBase):
         netif.netifi = None
         with self._linked_lock:
             del self._linked[netif]
+            for linked in self._linked.values():
+                linked.pop(netif, None)
 
     def all_link_data(self, flags):
         """
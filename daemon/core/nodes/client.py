@@ -1,11 +1,259 @@
 """
 client.py: implementation of the VnodeClient class for issuing commands
 over a control channel to the vnoded process running in a network namespace.
-The control channel can be accessed via calls using the vcmd shell.
+The control channel can be accessed via calls using the vcmd shell, or through a
+persistent connection speaking the vnoded channel protocol directly.
 """
 
+import array
+import logging
+import os
+import selectors
+import shlex
+import socket
+import struct
+import threading
+
 from core import utils
 from core.constants import VCMD_BIN
+from core.errors import CoreCommandError
+
+# vnoded channel message types, see netns/vnode_msg.h
+VNODE_MSG_CMDREQ = 1
+VNODE_MSG_CMDREQACK = 2
+VNODE_MSG_CMDSTATUS = 3
+
+# vnoded channel tlv types, see netns/vnode_msg.h
+VNODE_TLV_CMDID = 1
+VNODE_TLV_CMDARG = 5
+VNODE_TLV_CMDPID = 6
+VNODE_TLV_CMDSTATUS = 7
+
+VNODE_MSGSIZMAX = 65535
+_HEADER = struct.Struct("=II")
+_INT32 = struct.Struct("=i")
+
+
+def pack_message(msg_type, tlvs):
+    """
+    Pack a vnoded channel message.
+
+    :param int msg_type: message type
+    :param list[tuple] tlvs: tlv type and value bytes pairs
+    :return: packed message
+    :rtype: bytes
+    """
+    data = b"".join(_HEADER.pack(t, len(v)) + v for t, v in tlvs)
+    return _HEADER.pack(msg_type, len(data)) + data
+
+
+def unpack_message(data):
+    """
+    Unpack a vnoded channel message.
+
+    :param bytes data: message data
+    :return: message type and dict of tlv type to value bytes
+    :rtype: tuple
+    """
+    msg_type, length = _HEADER.unpack_from(data)
+    offset = _HEADER.size
+    end = offset + length
+    tlvs = {}
+    while offset < end:
+        tlv_type, tlv_length = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        tlvs[tlv_type] = data[offset : offset + tlv_length]
+        offset += tlv_length
+    return msg_type, tlvs
+
+
+def exit_status(status):
+    """
+    Convert a raw wait status into an exit status, the same way vcmd does.
+
+    :param int status: raw wait status
+    :return: exit status
+    :rtype: int
+    """
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    return 255
+
+
+class VnodeCommand:
+    """
+    Tracks a command request sent over a vnoded control channel.
+    """
+
+    def __init__(self, cmdid):
+        """
+        Create a VnodeCommand instance.
+
+        :param int cmdid: command id
+        """
+        self.cmdid = cmdid
+        self.pid = None
+        self.status = None
+        self.done = threading.Event()
+
+    def complete(self, status):
+        """
+        Mark command complete with the provided raw wait status.
+
+        :param int status: raw wait status
+        :return: nothing
+        """
+        self.status = status
+        self.done.set()
+
+
+class VnodeChannel:
+    """
+    Persistent connection to the control channel of a vnoded process, used to
+    multiplex commands without spawning a vcmd process for each one.
+    """
+
+    def __init__(self, ctrlchnlname):
+        """
+        Create a VnodeChannel instance and connect to the control channel.
+
+        :param str ctrlchnlname: control channel name
+        :raises IOError: when unable to connect to the control channel
+        """
+        self.ctrlchnlname = ctrlchnlname
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        try:
+            self.sock.connect(ctrlchnlname)
+        except OSError:
+            self.sock.close()
+            raise
+        self.lock = threading.Lock()
+        self.cmdid = 0
+        self.commands = {}
+        self.running = True
+        self.thread = threading.Thread(target=self._receive, daemon=True)
+        self.thread.start()
+
+    def _receive(self):
+        """
+        Receive and dispatch command acknowledgements and status messages.
+
+        :return: nothing
+        """
+        while self.running:
+            try:
+                data = self.sock.recv(VNODE_MSGSIZMAX)
+            except OSError:
+                data = b""
+            if not data:
+                break
+            try:
+                msg_type, tlvs = unpack_message(data)
+                cmdid = _INT32.unpack(tlvs[VNODE_TLV_CMDID])[0]
+            except (struct.error, KeyError):
+                logging.error("invalid message on channel: %s", self.ctrlchnlname)
+                continue
+            with self.lock:
+                command = self.commands.get(cmdid)
+                if command is None:
+                    continue
+                if msg_type == VNODE_MSG_CMDREQACK:
+                    command.pid = _INT32.unpack(tlvs[VNODE_TLV_CMDPID])[0]
+                    if command.pid == -1:
+                        self.commands.pop(cmdid)
+                        command.complete(-1)
+                elif msg_type == VNODE_MSG_CMDSTATUS:
+                    self.commands.pop(cmdid)
+                    command.complete(_INT32.unpack(tlvs[VNODE_TLV_CMDSTATUS])[0])
+
+        # channel is gone, fail anything still outstanding
+        with self.lock:
+            self.running = False
+            commands = list(self.commands.values())
+            self.commands.clear()
+        for command in commands:
+            command.complete(-1)
+
+    def connected(self):
+        """
+        Check if the channel is still connected.
+
+        :return: True if connected, False otherwise
+        :rtype: bool
+        """
+        return self.running
+
+    def close(self):
+        """
+        Close the channel connection.
+
+        :return: nothing
+        """
+        self.running = False
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def request(self, args, infd, outfd, errfd):
+        """
+        Send a command request to run within the node, passing along the file
+        descriptors to use for its stdin, stdout, and stderr.
+
+        :param list[str] args: command arguments
+        :param int infd: stdin file descriptor
+        :param int outfd: stdout file descriptor
+        :param int errfd: stderr file descriptor
+        :return: command request
+        :rtype: VnodeCommand
+        :raises IOError: when the request could not be sent
+        """
+        with self.lock:
+            if not self.running:
+                raise IOError(f"channel not connected: {self.ctrlchnlname}")
+            self.cmdid += 1
+            command = VnodeCommand(self.cmdid)
+            tlvs = [(VNODE_TLV_CMDID, _INT32.pack(command.cmdid))]
+            for arg in args:
+                tlvs.append((VNODE_TLV_CMDARG, arg.encode("utf-8") + b"\0"))
+            message = pack_message(VNODE_MSG_CMDREQ, tlvs)
+            fds = array.array("i", [infd, outfd, errfd])
+            ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, fds)]
+            self.commands[command.cmdid] = command
+            try:
+                self.sock.sendmsg([message], ancillary)
+            except OSError:
+                self.commands.pop(command.cmdid)
+                raise
+        return command
+
+
+def _read_pipes(outfd, errfd):
+    """
+    Read both output pipes until they are closed.
+
+    :param int outfd: stdout read file descriptor
+    :param int errfd: stderr read file descriptor
+    :return: stdout and stderr bytes
+    :rtype: tuple
+    """
+    output = {outfd: [], errfd: []}
+    with selectors.DefaultSelector() as selector:
+        selector.register(outfd, selectors.EVENT_READ)
+        selector.register(errfd, selectors.EVENT_READ)
+        open_fds = 2
+        while open_fds:
+            for key, _ in selector.select():
+                data = os.read(key.fd, 65536)
+                if data:
+                    output[key.fd].append(data)
+                else:
+                    selector.unregister(key.fd)
+                    open_fds -= 1
+    return b"".join(output[outfd]), b"".join(output[errfd])
 
 
 class VnodeClient:
@@ -13,15 +261,20 @@ class VnodeClient:
     Provides client functionality for interacting with a virtual node.
     """
 
-    def __init__(self, name, ctrlchnlname):
+    def __init__(self, name, ctrlchnlname, persistent=False):
         """
         Create a VnodeClient instance.
 
         :param str name: name for client
         :param str ctrlchnlname: control channel name
+        :param bool persistent: True to keep a channel open to run commands over,
+            False to run each command using a new vcmd process
         """
         self.name = name
         self.ctrlchnlname = ctrlchnlname
+        self.channel = None
+        if persistent:
+            self.channel = VnodeChannel(ctrlchnlname)
 
     def _verify_connection(self):
         """
@@ -40,7 +293,9 @@ class VnodeClient:
         :return: True if connected, False otherwise
         :rtype: bool
         """
-        return True
+        if self.channel is None:
+            return True
+        return self.channel.connected()
 
     def close(self):
         """
@@ -48,7 +303,8 @@ class VnodeClient:
 
         :return: nothing
         """
-        pass
+        if self.channel is not None:
+            self.channel.close()
 
     def create_cmd(self, args):
         return f"{VCMD_BIN} -c {self.ctrlchnlname} -- {args}"
@@ -65,5 +321,58 @@ class VnodeClient:
         :raises core.CoreCommandError: when there is a non-zero exit status
         """
         self._verify_connection()
+        if self.channel is not None:
+            return self._channel_cmd(args, wait, shell)
         args = self.create_cmd(args)
         return utils.cmd(args, wait=wait, shell=shell)
+
+    def _channel_cmd(self, args, wait, shell):
+        """
+        Run command over the persistent control channel.
+
+        :param str args: command to run
+        :param bool wait: True to wait for command status, False otherwise
+        :param bool shell: True to use shell, False otherwise
+        :return: stdout output
+        :rtype: str
+        :raises core.CoreCommandError: when there is a non-zero exit status
+        """
+        logging.debug("node(%s) channel command wait(%s): %s", self.name, wait, args)
+        if shell:
+            args = ["/bin/sh", "-c", args]
+        else:
+            args = shlex.split(args)
+
+        infd = os.open(os.devnull, os.O_RDONLY)
+        if not wait:
+            devnull = utils.DEVNULL.fileno()
+            try:
+                self.channel.request(args, infd, devnull, devnull)
+            except OSError:
+                raise CoreCommandError(-1, args)
+            finally:
+                os.close(infd)
+            return ""
+
+        outr, outw = os.pipe()
+        errr, errw = os.pipe()
+        try:
+            try:
+                command = self.channel.request(args, infd, outw, errw)
+            finally:
+                # vnoded holds its own copies now, close ours to see eof
+                os.close(infd)
+                os.close(outw)
+                os.close(errw)
+            stdout, stderr = _read_pipes(outr, errr)
+        except OSError:
+            raise CoreCommandError(-1, args)
+        finally:
+            os.close(outr)
+            os.close(errr)
+
+        command.done.wait()
+        status = exit_status(command.status)
+        if status != 0:
+            raise CoreCommandError(status, args, stdout, stderr)
+        return stdout.decode("utf-8").strip()
@@ -48,7 +48,8 @@ class CoreInterface:
         self.flow_id = None
         self.server = server
         use_ovs = session.options.get_config("ovs") == "True"
-        self.net_client = get_net_client(use_ovs, self.host_cmd)
+        use_netlink = server is None and session.options.get_config("netlink") == "True"
+        self.net_client = get_net_client(use_ovs, self.host_cmd, use_netlink)
 
     def host_cmd(self, args, env=None, cwd=None, wait=True, shell=False):
         """
@@ -245,8 +246,9 @@ class Veth(CoreInterface):
         :return: nothing
         :raises CoreCommandError: when there is a command exception
         """
-        self.net_client.create_veth(self.localname, self.name)
-        self.net_client.device_up(self.localname)
+        with self.net_client.batch():
+            self.net_client.create_veth(self.localname, self.name)
+            self.net_client.device_up(self.localname)
         self.up = True
 
     def shutdown(self):
@@ -361,6 +363,26 @@ class TunTap(CoreInterface):
 
         return result
 
+    def waitfordevice(self, name, pid, func):
+        """
+        Wait for a device to exist, woken by the session link waiter as soon as
+        it appears, falling back to polling with func() when netlink is not
+        available.
+
+        :param str name: device name
+        :param int pid: pid of the process whose network namespace the device will
+            appear in, None for the host namespace
+        :param func: function to poll for a result of zero
+        :return: True if wait succeeded, False otherwise
+        :rtype: bool
+        """
+        if self.server is None:
+            try:
+                return self.session.link_waiter.wait(name, pid)
+            except OSError:
+                logging.exception("error waiting for device %s, polling instead", name)
+        return self.waitfor(func)
+
     def waitfordevicelocal(self):
         """
         Check for presence of a local device - tap device may not
@@ -378,7 +400,7 @@ class TunTap(CoreInterface):
             except CoreCommandError:
                 return 1
 
-        self.waitfor(localdevexists)
+        self.waitfordevice(self.localname, None, localdevexists)
 
     def waitfordevicenode(self):
         """
@@ -397,7 +419,7 @@ class TunTap(CoreInterface):
 
         count = 0
         while True:
-            result = self.waitfor(nodedevexists)
+            result = self.waitfordevice(self.name, self.node.pid, nodedevexists)
             if result:
                 break
 
@@ -424,8 +446,9 @@ class TunTap(CoreInterface):
         self.waitfordevicelocal()
         netns = str(self.node.pid)
         self.net_client.device_ns(self.localname, netns)
-        self.node.node_net_client.device_name(self.localname, self.name)
-        self.node.node_net_client.device_up(self.name)
+        with self.node.node_net_client.batch():
+            self.node.node_net_client.device_name(self.localname, self.name)
+            self.node.node_net_client.device_up(self.name)
 
     def setaddrs(self):
         """
@@ -434,8 +457,9 @@ class TunTap(CoreInterface):
         :return: nothing
         """
         self.waitfordevicenode()
-        for addr in self.addrlist:
-            self.node.node_net_client.create_address(self.name, str(addr))
+        with self.node.node_net_client.batch():
+            for addr in self.addrlist:
+                self.node.node_net_client.create_address(self.name, str(addr))
 
 
 class GreTap(CoreInterface):
@@ -492,8 +516,9 @@ class GreTap(CoreInterface):
         if remoteip is None:
             raise ValueError("missing remote IP required for GRE TAP device")
 
-        self.net_client.create_gretap(self.localname, remoteip, localip, ttl, key)
-        self.net_client.device_up(self.localname)
+        with self.net_client.batch():
+            self.net_client.create_gretap(self.localname, remoteip, localip, ttl, key)
+            self.net_client.device_up(self.localname)
         self.up = True
 
     def shutdown(self):
@@ -504,8 +529,9 @@ class GreTap(CoreInterface):
         """
         if self.localname:
             try:
-                self.net_client.device_down(self.localname)
-                self.net_client.delete_device(self.localname)
+                with self.net_client.batch():
+                    self.net_client.device_down(self.localname)
+                    self.net_client.delete_device(self.localname)
             except CoreCommandError:
                 logging.exception("error during shutdown")
 
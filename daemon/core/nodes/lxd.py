@@ -149,6 +149,17 @@ class LxcNode(CoreNode):
         args = f"mkdir -p {path}"
         return self.cmd(args)
 
+    def privatedir_cmd(self, path):
+        """
+        Command creating a private directory, to run within the node along with
+        other commands.
+
+        :param str path: path to create
+        :return: command to run within the node
+        :rtype: str
+        """
+        return f"mkdir -p {path}"
+
     def mount(self, source, target):
         """
         Create and mount a directory.
@@ -1,20 +1,48 @@
 """
 Clients for dealing with bridge/interface commands.
 """
+import array
+import fcntl
+import ipaddress
+import itertools
 import json
+import logging
+import re
+import socket
+import struct
+import threading
+from contextlib import contextmanager
 
 from core.constants import ETHTOOL_BIN, IP_BIN, OVS_BIN, TC_BIN
+from core.errors import CoreCommandError
+from core.nodes import netlink
 
+_IP_BATCH_ERROR = re.compile(r"Command failed -:(\d+)")
 
-def get_net_client(use_ovs, run):
+# ethtool ioctl values, see linux/sockios.h and linux/ethtool.h
+SIOCETHTOOL = 0x8946
+ETHTOOL_SRXCSUM = 0x15
+ETHTOOL_STXCSUM = 0x17
+
+
+def get_net_client(use_ovs, run, use_netlink=False, netns=None):
     """
     Retrieve desired net client for running network commands.
 
     :param bool use_ovs: True for OVS bridges, False for Linux bridges
     :param func run: function used to run net client commands
+    :param bool use_netlink: True to configure links, addresses, and routes over
+        netlink sockets, False to use ip commands, only valid for the local host
+    :param func netns: function returning the pid of the process whose network
+        namespace netlink operations apply to, None for the host namespace
     :return: net client class
     """
-    if use_ovs:
+    if use_netlink:
+        if use_ovs:
+            return OvsNetlinkNetClient(run, netns)
+        else:
+            return NetlinkNetClient(run, netns)
+    elif use_ovs:
         return OvsNetClient(run)
     else:
         return LinuxNetClient(run)
@@ -32,6 +60,134 @@ class LinuxNetClient:
         :param run: function to run commands with
         """
         self.run = run
+        self._local = threading.local()
+
+    def close(self):
+        """
+        Release any resources held by the client.
+
+        :return: nothing
+        """
+        pass
+
+    @contextmanager
+    def batch(self):
+        """
+        Context for accumulating network operations and running them together, as
+        a single "ip -batch" for ip commands and a single chained ovs-vsctl for
+        ovs commands, when leaving the context. Operations that return output, or
+        are not ip/ovs commands, flush pending operations first so ordering is
+        kept. Nested contexts join the outermost one.
+
+        :return: nothing
+        :raises CoreCommandError: when a batched operation fails, reporting the
+            failing operation
+        """
+        if self._pending() is not None:
+            yield self
+            return
+        self._local.pending = []
+        try:
+            yield self
+        except Exception:
+            # run what would have already ran, without masking the error
+            try:
+                self.flush()
+            except CoreCommandError:
+                logging.exception("error flushing net client batch")
+            raise
+        else:
+            self.flush()
+        finally:
+            self._local.pending = None
+
+    def _pending(self):
+        """
+        Retrieve the pending batch operations for the current thread.
+
+        :return: pending operations, None when not batching
+        :rtype: list[tuple]
+        """
+        return getattr(self._local, "pending", None)
+
+    def flush(self):
+        """
+        Run all pending batch operations, grouping consecutive operations for the
+        same binary into a single command.
+
+        :return: nothing
+        :raises CoreCommandError: when a batched operation fails
+        """
+        pending = self._pending()
+        if not pending:
+            return
+        self._local.pending = []
+        for binary, group in itertools.groupby(pending, key=lambda x: x[0]):
+            self._run_batch(binary, [args for _, args in group])
+
+    def _run_batch(self, binary, cmds):
+        """
+        Run a group of commands for the same binary.
+
+        :param str binary: binary the commands are for
+        :param list[str] cmds: command arguments
+        :return: nothing
+        :raises CoreCommandError: when a command fails
+        """
+        if len(cmds) == 1:
+            self.run(f"{binary} {cmds[0]}")
+            return
+        lines = "\n".join(cmds)
+        try:
+            self.run(f"{binary} -batch - <<'EOF'\n{lines}\nEOF", shell=True)
+        except CoreCommandError as e:
+            stderr = e.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode("utf-8", "ignore")
+            result = _IP_BATCH_ERROR.search(stderr or "")
+            if result is None:
+                raise
+            failed = cmds[int(result.group(1)) - 1]
+            raise CoreCommandError(
+                e.returncode, f"{binary} {failed}", e.output, e.stderr
+            )
+
+    def _queue(self, binary, args):
+        """
+        Run a command, or add it to the pending batch when batching.
+
+        :param str binary: binary to run
+        :param str args: arguments for binary
+        :return: nothing
+        """
+        pending = self._pending()
+        if pending is None:
+            self.run(f"{binary} {args}")
+        else:
+            pending.append((binary, args))
+
+    def _ip(self, args):
+        """
+        Run or batch an ip command.
+
+        :param str args: ip command arguments
+        :return: nothing
+        """
+        self._queue(IP_BIN, args)
+
+    def _run(self, args, shell=False):
+        """
+        Run a command immediately, after any pending batch operations.
+
+        :param str args: command to run
+        :param bool shell: True to use shell, False otherwise
+        :return: command output
+        :rtype: str
+        """
+        self.flush()
+        if shell:
+            return self.run(args, shell=True)
+        return self.run(args)
 
     def set_hostname(self, name):
         """
@@ -40,7 +196,7 @@ class LinuxNetClient:
         :param str name: name for hostname
         :return: nothing
         """
-        self.run(f"hostname {name}")
+        self._run(f"hostname {name}")
 
     def create_route(self, route, device):
         """
@@ -50,7 +206,7 @@ class LinuxNetClient:
         :param str device: device to add route to
         :return: nothing
         """
-        self.run(f"{IP_BIN} route add {route} dev {device}")
+        self._ip(f"route add {route} dev {device}")
 
     def device_up(self, device):
         """
@@ -59,7 +215,7 @@ class LinuxNetClient:
         :param str device: device to bring up
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set {device} up")
+        self._ip(f"link set {device} up")
 
     def device_down(self, device):
         """
@@ -68,7 +224,7 @@ class LinuxNetClient:
         :param str device: device to bring down
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set {device} down")
+        self._ip(f"link set {device} down")
 
     def device_name(self, device, name):
         """
@@ -78,7 +234,7 @@ class LinuxNetClient:
         :param str name: name to set
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set {device} name {name}")
+        self._ip(f"link set {device} name {name}")
 
     def device_show(self, device):
         """
@@ -88,7 +244,7 @@ class LinuxNetClient:
         :return: device information
         :rtype: str
         """
-        return self.run(f"{IP_BIN} link show {device}")
+        return self._run(f"{IP_BIN} link show {device}")
 
     def get_mac(self, device):
         """
@@ -98,7 +254,7 @@ class LinuxNetClient:
         :return: MAC address
         :rtype: str
         """
-        return self.run(f"cat /sys/class/net/{device}/address")
+        return self._run(f"cat /sys/class/net/{device}/address")
 
     def get_ifindex(self, device):
         """
@@ -108,7 +264,7 @@ class LinuxNetClient:
         :return: ifindex
         :rtype: str
         """
-        return self.run(f"cat /sys/class/net/{device}/ifindex")
+        return self._run(f"cat /sys/class/net/{device}/ifindex")
 
     def device_ns(self, device, namespace):
         """
@@ -118,7 +274,7 @@ class LinuxNetClient:
         :param str namespace: namespace to set device to
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set {device} netns {namespace}")
+        self._ip(f"link set {device} netns {namespace}")
 
     def device_flush(self, device):
         """
@@ -127,7 +283,7 @@ class LinuxNetClient:
         :param str device: device to flush
         :return: nothing
         """
-        self.run(
+        self._run(
             f"[ -e /sys/class/net/{device} ] && {IP_BIN} -6 address flush dev {device} || true",
             shell=True,
         )
@@ -140,7 +296,17 @@ class LinuxNetClient:
         :param str mac: mac to set
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set dev {device} address {mac}")
+        self._ip(f"link set dev {device} address {mac}")
+
+    def device_mtu(self, device, mtu):
+        """
+        Set MTU for a device.
+
+        :param str device: device to set mtu for
+        :param int mtu: mtu to set
+        :return: nothing
+        """
+        self._ip(f"link set dev {device} mtu {mtu}")
 
     def delete_device(self, device):
         """
@@ -149,7 +315,7 @@ class LinuxNetClient:
         :param str device: device to delete
         :return: nothing
         """
-        self.run(f"{IP_BIN} link delete {device}")
+        self._ip(f"link delete {device}")
 
     def delete_tc(self, device):
         """
@@ -158,7 +324,7 @@ class LinuxNetClient:
         :param str device: device to remove tc
         :return: nothing
         """
-        self.run(f"{TC_BIN} qdisc delete dev {device} root")
+        self._run(f"{TC_BIN} qdisc delete dev {device} root")
 
     def checksums_off(self, interface_name):
         """
@@ -167,7 +333,7 @@ class LinuxNetClient:
         :param str interface_name: interface to update
         :return: nothing
         """
-        self.run(f"{ETHTOOL_BIN} -K {interface_name} rx off tx off")
+        self._run(f"{ETHTOOL_BIN} -K {interface_name} rx off tx off")
 
     def create_address(self, device, address, broadcast=None):
         """
@@ -179,11 +345,9 @@ class LinuxNetClient:
         :return: nothing
         """
         if broadcast is not None:
-            self.run(
-                f"{IP_BIN} address add {address} broadcast {broadcast} dev {device}"
-            )
+            self._ip(f"address add {address} broadcast {broadcast} dev {device}")
         else:
-            self.run(f"{IP_BIN} address add {address} dev {device}")
+            self._ip(f"address add {address} dev {device}")
 
     def delete_address(self, device, address):
         """
@@ -193,7 +357,7 @@ class LinuxNetClient:
         :param str address: address to remove
         :return: nothing
         """
-        self.run(f"{IP_BIN} address delete {address} dev {device}")
+        self._ip(f"address delete {address} dev {device}")
 
     def create_veth(self, name, peer):
         """
@@ -203,7 +367,7 @@ class LinuxNetClient:
         :param str peer: peer name
         :return: nothing
         """
-        self.run(f"{IP_BIN} link add name {name} type veth peer name {peer}")
+        self._ip(f"link add name {name} type veth peer name {peer}")
 
     def create_gretap(self, device, address, local, ttl, key):
         """
@@ -216,14 +380,14 @@ class LinuxNetClient:
         :param int key: key for tap
         :return: nothing
         """
-        cmd = f"{IP_BIN} link add {device} type gretap remote {address}"
+        args = f"link add {device} type gretap remote {address}"
         if local is not None:
-            cmd += f" local {local}"
+            args += f" local {local}"
         if ttl is not None:
-            cmd += f" ttl {ttl}"
+            args += f" ttl {ttl}"
         if key is not None:
-            cmd += f" key {key}"
-        self.run(cmd)
+            args += f" key {key}"
+        self._ip(args)
 
     def create_bridge(self, name):
         """
@@ -232,11 +396,12 @@ class LinuxNetClient:
         :param str name: bridge name
         :return: nothing
         """
-        self.run(f"{IP_BIN} link add name {name} type bridge")
-        self.run(f"{IP_BIN} link set {name} type bridge stp_state 0")
-        self.run(f"{IP_BIN} link set {name} type bridge forward_delay 0")
-        self.run(f"{IP_BIN} link set {name} type bridge mcast_snooping 0")
-        self.device_up(name)
+        with self.batch():
+            self._ip(f"link add name {name} type bridge")
+            self._ip(f"link set {name} type bridge stp_state 0")
+            self._ip(f"link set {name} type bridge forward_delay 0")
+            self._ip(f"link set {name} type bridge mcast_snooping 0")
+            self.device_up(name)
 
     def delete_bridge(self, name):
         """
@@ -245,8 +410,9 @@ class LinuxNetClient:
         :param str name: bridge name
         :return: nothing
         """
-        self.device_down(name)
-        self.run(f"{IP_BIN} link delete {name} type bridge")
+        with self.batch():
+            self.device_down(name)
+            self._ip(f"link delete {name} type bridge")
 
     def create_interface(self, bridge_name, interface_name):
         """
@@ -256,8 +422,9 @@ class LinuxNetClient:
         :param str interface_name: interface name
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set dev {interface_name} master {bridge_name}")
-        self.device_up(interface_name)
+        with self.batch():
+            self._ip(f"link set dev {interface_name} master {bridge_name}")
+            self.device_up(interface_name)
 
     def delete_interface(self, bridge_name, interface_name):
         """
@@ -267,7 +434,7 @@ class LinuxNetClient:
         :param str interface_name: interface name
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set dev {interface_name} nomaster")
+        self._ip(f"link set dev {interface_name} nomaster")
 
     def existing_bridges(self, _id):
         """
@@ -275,7 +442,7 @@ class LinuxNetClient:
 
         :param _id: node id to check bridges for
         """
-        output = self.run(f"{IP_BIN} -j link show type bridge")
+        output = self._run(f"{IP_BIN} -j link show type bridge")
         bridges = json.loads(output)
         for bridge in bridges:
             name = bridge["ifname"]
@@ -293,7 +460,7 @@ class LinuxNetClient:
         :param str name: bridge name
         :return: nothing
         """
-        self.run(f"{IP_BIN} link set {name} type bridge ageing_time 0")
+        self._ip(f"link set {name} type bridge ageing_time 0")
 
 
 class OvsNetClient(LinuxNetClient):
@@ -301,6 +468,31 @@ class OvsNetClient(LinuxNetClient):
     Client for creating OVS bridges and ip interfaces for nodes.
     """
 
+    def _run_batch(self, binary, cmds):
+        """
+        Run a group of commands for the same binary, chaining ovs-vsctl commands
+        with "--" into a single transaction.
+
+        :param str binary: binary the commands are for
+        :param list[str] cmds: command arguments
+        :return: nothing
+        :raises CoreCommandError: when a command fails, ovs-vsctl transactions
+            are atomic so a failure means none of the chained commands applied
+        """
+        if binary != OVS_BIN or len(cmds) == 1:
+            super()._run_batch(binary, cmds)
+            return
+        self.run(f"{OVS_BIN} " + " -- ".join(cmds))
+
+    def _ovs(self, args):
+        """
+        Run or batch an ovs-vsctl command.
+
+        :param str args: ovs-vsctl command arguments
+        :return: nothing
+        """
+        self._queue(OVS_BIN, args)
+
     def create_bridge(self, name):
         """
         Create a OVS bridge and bring it up.
@@ -308,11 +500,12 @@ class OvsNetClient(LinuxNetClient):
         :param str name: bridge name
         :return: nothing
         """
-        self.run(f"{OVS_BIN} add-br {name}")
-        self.run(f"{OVS_BIN} set bridge {name} stp_enable=false")
-        self.run(f"{OVS_BIN} set bridge {name} other_config:stp-max-age=6")
-        self.run(f"{OVS_BIN} set bridge {name} other_config:stp-forward-delay=4")
-        self.device_up(name)
+        with self.batch():
+            self._ovs(f"add-br {name}")
+            self._ovs(f"set bridge {name} stp_enable=false")
+            self._ovs(f"set bridge {name} other_config:stp-max-age=6")
+            self._ovs(f"set bridge {name} other_config:stp-forward-delay=4")
+            self.device_up(name)
 
     def delete_bridge(self, name):
         """
@@ -321,8 +514,9 @@ class OvsNetClient(LinuxNetClient):
         :param str name: bridge name
         :return: nothing
         """
-        self.device_down(name)
-        self.run(f"{OVS_BIN} del-br {name}")
+        with self.batch():
+            self.device_down(name)
+            self._ovs(f"del-br {name}")
 
     def create_interface(self, bridge_name, interface_name):
         """
@@ -332,8 +526,9 @@ class OvsNetClient(LinuxNetClient):
         :param str interface_name: interface name
         :return: nothing
         """
-        self.run(f"{OVS_BIN} add-port {bridge_name} {interface_name}")
-        self.device_up(interface_name)
+        with self.batch():
+            self._ovs(f"add-port {bridge_name} {interface_name}")
+            self.device_up(interface_name)
 
     def delete_interface(self, bridge_name, interface_name):
         """
@@ -343,7 +538,7 @@ class OvsNetClient(LinuxNetClient):
         :param str interface_name: interface name
         :return: nothing
         """
-        self.run(f"{OVS_BIN} del-port {bridge_name} {interface_name}")
+        self._ovs(f"del-port {bridge_name} {interface_name}")
 
     def existing_bridges(self, _id):
         """
@@ -351,7 +546,7 @@ class OvsNetClient(LinuxNetClient):
 
         :param _id: node id to check bridges for
         """
-        output = self.run(f"{OVS_BIN} list-br")
+        output = self._run(f"{OVS_BIN} list-br")
         if output:
             for line in output.split("\n"):
                 fields = line.split(".")
@@ -366,4 +561,570 @@ class OvsNetClient(LinuxNetClient):
         :param str name: bridge name
         :return: nothing
         """
-        self.run(f"{OVS_BIN} set bridge {name} other_config:mac-aging-time=0")
+        self._ovs(f"set bridge {name} other_config:mac-aging-time=0")
+
+
+class NetlinkNetClient(LinuxNetClient):
+    """
+    Client for creating Linux bridges and ip interfaces for nodes, talking
+    rtnetlink directly rather than running an ip process per operation. Only
+    usable for the local host, commands not covered by netlink still use the
+    provided run function.
+    """
+
+    # host namespace socket shared by all clients, avoiding a socket per interface
+    _host_socket = None
+    _host_lock = threading.Lock()
+
+    def __init__(self, run, netns=None):
+        """
+        Create NetlinkNetClient instance.
+
+        :param run: function to run commands with
+        :param func netns: function returning the pid of the process whose network
+            namespace to operate in, None for the host namespace
+        """
+        super().__init__(run)
+        self.netns = netns
+        self._socket = None
+        self._socket_lock = threading.Lock()
+
+    def _pid(self):
+        if self.netns is None:
+            return None
+        return self.netns()
+
+    def _netlink(self):
+        """
+        Retrieve the netlink socket for the current namespace, creating it when
+        needed, such as after a node restart.
+
+        :return: netlink socket
+        :rtype: core.nodes.netlink.NetlinkSocket
+        """
+        pid = self._pid()
+        if pid is None:
+            with NetlinkNetClient._host_lock:
+                if NetlinkNetClient._host_socket is None:
+                    NetlinkNetClient._host_socket = netlink.NetlinkSocket()
+                return NetlinkNetClient._host_socket
+        with self._socket_lock:
+            if self._socket is None or self._socket.pid != pid:
+                if self._socket is not None:
+                    self._socket.close()
+                self._socket = netlink.NetlinkSocket(pid)
+            return self._socket
+
+    def close(self):
+        """
+        Close the namespace netlink socket, when open, which would otherwise keep
+        the namespace alive.
+
+        :return: nothing
+        """
+        with self._socket_lock:
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+
+    def _request(self, description, msg_type, payload, flags=0):
+        """
+        Run a netlink request, after any pending batch operations.
+
+        :param str description: description of the operation, used for errors
+        :param int msg_type: message type
+        :param bytes payload: message payload
+        :param int flags: additional message flags
+        :return: response messages
+        :rtype: list[tuple]
+        :raises CoreCommandError: when the request fails
+        """
+        self.flush()
+        try:
+            return self._netlink().request(msg_type, payload, flags)
+        except OSError as e:
+            raise CoreCommandError(e.errno or -1, description, "", e.strerror)
+
+    def _link(self, description, device, *attrs, index=0, flags=0, change=0):
+        """
+        Change an existing link.
+
+        :param str description: description of the operation, used for errors
+        :param str device: device to change, identified by name when there is no
+            index
+        :param bytes attrs: packed link attributes to set
+        :param int index: device index
+        :param int flags: link flags
+        :param int change: link flags mask to change
+        :return: nothing
+        :raises CoreCommandError: when the request fails
+        """
+        payload = netlink.ifinfomsg(index, flags, change)
+        if not index:
+            payload += netlink.pack_string(netlink.IFLA_IFNAME, device)
+        payload += b"".join(attrs)
+        self._request(description, netlink.RTM_NEWLINK, payload)
+
+    def _new_link(self, description, name, kind, *data, flags=0, change=0):
+        """
+        Create a new link.
+
+        :param str description: description of the operation, used for errors
+        :param str name: link name
+        :param str kind: link kind
+        :param bytes data: packed kind specific attributes
+        :param int flags: link flags
+        :param int change: link flags mask to change
+        :return: nothing
+        :raises CoreCommandError: when the request fails
+        """
+        linkinfo = [netlink.pack_string(netlink.IFLA_INFO_KIND, kind)]
+        if data:
+            linkinfo.append(netlink.pack_nested(netlink.IFLA_INFO_DATA, *data))
+        payload = (
+            netlink.ifinfomsg(flags=flags, change=change)
+            + netlink.pack_string(netlink.IFLA_IFNAME, name)
+            + netlink.pack_nested(netlink.IFLA_LINKINFO, *linkinfo)
+        )
+        flags = netlink.NLM_F_CREATE | netlink.NLM_F_EXCL
+        self._request(description, netlink.RTM_NEWLINK, payload, flags)
+
+    def _get_link(self, device):
+        """
+        Retrieve the index and attributes for a device.
+
+        :param str device: device to get
+        :return: device index and dict of link attributes
+        :rtype: tuple
+        :raises CoreCommandError: when the device does not exist
+        """
+        payload = netlink.ifinfomsg() + netlink.pack_string(netlink.IFLA_IFNAME, device)
+        responses = self._request(
+            f"{IP_BIN} link show {device}", netlink.RTM_GETLINK, payload
+        )
+        _, data = responses[0]
+        index = netlink.IFINFOMSG.unpack_from(data)[2]
+        return index, netlink.unpack_attrs(data, netlink.IFINFOMSG.size)
+
+    def _index(self, device):
+        index, _ = self._get_link(device)
+        return index
+
+    def _address_payload(self, device, address, broadcast=None):
+        """
+        Create the payload for address messages.
+
+        :param str device: device address belongs to
+        :param str address: address with prefix
+        :param str broadcast: broadcast address, "+" to derive from the prefix
+        :return: packed payload
+        :rtype: bytes
+        """
+        interface = ipaddress.ip_interface(address)
+        family = socket.AF_INET if interface.version == 4 else socket.AF_INET6
+        packed = interface.ip.packed
+        payload = netlink.IFADDRMSG.pack(
+            family, interface.network.prefixlen, 0, 0, self._index(device)
+        )
+        payload += netlink.pack_attr(netlink.IFA_LOCAL, packed)
+        payload += netlink.pack_attr(netlink.IFA_ADDRESS, packed)
+        if broadcast == "+":
+            broadcast = str(interface.network.broadcast_address)
+        if broadcast is not None:
+            broadcast = ipaddress.ip_address(broadcast).packed
+            payload += netlink.pack_attr(netlink.IFA_BROADCAST, broadcast)
+        return payload
+
+    def create_route(self, route, device):
+        """
+        Create a new route for a device.
+
+        :param str route: route to create
+        :param str device: device to add route to
+        :return: nothing
+        """
+        if route == "default":
+            route = "0.0.0.0/0"
+        network = ipaddress.ip_network(route, strict=False)
+        if network.version == 4:
+            family, scope = socket.AF_INET, netlink.RT_SCOPE_LINK
+        else:
+            family, scope = socket.AF_INET6, netlink.RT_SCOPE_UNIVERSE
+        payload = netlink.RTMSG.pack(
+            family,
+            network.prefixlen,
+            0,
+            0,
+            netlink.RT_TABLE_MAIN,
+            netlink.RTPROT_BOOT,
+            scope,
+            netlink.RTN_UNICAST,
+            0,
+        )
+        if network.prefixlen:
+            payload += netlink.pack_attr(
+                netlink.RTA_DST, network.network_address.packed
+            )
+        payload += netlink.pack_u32(netlink.RTA_OIF, self._index(device))
+        flags = netlink.NLM_F_CREATE | netlink.NLM_F_EXCL
+        self._request(
+            f"{IP_BIN} route add {route} dev {device}",
+            netlink.RTM_NEWROUTE,
+            payload,
+            flags,
+        )
+
+    def device_up(self, device):
+        """
+        Bring a device up.
+
+        :param str device: device to bring up
+        :return: nothing
+        """
+        self._link(
+            f"{IP_BIN} link set {device} up",
+            device,
+            flags=netlink.IFF_UP,
+            change=netlink.IFF_UP,
+        )
+
+    def device_down(self, device):
+        """
+        Bring a device down.
+
+        :param str device: device to bring down
+        :return: nothing
+        """
+        self._link(f"{IP_BIN} link set {device} down", device, change=netlink.IFF_UP)
+
+    def device_name(self, device, name):
+        """
+        Set a device name.
+
+        :param str device: device to set name for
+        :param str name: name to set
+        :return: nothing
+        """
+        self._link(
+            f"{IP_BIN} link set {device} name {name}",
+            device,
+            netlink.pack_string(netlink.IFLA_IFNAME, name),
+            index=self._index(device),
+        )
+
+    def get_mac(self, device):
+        """
+        Retrieve MAC address for a given device.
+
+        :param str device: device to get mac for
+        :return: MAC address
+        :rtype: str
+        """
+        _, attrs = self._get_link(device)
+        return ":".join(f"{x:02x}" for x in attrs.get(netlink.IFLA_ADDRESS, b""))
+
+    def get_ifindex(self, device):
+        """
+        Retrieve ifindex for a given device.
+
+        :param str device: device to get ifindex for
+        :return: ifindex
+        :rtype: str
+        """
+        return str(self._index(device))
+
+    def device_ns(self, device, namespace):
+        """
+        Set netns for a device.
+
+        :param str device: device to setns for
+        :param str namespace: pid of the process whose namespace to set device to
+        :return: nothing
+        """
+        self._link(
+            f"{IP_BIN} link set {device} netns {namespace}",
+            device,
+            netlink.pack_u32(netlink.IFLA_NET_NS_PID, int(namespace)),
+        )
+
+    def device_flush(self, device):
+        """
+        Flush device ipv6 addresses.
+
+        :param str device: device to flush
+        :return: nothing
+        """
+        try:
+            index = self._index(device)
+        except CoreCommandError:
+            return
+        payload = netlink.IFADDRMSG.pack(socket.AF_INET6, 0, 0, 0, 0)
+        responses = self._request(
+            f"{IP_BIN} -6 address show dev {device}",
+            netlink.RTM_GETADDR,
+            payload,
+            netlink.NLM_F_DUMP,
+        )
+        for _, data in responses:
+            if netlink.IFADDRMSG.unpack_from(data)[4] != index:
+                continue
+            self._request(
+                f"{IP_BIN} -6 address flush dev {device}", netlink.RTM_DELADDR, data
+            )
+
+    def device_mac(self, device, mac):
+        """
+        Set MAC address for a device.
+
+        :param str device: device to set mac for
+        :param str mac: mac to set
+        :return: nothing
+        """
+        value = bytes(int(x, 16) for x in mac.split(":"))
+        self._link(
+            f"{IP_BIN} link set dev {device} address {mac}",
+            device,
+            netlink.pack_attr(netlink.IFLA_ADDRESS, value),
+        )
+
+    def device_mtu(self, device, mtu):
+        """
+        Set MTU for a device.
+
+        :param str device: device to set mtu for
+        :param int mtu: mtu to set
+        :return: nothing
+        """
+        self._link(
+            f"{IP_BIN} link set dev {device} mtu {mtu}",
+            device,
+            netlink.pack_u32(netlink.IFLA_MTU, mtu),
+        )
+
+    def delete_device(self, device):
+        """
+        Delete device.
+
+        :param str device: device to delete
+        :return: nothing
+        """
+        payload = netlink.ifinfomsg() + netlink.pack_string(netlink.IFLA_IFNAME, device)
+        self._request(f"{IP_BIN} link delete {device}", netlink.RTM_DELLINK, payload)
+
+    def checksums_off(self, interface_name):
+        """
+        Turns interface checksums off, using the ethtool ioctl.
+
+        :param str interface_name: interface to update
+        :return: nothing
+        """
+        self.flush()
+        description = f"{ETHTOOL_BIN} -K {interface_name} rx off tx off"
+        try:
+            sock = netlink.netns_call(
+                self._pid(), lambda: socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            )
+        except OSError as e:
+            raise CoreCommandError(e.errno or -1, description, "", e.strerror)
+        with sock:
+            for cmd in (ETHTOOL_SRXCSUM, ETHTOOL_STXCSUM):
+                value = array.array("I", [cmd, 0])
+                address, _ = value.buffer_info()
+                ifreq = struct.pack("16sP", interface_name.encode("utf-8"), address)
+                ifreq = ifreq.ljust(40, b"\0")
+                try:
+                    fcntl.ioctl(sock, SIOCETHTOOL, ifreq)
+                except OSError as e:
+                    raise CoreCommandError(e.errno, description, "", e.strerror)
+
+    def create_address(self, device, address, broadcast=None):
+        """
+        Create address for a device.
+
+        :param str device: device to add address to
+        :param str address: address to add
+        :param str broadcast: broadcast address to use, default is None
+        :return: nothing
+        """
+        payload = self._address_payload(device, address, broadcast)
+        flags = netlink.NLM_F_CREATE | netlink.NLM_F_EXCL
+        self._request(
+            f"{IP_BIN} address add {address} dev {device}",
+            netlink.RTM_NEWADDR,
+            payload,
+            flags,
+        )
+
+    def delete_address(self, device, address):
+        """
+        Delete an address from a device.
+
+        :param str device: targeted device
+        :param str address: address to remove
+        :return: nothing
+        """
+        payload = self._address_payload(device, address)
+        self._request(
+            f"{IP_BIN} address delete {address} dev {device}",
+            netlink.RTM_DELADDR,
+            payload,
+        )
+
+    def create_veth(self, name, peer):
+        """
+        Create a veth pair.
+
+        :param str name: veth name
+        :param str peer: peer name
+        :return: nothing
+        """
+        peer_info = netlink.ifinfomsg() + netlink.pack_string(netlink.IFLA_IFNAME, peer)
+        self._new_link(
+            f"{IP_BIN} link add name {name} type veth peer name {peer}",
+            name,
+            "veth",
+            netlink.pack_attr(netlink.VETH_INFO_PEER, peer_info),
+        )
+
+    def create_gretap(self, device, address, local, ttl, key):
+        """
+        Create a GRE tap on a device.
+
+        :param str device: device to add tap to
+        :param str address: address to add tap for
+        :param str local: local address to tie to
+        :param int ttl: time to live value
+        :param int key: key for tap
+        :return: nothing
+        """
+        data = [netlink.pack_attr(netlink.IFLA_GRE_REMOTE, socket.inet_aton(address))]
+        if local is not None:
+            data.append(
+                netlink.pack_attr(netlink.IFLA_GRE_LOCAL, socket.inet_aton(local))
+            )
+        if ttl is not None:
+            data.append(netlink.pack_attr(netlink.IFLA_GRE_TTL, netlink.U8.pack(ttl)))
+        if key is not None:
+            gre_key = struct.pack("!H", netlink.GRE_KEY)
+            key = struct.pack("!I", key)
+            data.append(netlink.pack_attr(netlink.IFLA_GRE_IFLAGS, gre_key))
+            data.append(netlink.pack_attr(netlink.IFLA_GRE_OFLAGS, gre_key))
+            data.append(netlink.pack_attr(netlink.IFLA_GRE_IKEY, key))
+            data.append(netlink.pack_attr(netlink.IFLA_GRE_OKEY, key))
+        self._new_link(
+            f"{IP_BIN} link add {device} type gretap remote {address}",
+            device,
+            "gretap",
+            *data,
+        )
+
+    def create_bridge(self, name):
+        """
+        Create a Linux bridge and bring it up, in a single request.
+
+        :param str name: bridge name
+        :return: nothing
+        """
+        self._new_link(
+            f"{IP_BIN} link add name {name} type bridge",
+            name,
+            "bridge",
+            netlink.pack_u32(netlink.IFLA_BR_STP_STATE, 0),
+            netlink.pack_u32(netlink.IFLA_BR_FORWARD_DELAY, 0),
+            netlink.pack_attr(netlink.IFLA_BR_MCAST_SNOOPING, netlink.U8.pack(0)),
+            flags=netlink.IFF_UP,
+            change=netlink.IFF_UP,
+        )
+
+    def delete_bridge(self, name):
+        """
+        Delete a Linux bridge, which also brings it down.
+
+        :param str name: bridge name
+        :return: nothing
+        """
+        self.delete_device(name)
+
+    def create_interface(self, bridge_name, interface_name):
+        """
+        Create an interface associated with a Linux bridge and bring it up, in a
+        single request.
+
+        :param str bridge_name: bridge name
+        :param str interface_name: interface name
+        :return: nothing
+        """
+        self._link(
+            f"{IP_BIN} link set dev {interface_name} master {bridge_name}",
+            interface_name,
+            netlink.pack_u32(netlink.IFLA_MASTER, self._index(bridge_name)),
+            flags=netlink.IFF_UP,
+            change=netlink.IFF_UP,
+        )
+
+    def delete_interface(self, bridge_name, interface_name):
+        """
+        Delete an interface associated with a Linux bridge.
+
+        :param str bridge_name: bridge name
+        :param str interface_name: interface name
+        :return: nothing
+        """
+        self._link(
+            f"{IP_BIN} link set dev {interface_name} nomaster",
+            interface_name,
+            netlink.pack_u32(netlink.IFLA_MASTER, 0),
+        )
+
+    def existing_bridges(self, _id):
+        """
+        Checks if there are any existing Linux bridges for a node.
+
+        :param _id: node id to check bridges for
+        """
+        responses = self._request(
+            f"{IP_BIN} link show type bridge",
+            netlink.RTM_GETLINK,
+            netlink.ifinfomsg(),
+            netlink.NLM_F_DUMP,
+        )
+        for _, data in responses:
+            attrs = netlink.unpack_attrs(data, netlink.IFINFOMSG.size)
+            linkinfo = netlink.unpack_attrs(attrs.get(netlink.IFLA_LINKINFO, b""))
+            kind = linkinfo.get(netlink.IFLA_INFO_KIND)
+            if kind is None or netlink.unpack_string(kind) != "bridge":
+                continue
+            name = netlink.unpack_string(attrs[netlink.IFLA_IFNAME])
+            fields = name.split(".")
+            if len(fields) != 3:
+                continue
+            if fields[0] == "b" and fields[1] == _id:
+                return True
+        return False
+
+    def disable_mac_learning(self, name):
+        """
+        Disable mac learning for a Linux bridge.
+
+        :param str name: bridge name
+        :return: nothing
+        """
+        linkinfo = netlink.pack_nested(
+            netlink.IFLA_LINKINFO,
+            netlink.pack_string(netlink.IFLA_INFO_KIND, "bridge"),
+            netlink.pack_nested(
+                netlink.IFLA_INFO_DATA, netlink.pack_u32(netlink.IFLA_BR_AGEING_TIME, 0)
+            ),
+        )
+        self._link(
+            f"{IP_BIN} link set {name} type bridge ageing_time 0", name, linkinfo
+        )
+
+
+class OvsNetlinkNetClient(OvsNetClient, NetlinkNetClient):
+    """
+    Client for creating OVS bridges using ovs-vsctl, with ip interfaces for nodes
+    configured over netlink.
+    """
+
+    pass
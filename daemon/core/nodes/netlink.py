@@ -0,0 +1,571 @@
+"""
+netlink.py: minimal rtnetlink support for configuring links, addresses, and routes
+directly through netlink sockets, in the host or a node network namespace.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import selectors
+import socket
+import struct
+import threading
+import time
+
+# netlink message types and flags, see linux/netlink.h
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_MULTI = 0x2
+NLM_F_ACK = 0x4
+NLM_F_DUMP = 0x300
+NLM_F_EXCL = 0x200
+NLM_F_CREATE = 0x400
+
+# rtnetlink message types and groups, see linux/rtnetlink.h
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_GETLINK = 18
+RTM_NEWADDR = 20
+RTM_DELADDR = 21
+RTM_GETADDR = 22
+RTM_NEWROUTE = 24
+RTMGRP_LINK = 0x1
+RT_TABLE_MAIN = 254
+RTPROT_BOOT = 3
+RT_SCOPE_UNIVERSE = 0
+RT_SCOPE_LINK = 253
+RTN_UNICAST = 1
+RTA_DST = 1
+RTA_OIF = 4
+
+# link attributes, see linux/if_link.h
+IFLA_ADDRESS = 1
+IFLA_IFNAME = 3
+IFLA_MTU = 4
+IFLA_MASTER = 10
+IFLA_LINKINFO = 18
+IFLA_NET_NS_PID = 19
+IFLA_STATS64 = 23
+IFLA_INFO_KIND = 1
+IFLA_INFO_DATA = 2
+IFLA_BR_FORWARD_DELAY = 1
+IFLA_BR_AGEING_TIME = 4
+IFLA_BR_STP_STATE = 5
+IFLA_BR_MCAST_SNOOPING = 23
+VETH_INFO_PEER = 1
+
+# gre attributes, see linux/if_tunnel.h
+IFLA_GRE_IFLAGS = 2
+IFLA_GRE_OFLAGS = 3
+IFLA_GRE_IKEY = 4
+IFLA_GRE_OKEY = 5
+IFLA_GRE_LOCAL = 6
+IFLA_GRE_REMOTE = 7
+IFLA_GRE_TTL = 8
+GRE_KEY = 0x2000
+
+# address attributes, see linux/if_addr.h
+IFA_ADDRESS = 1
+IFA_LOCAL = 2
+IFA_BROADCAST = 4
+
+IFF_UP = 0x1
+CLONE_NEWNET = 0x40000000
+NETLINK_BUFSIZE = 65536
+
+NLMSGHDR = struct.Struct("=IHHII")
+NLMSGERR = struct.Struct("=i")
+RTATTR = struct.Struct("=HH")
+IFINFOMSG = struct.Struct("=BxHiII")
+IFADDRMSG = struct.Struct("=BBBBI")
+RTMSG = struct.Struct("=BBBBBBBBI")
+U8 = struct.Struct("=B")
+U32 = struct.Struct("=I")
+# leading rx and tx packets and bytes of rtnl_link_stats64
+LINK_STATS64 = struct.Struct("=QQQQ")
+
+_libc = None
+
+
+def _align(length):
+    return (length + 3) & ~3
+
+
+def pack_attr(attr_type, value):
+    """
+    Pack a netlink attribute.
+
+    :param int attr_type: attribute type
+    :param bytes value: attribute value
+    :return: packed attribute, padded for alignment
+    :rtype: bytes
+    """
+    length = RTATTR.size + len(value)
+    data = RTATTR.pack(length, attr_type) + value
+    return data.ljust(_align(length), b"\0")
+
+
+def pack_string(attr_type, value):
+    """
+    Pack a null terminated string netlink attribute.
+
+    :param int attr_type: attribute type
+    :param str value: attribute value
+    :return: packed attribute
+    :rtype: bytes
+    """
+    return pack_attr(attr_type, value.encode("utf-8") + b"\0")
+
+
+def pack_u32(attr_type, value):
+    """
+    Pack an unsigned 32 bit netlink attribute.
+
+    :param int attr_type: attribute type
+    :param int value: attribute value
+    :return: packed attribute
+    :rtype: bytes
+    """
+    return pack_attr(attr_type, U32.pack(value))
+
+
+def pack_nested(attr_type, *attrs):
+    """
+    Pack a netlink attribute containing other attributes.
+
+    :param int attr_type: attribute type
+    :param bytes attrs: packed attributes to nest
+    :return: packed attribute
+    :rtype: bytes
+    """
+    return pack_attr(attr_type, b"".join(attrs))
+
+
+def unpack_attrs(data, offset=0):
+    """
+    Unpack netlink attributes.
+
+    :param bytes data: data containing attributes
+    :param int offset: offset attributes start at
+    :return: dict of attribute type to value bytes
+    :rtype: dict
+    """
+    attrs = {}
+    while offset + RTATTR.size <= len(data):
+        length, attr_type = RTATTR.unpack_from(data, offset)
+        if length < RTATTR.size:
+            break
+        attrs[attr_type] = data[offset + RTATTR.size : offset + length]
+        offset += _align(length)
+    return attrs
+
+
+def unpack_string(value):
+    """
+    Unpack a null terminated string attribute value.
+
+    :param bytes value: attribute value
+    :return: string value
+    :rtype: str
+    """
+    return value.split(b"\0", 1)[0].decode("utf-8")
+
+
+def ifinfomsg(index=0, flags=0, change=0):
+    """
+    Pack the header for link messages.
+
+    :param int index: link index, 0 to identify the link by name
+    :param int flags: link flags
+    :param int change: link flags mask to change
+    :return: packed header
+    :rtype: bytes
+    """
+    return IFINFOMSG.pack(socket.AF_UNSPEC, 0, index, flags, change)
+
+
+def link_stats(requests, names):
+    """
+    Retrieve received and sent bytes for the given links, from a single dump of
+    all links.
+
+    :param NetlinkSocket requests: socket to make the request on
+    :param set names: names of links to retrieve
+    :return: received and sent bytes by link name
+    :rtype: dict
+    :raises OSError: when the request fails
+    """
+    stats = {}
+    responses = requests.request(RTM_GETLINK, ifinfomsg(), NLM_F_DUMP)
+    for msg_type, data in responses:
+        if msg_type != RTM_NEWLINK:
+            continue
+        attrs = unpack_attrs(data, IFINFOMSG.size)
+        if IFLA_IFNAME not in attrs:
+            continue
+        name = unpack_string(attrs[IFLA_IFNAME])
+        value = attrs.get(IFLA_STATS64)
+        if name not in names or value is None or len(value) < LINK_STATS64.size:
+            continue
+        _, _, rx_bytes, tx_bytes = LINK_STATS64.unpack_from(value)
+        stats[name] = (float(rx_bytes), float(tx_bytes))
+    return stats
+
+
+def _setns(fd, nstype):
+    """
+    Move the calling thread into the namespace referred to by a file descriptor.
+
+    :param int fd: namespace file descriptor
+    :param int nstype: namespace type
+    :return: nothing
+    :raises OSError: when unable to change namespace
+    """
+    global _libc
+    if hasattr(os, "setns"):
+        os.setns(fd, nstype)
+        return
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    if _libc.setns(fd, nstype) != 0:
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+
+
+def netns_call(pid, func):
+    """
+    Run a function within the network namespace of a process. Namespace changes
+    only apply to the calling thread, so the function is ran from a short lived
+    thread. Sockets created by the function stay within the namespace once the
+    thread exits.
+
+    :param int pid: process whose network namespace to use, None for the current
+        namespace
+    :param func: function to run
+    :return: function result
+    :raises OSError: when unable to enter the namespace
+    """
+    if pid is None:
+        return func()
+    result = {}
+
+    def run():
+        try:
+            fd = os.open(f"/proc/{pid}/ns/net", os.O_RDONLY)
+            try:
+                _setns(fd, CLONE_NEWNET)
+            finally:
+                os.close(fd)
+            result["value"] = func()
+        except Exception as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+class NetlinkSocket:
+    """
+    Route netlink socket for making requests in a given network namespace.
+    """
+
+    def __init__(self, pid=None, groups=0):
+        """
+        Create a NetlinkSocket instance.
+
+        :param int pid: process whose network namespace to use, None for the
+            current namespace
+        :param int groups: multicast groups to subscribe to
+        :raises OSError: when unable to create the socket
+        """
+        self.pid = pid
+        self.sock = netns_call(
+            pid,
+            lambda: socket.socket(
+                socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE
+            ),
+        )
+        try:
+            self.sock.bind((0, groups))
+        except OSError:
+            self.sock.close()
+            raise
+        self.lock = threading.Lock()
+        self.seq = 0
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def close(self):
+        """
+        Close the socket.
+
+        :return: nothing
+        """
+        self.sock.close()
+
+    def request(self, msg_type, payload, flags=0):
+        """
+        Send a request and wait for its acknowledgement, or the end of a dump.
+
+        :param int msg_type: message type
+        :param bytes payload: message payload
+        :param int flags: additional message flags
+        :return: list of message type and payload pairs received in response
+        :rtype: list[tuple]
+        :raises OSError: when the kernel rejects the request
+        """
+        # dumps are not acknowledged, they end with a done message
+        flags |= NLM_F_REQUEST
+        if flags & NLM_F_DUMP != NLM_F_DUMP:
+            flags |= NLM_F_ACK
+        with self.lock:
+            self.seq += 1
+            seq = self.seq
+            header = NLMSGHDR.pack(
+                NLMSGHDR.size + len(payload), msg_type, flags, seq, 0
+            )
+            self.sock.sendall(header + payload)
+            responses = []
+            while True:
+                data = self.sock.recv(NETLINK_BUFSIZE)
+                for response_type, response_seq, response in self.unpack(data):
+                    if response_seq != seq:
+                        continue
+                    if response_type == NLMSG_DONE:
+                        return responses
+                    elif response_type == NLMSG_ERROR:
+                        error = -NLMSGERR.unpack_from(response)[0]
+                        if error:
+                            raise OSError(error, os.strerror(error))
+                        return responses
+                    responses.append((response_type, response))
+
+    @staticmethod
+    def unpack(data):
+        """
+        Unpack the netlink messages within received data.
+
+        :param bytes data: received data
+        :return: message type, sequence, and payload for each message
+        :rtype: list[tuple]
+        """
+        messages = []
+        offset = 0
+        while offset + NLMSGHDR.size <= len(data):
+            length, msg_type, _, seq, _ = NLMSGHDR.unpack_from(data, offset)
+            if length < NLMSGHDR.size:
+                break
+            payload = data[offset + NLMSGHDR.size : offset + length]
+            messages.append((msg_type, seq, payload))
+            offset += _align(length)
+        return messages
+
+
+class LinkWaiter:
+    """
+    Waits for devices to appear using rtnetlink link notifications, rather than
+    polling. A single thread receives notifications for all namespaces currently
+    being waited on, subscriptions are dropped once nobody waits on a namespace,
+    so node namespaces are not kept alive.
+    """
+
+    def __init__(self):
+        """
+        Create a LinkWaiter instance.
+        """
+        self.lock = threading.Lock()
+        # pid is key, list of event socket, request socket, and waiter count
+        self.subscriptions = {}
+        # pid and device name is key, list of events is value
+        self.waiting = {}
+        self.selector = None
+        self.thread = None
+        self.running = False
+        self.wake_r = None
+        self.wake_w = None
+
+    def _start(self):
+        """
+        Start the notification thread, expects the lock to be held.
+
+        :return: nothing
+        """
+        self.selector = selectors.DefaultSelector()
+        self.wake_r, self.wake_w = os.pipe()
+        self.selector.register(self.wake_r, selectors.EVENT_READ)
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        """
+        Receive link notifications, waking anyone waiting on the named device.
+
+        :return: nothing
+        """
+        while self.running:
+            for key, _ in self.selector.select():
+                if key.fileobj == self.wake_r:
+                    os.read(self.wake_r, 4096)
+                    continue
+                pid = key.data
+                try:
+                    data = key.fileobj.recv(NETLINK_BUFSIZE)
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    # notifications may have been dropped, have everyone recheck
+                    if e.errno == errno.ENOBUFS:
+                        self._notify(pid)
+                    continue
+                for msg_type, _, payload in NetlinkSocket.unpack(data):
+                    if msg_type != RTM_NEWLINK:
+                        continue
+                    attrs = unpack_attrs(payload, IFINFOMSG.size)
+                    name = attrs.get(IFLA_IFNAME)
+                    if name is not None:
+                        self._notify(pid, unpack_string(name))
+
+    def _notify(self, pid, name=None):
+        """
+        Wake waiters for a device, or all waiters within a namespace.
+
+        :param int pid: namespace pid
+        :param str name: device name, None for all devices
+        :return: nothing
+        """
+        with self.lock:
+            for key, events in self.waiting.items():
+                if key[0] == pid and name in (None, key[1]):
+                    for event in events:
+                        event.set()
+
+    def _subscribe(self, pid):
+        """
+        Subscribe to link notifications for a namespace, expects the lock to be
+        held.
+
+        :param int pid: namespace pid, None for the host namespace
+        :return: subscription
+        :rtype: list
+        :raises OSError: when unable to subscribe
+        """
+        subscription = self.subscriptions.get(pid)
+        if subscription is None:
+            if not self.running:
+                self._start()
+            events = NetlinkSocket(pid, RTMGRP_LINK)
+            try:
+                requests = NetlinkSocket(pid)
+            except OSError:
+                events.close()
+                raise
+            events.sock.setblocking(False)
+            self.selector.register(events.sock, selectors.EVENT_READ, pid)
+            subscription = [events, requests, 0]
+            self.subscriptions[pid] = subscription
+        subscription[2] += 1
+        return subscription
+
+    def _unsubscribe(self, pid):
+        """
+        Drop a subscription reference, closing it when no longer used. Expects
+        the lock to be held.
+
+        :param int pid: namespace pid
+        :return: nothing
+        """
+        subscription = self.subscriptions.get(pid)
+        if subscription is None:
+            return
+        subscription[2] -= 1
+        if subscription[2] == 0:
+            self.subscriptions.pop(pid)
+            events, requests, _ = subscription
+            self.selector.unregister(events.sock)
+            events.close()
+            requests.close()
+
+    def wait(self, name, pid=None, timeout=2.5):
+        """
+        Wait for a device to exist.
+
+        :param str name: device name
+        :param int pid: pid of the process whose network namespace the device will
+            appear in, None for the host namespace
+        :param float timeout: maximum time to wait in seconds
+        :return: True if the device exists, False otherwise
+        :rtype: bool
+        :raises OSError: when unable to use netlink
+        """
+        key = (pid, name)
+        event = threading.Event()
+        with self.lock:
+            _, requests, _ = self._subscribe(pid)
+            self.waiting.setdefault(key, []).append(event)
+        try:
+            end = time.monotonic() + timeout
+            while True:
+                if self._exists(requests, name):
+                    return True
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    logging.debug("timed out waiting for device: %s", name)
+                    return False
+                event.wait(remaining)
+                event.clear()
+        finally:
+            with self.lock:
+                events = self.waiting[key]
+                events.remove(event)
+                if not events:
+                    self.waiting.pop(key)
+                self._unsubscribe(pid)
+
+    @staticmethod
+    def _exists(requests, name):
+        """
+        Check if a device exists.
+
+        :param NetlinkSocket requests: socket to make the request on
+        :param str name: device name
+        :return: True if the device exists, False otherwise
+        :rtype: bool
+        """
+        payload = ifinfomsg() + pack_string(IFLA_IFNAME, name)
+        try:
+            requests.request(RTM_GETLINK, payload)
+            return True
+        except OSError as e:
+            if e.errno == errno.ENODEV:
+                return False
+            raise
+
+    def close(self):
+        """
+        Stop the notification thread and close all subscriptions.
+
+        :return: nothing
+        """
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            for events, requests, _ in self.subscriptions.values():
+                self.selector.unregister(events.sock)
+                events.close()
+                requests.close()
+            self.subscriptions.clear()
+            os.write(self.wake_w, b"\0")
+        self.thread.join()
+        self.selector.close()
+        os.close(self.wake_r)
+        os.close(self.wake_w)
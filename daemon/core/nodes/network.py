@@ -9,7 +9,13 @@ import time
 from socket import AF_INET, AF_INET6
 
 from core import utils
-from core.constants import EBTABLES_BIN, TC_BIN
+from core.constants import (
+    EBTABLES_BIN,
+    EBTABLES_RESTORE_BIN,
+    EBTABLES_SAVE_BIN,
+    NFT_BIN,
+    TC_BIN,
+)
 from core.emulator.data import LinkData
 from core.emulator.enumerations import LinkTypes, NodeTypes, RegisterTlvs
 from core.errors import CoreCommandError, CoreError
@@ -21,6 +27,111 @@ from core.nodes.netclient import get_net_client
 ebtables_lock = threading.Lock()
 
 
+class EbtablesRuleset:
+    """
+    Ebtables ruleset, as saved by ebtables-save, that ebtables commands can be
+    applied to before loading it back with a single ebtables-restore.
+    """
+
+    def __init__(self, data):
+        """
+        Create an EbtablesRuleset instance.
+
+        :param str data: ebtables-save output
+        :raises ValueError: when the data can not be parsed
+        """
+        # table name is key, dict of chain to policy is value
+        self.chains = {}
+        # table name is key, dict of chain to rule list is value
+        self.rules = {}
+        # tables that are ended with an explicit commit
+        self.commits = set()
+        table = None
+        for line in data.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("*"):
+                table = line[1:]
+                self.chains[table] = {}
+                self.rules[table] = {}
+            elif table is None:
+                raise ValueError(f"ebtables line outside of a table: {line}")
+            elif line == "COMMIT":
+                self.commits.add(table)
+            elif line.startswith(":"):
+                chain, policy = line[1:].split()[:2]
+                self.chains[table][chain] = policy
+                self.rules[table][chain] = []
+            elif line.startswith("-A "):
+                _, chain, rule = line.split(" ", 2)
+                self.rules[table][chain].append(rule)
+            else:
+                raise ValueError(f"unknown ebtables line: {line}")
+
+    def apply(self, cmd):
+        """
+        Apply an ebtables command, as would be passed to ebtables, to the ruleset.
+
+        :param str cmd: ebtables command arguments
+        :return: nothing
+        :raises ValueError: when the command is not supported or is invalid
+        """
+        args = cmd.split()
+        table = "filter"
+        if args[0] == "-t":
+            table = args[1]
+            args = args[2:]
+        chains = self.chains[table]
+        rules = self.rules[table]
+        op = args[0]
+        chain = args[1] if len(args) > 1 else None
+        rule = " ".join(args[2:])
+        if op == "-N":
+            policy = "ACCEPT"
+            if len(args) == 4 and args[2] == "-P":
+                policy = args[3]
+            if chain in chains:
+                raise ValueError(f"ebtables chain already exists: {chain}")
+            chains[chain] = policy
+            rules[chain] = []
+        elif chain is not None and chain not in chains:
+            raise ValueError(f"ebtables chain does not exist: {chain}")
+        elif op == "-F":
+            for name in [chain] if chain else list(rules):
+                rules[name] = []
+        elif op == "-X":
+            chains.pop(chain)
+            rules.pop(chain)
+        elif op == "-P":
+            chains[chain] = args[2]
+        elif op == "-A":
+            rules[chain].append(rule)
+        elif op == "-I":
+            position = 0
+            if args[2].isdigit():
+                position = int(args[2]) - 1
+                rule = " ".join(args[3:])
+            rules[chain].insert(position, rule)
+        elif op == "-D":
+            rules[chain].remove(rule)
+        else:
+            raise ValueError(f"unsupported ebtables command: {cmd}")
+
+    def __str__(self):
+        lines = []
+        for table, chains in self.chains.items():
+            lines.append(f"*{table}")
+            for chain, policy in chains.items():
+                lines.append(f":{chain} {policy}")
+            for chain, rules in self.rules[table].items():
+                for rule in rules:
+                    lines.append(f"-A {chain} {rule}")
+            if table in self.commits:
+                lines.append("COMMIT")
+        return "\n".join(lines)
+
+
 class EbtablesQueue:
     """
     Helper class for queuing up ebtables commands into rate-limited
@@ -30,6 +141,9 @@ class EbtablesQueue:
 
     # update rate is every 300ms
     rate = 0.3
+    # rebuild a chain, rather than updating it, when the number of changed pairs
+    # exceeds this ratio of the pairs with rules
+    rebuild_ratio = 0.5
     # ebtables
     atomic_file = "/tmp/pycore.ebtables.atomic"
 
@@ -46,6 +160,11 @@ class EbtablesQueue:
         self.cmds = []
         # list of WLANs requiring update
         self.updates = []
+        # interface pairs changed since the last update for each WLAN, None when
+        # the chain needs to be rebuilt
+        self.changes = {}
+        # interface pairs with rules installed for each WLAN
+        self.installed = {}
         # timestamps of last WLAN update; this keeps track of WLANs that are
         # using this queue
         self.last_update_time = {}
@@ -74,6 +193,8 @@ class EbtablesQueue:
         :return: nothing
         """
         with self.updatelock:
+            self.changes.pop(wlan, None)
+            self.installed.pop(wlan, None)
             try:
                 del self.last_update_time[wlan]
             except KeyError:
@@ -154,82 +275,340 @@ class EbtablesQueue:
 
             time.sleep(self.rate)
 
+    def ebhosts(self, wlan):
+        """
+        Retrieve functions for running commands on each host a WLAN's bridge
+        exists on.
+
+        :param wlan: wlan entity
+        :return: functions to run commands with
+        :rtype: list
+        """
+        hosts = [lambda args, shell=False: utils.cmd(args, shell=shell)]
+        servers = wlan.session.distributed.servers
+        for name in servers:
+            server = servers[name]
+            hosts.append(lambda args, shell=False, s=server: s.remote_cmd(args))
+        return hosts
+
     def ebcommit(self, wlan):
         """
         Perform ebtables atomic commit using commands built in the self.cmds list.
+        The current ruleset is saved, modified using the commands, and loaded back
+        with a single ebtables-restore. The atomic file is used when ebtables-save
+        or ebtables-restore are not available.
 
+        :return: nothing
+        """
+        cmds = self.cmds
+        self.cmds = []
+        for run in self.ebhosts(wlan):
+            with ebtables_lock:
+                if EBTABLES_SAVE_BIN is None or EBTABLES_RESTORE_BIN is None:
+                    self.ebatomiccommit(run, cmds)
+                    continue
+                try:
+                    ruleset = EbtablesRuleset(run(EBTABLES_SAVE_BIN))
+                    for cmd in cmds:
+                        ruleset.apply(cmd)
+                except ValueError:
+                    logging.exception("error updating ebtables ruleset")
+                    self.ebatomiccommit(run, cmds)
+                    continue
+                run(f"{EBTABLES_RESTORE_BIN} <<'EOF'\n{ruleset}\nEOF", shell=True)
+
+    def ebatomiccommit(self, run, cmds):
+        """
+        Perform ebtables atomic commit, running each command against an atomic
+        file.
+
+        :param run: function to run commands with
+        :param list[str] cmds: ebtables commands to commit
         :return: nothing
         """
         # save kernel ebtables snapshot to a file
         args = self.ebatomiccmd("--atomic-save")
-        wlan.host_cmd(args)
+        run(args)
 
         # modify the table file using queued ebtables commands
-        for c in self.cmds:
+        for c in cmds:
             args = self.ebatomiccmd(c)
-            wlan.host_cmd(args)
-        self.cmds = []
+            run(args)
 
         # commit the table file to the kernel
         args = self.ebatomiccmd("--atomic-commit")
-        wlan.host_cmd(args)
+        run(args)
 
         try:
-            wlan.host_cmd(f"rm -f {self.atomic_file}")
+            run(f"rm -f {self.atomic_file}")
         except CoreCommandError:
             logging.exception("error removing atomic file: %s", self.atomic_file)
 
-    def ebchange(self, wlan):
+    def ebchange(self, wlan, netif1=None, netif2=None):
         """
         Flag a change to the given WLAN's _linked dict, so the ebtables
-        chain will be rebuilt at the next interval.
+        chain will be updated at the next interval. Changes to a single pair of
+        interfaces are tracked, so only their rules need to be updated.
 
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one of the
+            changed pair, None to rebuild the whole chain
+        :param core.nodes.interface.CoreInterface netif2: interface two of the
+            changed pair
         :return: nothing
         """
         with self.updatelock:
             if wlan not in self.updates:
                 self.updates.append(wlan)
+            if netif1 is None:
+                self.changes[wlan] = None
+            else:
+                changes = self.changes.setdefault(wlan, set())
+                if changes is not None:
+                    changes.add((netif1, netif2))
+
+    def ebrules(self, wlan, netif1, netif2):
+        """
+        Build the rules for filtering traffic between a pair of interfaces.
+
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: rules for both directions
+        :rtype: list[str]
+        """
+        target = "ACCEPT" if wlan.policy == "DROP" else "DROP"
+        return [
+            f"{wlan.brname} -i {netif1.localname} -o {netif2.localname} -j {target}",
+            f"{wlan.brname} -i {netif2.localname} -o {netif1.localname} -j {target}",
+        ]
+
+    def ebfiltered(self, wlan, netif1, netif2):
+        """
+        Determine if a pair of interfaces needs rules, which are the exceptions
+        to the WLAN policy.
+
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: True if rules are needed, False otherwise
+        :rtype: bool
+        """
+        linked = wlan._linked.get(netif1, {}).get(netif2)
+        if linked is None:
+            return False
+        elif wlan.policy == "DROP":
+            return linked
+        else:
+            return not linked
 
     def buildcmds(self, wlan):
         """
-        Inspect a _linked dict from a wlan, and rebuild the ebtables chain for that WLAN.
+        Inspect a _linked dict from a wlan, and update the ebtables chain for that
+        WLAN. Only rules for changed interface pairs are added or deleted, unless
+        the chain needs to be created or the change set is large, in which case
+        the chain is rebuilt.
 
         :return: nothing
         """
+        changes = self.changes.pop(wlan, None)
         with wlan._linked_lock:
-            if wlan.has_ebtables_chain:
-                # flush the chain
-                self.cmds.append(f"-F {wlan.brname}")
-            else:
-                wlan.has_ebtables_chain = True
-                self.cmds.extend(
-                    [
-                        f"-N {wlan.brname} -P {wlan.policy}",
-                        f"-A FORWARD --logical-in {wlan.brname} -j {wlan.brname}",
-                    ]
-                )
+            installed = self.installed.get(wlan)
+            if (
+                wlan.has_ebtables_chain
+                and changes is not None
+                and installed is not None
+                and len(changes) <= self.rebuild_ratio * len(installed)
+            ):
+                for netif1, netif2 in changes:
+                    filtered = self.ebfiltered(wlan, netif1, netif2)
+                    pair = (netif1, netif2)
+                    if filtered and pair not in installed:
+                        installed.add(pair)
+                        self.cmds.extend(self.addcmds(wlan, netif1, netif2))
+                    elif not filtered and pair in installed:
+                        installed.remove(pair)
+                        self.cmds.extend(self.deletecmds(wlan, netif1, netif2))
+                return
+
+            self.cmds.extend(self.resetcmds(wlan))
+            wlan.has_ebtables_chain = True
             # rebuild the chain
+            installed = set()
             for netif1, v in wlan._linked.items():
-                for netif2, linked in v.items():
-                    if wlan.policy == "DROP" and linked:
-                        self.cmds.extend(
-                            [
-                                f"-A {wlan.brname} -i {netif1.localname} -o {netif2.localname} -j ACCEPT",
-                                f"-A {wlan.brname} -o {netif1.localname} -i {netif2.localname} -j ACCEPT",
-                            ]
-                        )
-                    elif wlan.policy == "ACCEPT" and not linked:
-                        self.cmds.extend(
-                            [
-                                f"-A {wlan.brname} -i {netif1.localname} -o {netif2.localname} -j DROP",
-                                f"-A {wlan.brname} -o {netif1.localname} -i {netif2.localname} -j DROP",
-                            ]
-                        )
+                for netif2 in v:
+                    if self.ebfiltered(wlan, netif1, netif2):
+                        installed.add((netif1, netif2))
+                        self.cmds.extend(self.addcmds(wlan, netif1, netif2))
+            self.installed[wlan] = installed
+
+    def resetcmds(self, wlan):
+        """
+        Build commands creating an empty chain for a WLAN, or flushing it when it
+        already exists.
+
+        :param wlan: wlan entity
+        :return: ebtables commands
+        :rtype: list[str]
+        """
+        if wlan.has_ebtables_chain:
+            return [f"-F {wlan.brname}"]
+        return [
+            f"-N {wlan.brname} -P {wlan.policy}",
+            f"-A FORWARD --logical-in {wlan.brname} -j {wlan.brname}",
+        ]
+
+    def addcmds(self, wlan, netif1, netif2):
+        """
+        Build commands adding the rules for a pair of interfaces.
+
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: ebtables commands
+        :rtype: list[str]
+        """
+        return [f"-A {rule}" for rule in self.ebrules(wlan, netif1, netif2)]
+
+    def deletecmds(self, wlan, netif1, netif2):
+        """
+        Build commands deleting the rules for a pair of interfaces.
+
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: ebtables commands
+        :rtype: list[str]
+        """
+        return [f"-D {rule}" for rule in self.ebrules(wlan, netif1, netif2)]
+
+    def removecmds(self, wlan):
+        """
+        Build the commands, ran directly, for removing the chain of a WLAN.
+
+        :param wlan: wlan entity
+        :return: commands to run
+        :rtype: list[str]
+        """
+        return [
+            f"{EBTABLES_BIN} -D FORWARD --logical-in {wlan.brname} -j {wlan.brname}",
+            f"{EBTABLES_BIN} -X {wlan.brname}",
+        ]
+
+
+class NftablesQueue(EbtablesQueue):
+    """
+    Helper class for queuing up WLAN filtering changes, keeping the filtered
+    interface pairs for each WLAN within an nftables set. Link changes become set
+    element additions and deletions, and per packet matching is a single set
+    lookup, no matter how many pairs are filtered.
+    """
+
+    def nftable(self, wlan):
+        """
+        Retrieve the name of the nftables table for a WLAN.
+
+        :param wlan: wlan entity
+        :return: table name
+        :rtype: str
+        """
+        name = wlan.brname.replace(".", "_")
+        return f"core_{name}"
+
+    def ebcommit(self, wlan):
+        """
+        Load the commands built in the self.cmds list as a single nftables
+        transaction.
+
+        :return: nothing
+        """
+        cmds = "\n".join(self.cmds)
+        self.cmds = []
+        for run in self.ebhosts(wlan):
+            run(f"{NFT_BIN} -f - <<'EOF'\n{cmds}\nEOF", shell=True)
+
+    def resetcmds(self, wlan):
+        """
+        Build commands creating an empty set and filtering chain for a WLAN,
+        replacing any existing table, or flushing the set when the table
+        already exists.
+
+        :param wlan: wlan entity
+        :return: nft commands
+        :rtype: list[str]
+        """
+        table = self.nftable(wlan)
+        if wlan.has_ebtables_chain:
+            return [f"flush set bridge {table} links"]
+        target = "accept" if wlan.policy == "DROP" else "drop"
+        return [
+            f"add table bridge {table}",
+            f"delete table bridge {table}",
+            f"add table bridge {table}",
+            f"add set bridge {table} links {{ type ifname . ifname; }}",
+            f"add chain bridge {table} forward "
+            f"{{ type filter hook forward priority 0; policy accept; }}",
+            f'add rule bridge {table} forward meta ibrname != "{wlan.brname}" accept',
+            f"add rule bridge {table} forward iifname . oifname @links {target}",
+            f"add rule bridge {table} forward {wlan.policy.lower()}",
+        ]
+
+    def nftelements(self, netif1, netif2):
+        """
+        Build the set elements for both directions between a pair of interfaces.
+
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: set elements
+        :rtype: str
+        """
+        name1 = netif1.localname
+        name2 = netif2.localname
+        return f'{{ "{name1}" . "{name2}", "{name2}" . "{name1}" }}'
+
+    def addcmds(self, wlan, netif1, netif2):
+        """
+        Build commands adding the set elements for a pair of interfaces.
+
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: nft commands
+        :rtype: list[str]
+        """
+        table = self.nftable(wlan)
+        elements = self.nftelements(netif1, netif2)
+        return [f"add element bridge {table} links {elements}"]
+
+    def deletecmds(self, wlan, netif1, netif2):
+        """
+        Build commands deleting the set elements for a pair of interfaces.
+
+        :param wlan: wlan entity
+        :param core.nodes.interface.CoreInterface netif1: interface one
+        :param core.nodes.interface.CoreInterface netif2: interface two
+        :return: nft commands
+        :rtype: list[str]
+        """
+        table = self.nftable(wlan)
+        elements = self.nftelements(netif1, netif2)
+        return [f"delete element bridge {table} links {elements}"]
+
+    def removecmds(self, wlan):
+        """
+        Build the commands, ran directly, for removing the table of a WLAN.
+
+        :param wlan: wlan entity
+        :return: commands to run
+        :rtype: list[str]
+        """
+        return [f"{NFT_BIN} delete table bridge {self.nftable(wlan)}"]
 
 
 # a global object because all WLANs share the same queue
 # cannot have multiple threads invoking the ebtables commnd
 ebq = EbtablesQueue()
+nftq = NftablesQueue()
 
 
 def ebtablescmds(call, cmds):
@@ -276,9 +655,15 @@ class CoreNetwork(CoreNetworkBase):
         self.brname = f"b.{self.id}.{sessionid}"
         self.up = False
         self.has_ebtables_chain = False
+        self.filter_queue = ebq
+        if self.session.options.get_config("nftables") == "True":
+            if NFT_BIN is None:
+                logging.warning("nft not found, using ebtables for %s", self.name)
+            else:
+                self.filter_queue = nftq
         if start:
             self.startup()
-            ebq.startupdateloop(self)
+            self.filter_queue.startupdateloop(self)
 
     def host_cmd(self, args, env=None, cwd=None, wait=True, shell=False):
         """
@@ -319,15 +704,12 @@ class CoreNetwork(CoreNetworkBase):
         if not self.up:
             return
 
-        ebq.stopupdateloop(self)
+        self.filter_queue.stopupdateloop(self)
 
         try:
             self.net_client.delete_bridge(self.brname)
             if self.has_ebtables_chain:
-                cmds = [
-                    f"{EBTABLES_BIN} -D FORWARD --logical-in {self.brname} -j {self.brname}",
-                    f"{EBTABLES_BIN} -X {self.brname}",
-                ]
+                cmds = self.filter_queue.removecmds(self)
                 ebtablescmds(self.host_cmd, cmds)
         except CoreCommandError:
             logging.exception("error during shutdown")
@@ -362,6 +744,9 @@ class CoreNetwork(CoreNetworkBase):
         if self.up:
             netif.net_client.delete_interface(self.brname, netif.localname)
         super().detach(netif)
+        if self.has_ebtables_chain:
+            # rules for the interface are removed with a rebuild
+            self.filter_queue.ebchange(self)
 
     def linked(self, netif1, netif2):
         """
@@ -406,7 +791,7 @@ class CoreNetwork(CoreNetworkBase):
                 return
             self._linked[netif1][netif2] = False
 
-        ebq.ebchange(self)
+        self.filter_queue.ebchange(self, netif1, netif2)
 
     def link(self, netif1, netif2):
         """
@@ -422,7 +807,7 @@ class CoreNetwork(CoreNetworkBase):
                 return
             self._linked[netif1][netif2] = True
 
-        ebq.ebchange(self)
+        self.filter_queue.ebchange(self, netif1, netif2)
 
     def linkconfig(
         self,
@@ -765,8 +1150,9 @@ class CtrlNet(CoreNetwork):
         :return:
         """
         use_ovs = self.session.options.get_config("ovs") == "True"
+        use_netlink = self.session.options.get_config("netlink") == "True"
         current = f"{address}/{self.prefix.prefixlen}"
-        net_client = get_net_client(use_ovs, utils.cmd)
+        net_client = get_net_client(use_ovs, utils.cmd, use_netlink)
         net_client.create_address(self.brname, current)
         servers = self.session.distributed.servers
         for name in servers:
@@ -184,6 +184,24 @@ class PhysicalNode(CoreNodeBase):
         os.mkdir(hostpath)
         self.mount(hostpath, path)
 
+    def privatedir_cmd(self, path):
+        """
+        Command creating a private directory, to run along with other commands.
+
+        :param str path: path to create
+        :return: command to run
+        :rtype: str
+        :raises ValueError: when the path is not fully qualified
+        """
+        if path[0] != "/":
+            raise ValueError(f"path not fully qualified: {path}")
+        hostpath = os.path.join(
+            self.nodedir, os.path.normpath(path).strip("/").replace("/", ".")
+        )
+        hostpath = os.path.abspath(hostpath)
+        self._mounts.append((hostpath, path))
+        return f"mkdir -p {hostpath} {path} && {MOUNT_BIN} --bind {hostpath} {path}"
+
     def mount(self, source, target):
         source = os.path.abspath(source)
         logging.info("mounting %s at %s", source, target)
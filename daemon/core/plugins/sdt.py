@@ -9,6 +9,7 @@ from urllib.parse import urlparse
 from core import constants
 from core.constants import CORE_DATA_DIR
 from core.emane.nodes import EmaneNet
+from core.emulator.data import LinkData, NodeData
 from core.emulator.enumerations import (
     EventTypes,
     LinkTlvs,
@@ -18,6 +19,7 @@ from core.emulator.enumerations import (
     NodeTlvs,
     NodeTypes,
 )
+from core.emulator.eventbus import OverflowPolicy
 from core.errors import CoreError
 from core.nodes.base import CoreNetworkBase, NodeBase
 from core.nodes.network import WlanNode
@@ -77,11 +79,13 @@ class Sdt:
         # local nodes also appear here since their obj may not exist yet
         self.remotes = {}
 
-        # add handler for node updates
-        self.session.node_handlers.append(self.handle_node_update)
-
-        # add handler for link updates
-        self.session.link_handlers.append(self.handle_link_update)
+        # add handlers for node and link updates, coalescing updates for the
+        # same node or link while sdt is busy
+        self.subscriber = self.session.bus.subscribe(
+            "sdt",
+            {NodeData: self.handle_node_update, LinkData: self.handle_link_update},
+            policy=OverflowPolicy.COALESCE,
+        )
 
     def handle_node_update(self, node_data):
         """
@@ -7,8 +7,15 @@ a list of available services to the GUI and for configuring individual
 services.
 """
 
+import collections
+import concurrent.futures
 import enum
+import hashlib
+import json
 import logging
+import os
+import sys
+import threading
 import time
 
 from core import utils
@@ -16,6 +23,8 @@ from core.constants import which
 from core.emulator.data import FileData
 from core.emulator.enumerations import ExceptionLevels, MessageFlags, RegisterTlvs
 from core.errors import CoreCommandError
+from core.services.readiness import Command, ServiceProber, gather, wait_command
+from core.services.script import ServiceScript
 
 
 class ServiceBootError(Exception):
@@ -126,6 +135,305 @@ class ServiceDependencies:
         return self.path
 
 
+class ServiceBootScheduler:
+    """
+    Boots services for many nodes as a single graph of tasks, a task for each
+    node service, started once the services it depends on within the node have
+    booted, and run on a single pool of workers shared by all nodes.
+
+    When service commands are run as scripts, a node has a single task booting
+    all its services with one generated script.
+    """
+
+    # service name of tasks booting all node services as a script
+    SCRIPT = "<script>"
+
+    def __init__(self, services, workers=None):
+        """
+        Create a ServiceBootScheduler instance.
+
+        :param CoreServices services: services manager booting services
+        :param int workers: maximum tasks run at once, None or 0 for a default
+            based on the host cpu count
+        """
+        self.services = services
+        if not workers:
+            workers = max(10, 4 * (os.cpu_count() or 1))
+        self.workers = workers
+        # tasks by node id and service name, None for node setup before services
+        self.tasks = {}
+        self.dependents = {}
+        self.waiting = {}
+        self.errors = {}
+
+    def add(self, node, setup=None):
+        """
+        Add tasks booting all services of a node.
+
+        :param core.nodes.base.CoreNode node: node to boot services for
+        :param setup: function to run before booting node services
+        :return: nothing
+        """
+        setup_key = (node.id, None)
+        self._add_task(setup_key, node, setup, [])
+        try:
+            paths = ServiceDependencies(node.services).boot_paths()
+        except ValueError as e:
+            self.errors.setdefault(node.id, []).append(e)
+            return
+        logging.info(
+            "booting node(%s) services: %s", node.name, [x.name for x in node.services]
+        )
+        if self.services.use_scripts():
+            names = [x.name for path in paths for x in path]
+            self._add_task((node.id, self.SCRIPT), node, names, [setup_key])
+            return
+        for service in node.services:
+            key = (node.id, service.name)
+            dependencies = [(node.id, x) for x in service.dependencies]
+            self._add_task(key, node, service, [setup_key] + dependencies)
+
+    def _add_task(self, key, node, task, dependencies):
+        """
+        Add a task, waiting on the tasks it depends on.
+
+        :param tuple key: node id and service name of task
+        :param core.nodes.base.CoreNode node: node for task
+        :param task: service to boot, setup function, or names of services to
+            boot as a script
+        :param list[tuple] dependencies: keys of tasks to wait on
+        :return: nothing
+        """
+        self.tasks[key] = (node, task)
+        self.waiting[key] = len(dependencies)
+        for dependency in dependencies:
+            self.dependents.setdefault(dependency, []).append(key)
+
+    def _run_task(self, key):
+        """
+        Run a task, returning without waiting for a started service to be ready.
+
+        :param tuple key: node id and service name of task
+        :return: future completed when the started service is ready, or None
+        :rtype: concurrent.futures.Future
+        """
+        node_id, service_name = key
+        node, task = self.tasks[key]
+        if service_name is None:
+            if task:
+                task()
+            return None
+        if service_name == self.SCRIPT:
+            services = [
+                self.services.get_service(node_id, x, default_service=True)
+                for x in task
+            ]
+            try:
+                return self.services.boot_services_script(node, services)
+            except Exception:
+                logging.exception("exception booting node(%s) services", node.name)
+                raise
+        service = self.services.get_service(node_id, service_name, default_service=True)
+        try:
+            return self.services.boot_service_nowait(node, service)
+        except Exception:
+            logging.exception("exception booting service: %s", service.name)
+            raise
+
+    def run(self):
+        """
+        Run all tasks, starting tasks as the tasks they depend on complete, tasks
+        depending on a failed task are not run. Workers are freed while started
+        services are checked for readiness.
+
+        :return: exceptions for each node failing to boot
+        :rtype: list[ServiceBootError]
+        """
+        starts = {}
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            futures = {}
+
+            def submit(task_key):
+                starts[task_key] = time.monotonic()
+                futures[executor.submit(self._run_task, task_key)] = task_key
+
+            for key, waiting in self.waiting.items():
+                if not waiting:
+                    submit(key)
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    key = futures.pop(future)
+                    exception = future.exception()
+                    if not exception:
+                        ready = future.result()
+                        if ready is not None:
+                            futures[ready] = key
+                            continue
+                    self.services.boot_timings[key] = time.monotonic() - starts[key]
+                    if exception:
+                        self.errors.setdefault(key[0], []).append(exception)
+                        continue
+                    for dependent in self.dependents.get(key, []):
+                        self.waiting[dependent] -= 1
+                        if not self.waiting[dependent]:
+                            submit(dependent)
+        return [ServiceBootError(*x) for x in self.errors.values()]
+
+
+class ServiceFileCache:
+    """
+    Keeps generated service files by node, service and file name, with a
+    fingerprint of the inputs they were generated from, so files are only
+    generated and written again when their inputs or contents change.
+    """
+
+    def __init__(self):
+        """
+        Create a ServiceFileCache instance.
+        """
+        self.files = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.skipped = 0
+
+    @staticmethod
+    def fingerprint(node, service):
+        """
+        Fingerprint of the inputs service files are generated from, the node, its
+        services and interfaces, the service custom configuration, session
+        options, and the emane configuration of networks the node is on.
+
+        :param core.nodes.base.CoreNode node: node service files are for
+        :param CoreService service: service files are for
+        :return: fingerprint
+        :rtype: tuple
+        """
+        session = node.session
+        netifs = []
+        for netif in node.netifs(sort=True):
+            net = netif.net
+            net_id = getattr(net, "id", None)
+            emane_configs = session.emane.get_all_configs(net_id) or {}
+            netifs.append(
+                (
+                    netif.netindex,
+                    netif.name,
+                    str(netif.hwaddr),
+                    tuple(netif.addrlist),
+                    netif.mtu,
+                    net_id,
+                    net.__class__.__name__,
+                    ServiceFileCache.freeze(emane_configs),
+                )
+            )
+        config_data = tuple(sorted(service.config_data.items()))
+        options = ServiceFileCache.freeze(session.options.get_configs() or {})
+        return (
+            node.id,
+            node.name,
+            node.type,
+            node.nodedir,
+            tuple(x.name for x in node.services),
+            tuple(netifs),
+            service.custom,
+            config_data,
+            options,
+        )
+
+    @staticmethod
+    def freeze(configs):
+        """
+        Convert configurations to a comparable fingerprint value.
+
+        :param dict configs: configurations, possibly nested by type
+        :return: sorted configuration items
+        :rtype: tuple
+        """
+        items = []
+        for key, value in configs.items():
+            if isinstance(value, dict):
+                value = ServiceFileCache.freeze(value)
+            items.append((str(key), value))
+        return tuple(sorted(items))
+
+    def get(self, node, service, file_name, fingerprint):
+        """
+        Get a file generated from the same inputs.
+
+        :param core.nodes.base.CoreNode node: node file is for
+        :param CoreService service: service file is for
+        :param str file_name: name of file
+        :param tuple fingerprint: fingerprint of current inputs
+        :return: file contents, or None if not generated from the same inputs
+        :rtype: str
+        """
+        with self.lock:
+            cached = self.files.get((node.id, service.name, file_name))
+            if cached is not None and cached[0] == fingerprint:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        return None
+
+    def write(self, node, service, file_name, fingerprint, data):
+        """
+        Write a service file to a node, unless the node already has the same
+        contents written from this cache.
+
+        :param core.nodes.base.CoreNode node: node to write file to
+        :param CoreService service: service file is for
+        :param str file_name: name of file
+        :param tuple fingerprint: fingerprint of inputs file was generated from
+        :param str data: file contents
+        :return: nothing
+        """
+        key = (node.id, service.name, file_name)
+        with self.lock:
+            cached = self.files.get(key)
+            self.files[key] = (fingerprint, data)
+        unchanged = cached is not None and cached[1] == data
+        if unchanged and node.server is None:
+            # files are removed with the session directory
+            if os.path.exists(node.hostfilename(file_name)):
+                with self.lock:
+                    self.skipped += 1
+                return
+        node.nodefile(file_name, data)
+        with self.lock:
+            self.writes += 1
+
+    def clear(self):
+        """
+        Remove all kept files.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.files.clear()
+
+    def stats(self):
+        """
+        Provides cache metrics.
+
+        :return: kept files, files generated from kept inputs, files generated,
+            files written and writes skipped for unchanged files
+        :rtype: dict
+        """
+        with self.lock:
+            return {
+                "size": len(self.files),
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "skipped": self.skipped,
+            }
+
+
 class ServiceShim:
     keys = [
         "dirs",
@@ -234,12 +542,31 @@ class ServiceShim:
         return servicesstring[1].split(",")
 
 
+ServiceInfo = collections.namedtuple(
+    "ServiceInfo",
+    ["name", "group", "dependencies", "executables", "custom_needed", "module"],
+)
+
+
 class ServiceManager:
     """
     Manages services available for CORE nodes to use.
+
+    Service modules are indexed by name, group and dependencies in an on-disk
+    cache, by the modification time of the module and of the modules its services
+    inherit from, so modules unchanged since they were indexed are only imported
+    when one of their services is first used.
     """
 
     services = {}
+    # services indexed but not yet imported, by name
+    index = {}
+    # directory for on-disk service indexes, None to always import modules, set
+    # from the services_cache_dir daemon option
+    cache_dir = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "core"
+    )
+    lock = threading.RLock()
 
     @classmethod
     def add(cls, service):
@@ -274,34 +601,258 @@ class ServiceManager:
     @classmethod
     def get(cls, name):
         """
-        Retrieve a service from the manager.
+        Retrieve a service from the manager, importing its module when indexed
+        but not yet imported.
 
         :param str name: name of the service to retrieve
         :return: service if it exists, None otherwise
         :rtype: CoreService.class
         """
-        return cls.services.get(name)
+        service = cls.services.get(name)
+        if service is None and name in cls.index:
+            with cls.lock:
+                info = cls.index.get(name)
+                if info is not None:
+                    cls.load_module(info.module)
+                service = cls.services.get(name)
+        return service
+
+    @classmethod
+    def all_services(cls):
+        """
+        Retrieve all services, without importing indexed services.
+
+        :return: services and service info for indexed services, by name
+        :rtype: dict
+        """
+        services = dict(cls.index)
+        services.update(cls.services)
+        return services
+
+    @classmethod
+    def load_module(cls, module):
+        """
+        Import a service module, adding its services.
+
+        :param str module: name of module to import
+        :return: names of services that failed to load
+        :rtype: list[str]
+        """
+        service_errors = []
+        with cls.lock:
+            names = [x for x in cls.index if cls.index[x].module == module]
+            for name in names:
+                cls.index.pop(name)
+            try:
+                services = utils.load_module_classes(module, CoreService)
+            except Exception:
+                logging.exception(
+                    "unexpected error during import, skipping: %s", module
+                )
+                return names
+            for service in services:
+                if not service.name:
+                    continue
+
+                try:
+                    cls.add(service)
+                except ValueError as e:
+                    service_errors.append(service.name)
+                    logging.debug("not loading service(%s): %s", service.name, e)
+        return service_errors
+
+    @classmethod
+    def cache_path(cls, path):
+        """
+        On-disk service index for a service path.
+
+        :param str path: path services are loaded from
+        :return: path to index file, None when not cached
+        :rtype: str
+        """
+        if not cls.cache_dir:
+            return None
+        digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+        return os.path.join(cls.cache_dir, f"services-{digest}.json")
+
+    @classmethod
+    def read_cache(cls, path):
+        """
+        Read the on-disk service index for a service path.
+
+        :param str path: path services are loaded from
+        :return: indexed modules by module name
+        :rtype: dict
+        """
+        cache_path = cls.cache_path(path)
+        if not cache_path or not os.path.isfile(cache_path):
+            return {}
+        try:
+            with open(cache_path, "r") as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            logging.warning("ignoring invalid service index: %s", cache_path)
+            return {}
+
+    @classmethod
+    def write_cache(cls, path, modules):
+        """
+        Write the on-disk service index for a service path.
+
+        :param str path: path services are loaded from
+        :param dict modules: indexed modules by module name
+        :return: nothing
+        """
+        cache_path = cls.cache_path(path)
+        if not cache_path:
+            return
+        try:
+            os.makedirs(cls.cache_dir, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}"
+            with open(temp_path, "w") as f:
+                json.dump(modules, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logging.debug("unable to write service index(%s): %s", cache_path, e)
 
     @classmethod
     def add_services(cls, path):
         """
-        Method for retrieving all CoreServices from a given path.
+        Method for retrieving all CoreServices from a given path. Modules
+        unchanged since last indexed are not imported until one of their services
+        is used.
 
         :param str path: path to retrieve services from
         :return: list of core services that failed to load
         :rtype: list[str]
         """
         service_errors = []
-        services = utils.load_classes(path, CoreService)
-        for service in services:
-            if not service.name:
-                continue
+        cached = cls.read_cache(path)
+        modules = {}
+        file_keys = {}
+        with cls.lock:
+            for module, file_path in utils.find_modules(path):
+                entry = cached.get(module)
+                if entry is not None and cls.files_unchanged(entry, file_keys):
+                    modules[module] = entry
+                    service_errors.extend(cls.add_index(module, entry["services"]))
+                    continue
+
+                # index changed module, using its imported services
+                try:
+                    services = utils.load_module_classes(module, CoreService)
+                except Exception:
+                    logging.exception(
+                        "unexpected error during import, skipping: %s", module
+                    )
+                    continue
+                infos = []
+                files = {file_path: cls.file_key(file_path, file_keys)}
+                for service in services:
+                    if not service.name:
+                        continue
+                    files.update(cls.service_files(service, file_keys))
+                    infos.append(
+                        [
+                            service.name,
+                            service.group,
+                            list(service.dependencies),
+                            list(service.executables),
+                            service.custom_needed,
+                        ]
+                    )
+                    try:
+                        cls.add(service)
+                    except ValueError as e:
+                        service_errors.append(service.name)
+                        logging.debug("not loading service(%s): %s", service.name, e)
+                modules[module] = {"files": files, "services": infos}
+        if modules != cached:
+            cls.write_cache(path, modules)
+        return service_errors
 
+    @staticmethod
+    def file_key(file_path, file_keys):
+        """
+        Key for the current contents of a file, its modification time and size.
+
+        :param str file_path: path of file
+        :param dict file_keys: keys already retrieved, by file path
+        :return: file key, None when the file is missing
+        :rtype: list
+        """
+        if file_path not in file_keys:
             try:
-                cls.add(service)
-            except ValueError as e:
-                service_errors.append(service.name)
-                logging.debug("not loading service(%s): %s", service.name, e)
+                stat = os.stat(file_path)
+                file_keys[file_path] = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                file_keys[file_path] = None
+        return file_keys[file_path]
+
+    @classmethod
+    def service_files(cls, service, file_keys):
+        """
+        Keys for the files of the modules a service class and its base classes
+        are defined in, which its indexed attributes may be inherited from.
+
+        :param CoreService service: service to get files for
+        :param dict file_keys: keys already retrieved, by file path
+        :return: file keys by file path
+        :rtype: dict
+        """
+        files = {}
+        for base in service.__mro__:
+            module = sys.modules.get(base.__module__)
+            file_path = getattr(module, "__file__", None)
+            if file_path:
+                files[file_path] = cls.file_key(file_path, file_keys)
+        return files
+
+    @classmethod
+    def files_unchanged(cls, entry, file_keys):
+        """
+        Check if the files an indexed module was indexed from are unchanged.
+
+        :param dict entry: indexed module
+        :param dict file_keys: keys already retrieved, by file path
+        :return: True if unchanged, False otherwise
+        :rtype: bool
+        """
+        files = entry.get("files")
+        if not files:
+            return False
+        return all(cls.file_key(x, file_keys) == files[x] for x in files)
+
+    @classmethod
+    def add_index(cls, module, infos):
+        """
+        Add services from an indexed module, without importing it.
+
+        :param str module: name of module providing services
+        :param list infos: name, group, dependencies, executables and custom
+            needed of services
+        :return: names of services that failed to load
+        :rtype: list[str]
+        """
+        service_errors = []
+        for name, group, dependencies, executables, custom_needed in infos:
+            if name in cls.services or name in cls.index:
+                service_errors.append(name)
+                logging.debug("not loading service(%s): duplicate", name)
+                continue
+            missing = [x for x in executables if not which(x, required=False)]
+            if missing:
+                service_errors.append(name)
+                logging.debug("not loading service(%s): missing %s", name, missing)
+                continue
+            cls.index[name] = ServiceInfo(
+                name,
+                group,
+                tuple(dependencies),
+                tuple(executables),
+                custom_needed,
+                module,
+            )
         return service_errors
 
 
@@ -328,12 +879,30 @@ class CoreServices:
         self.default_services = {}
         # dict of node ids to dict of custom services by name
         self.custom_services = {}
+        # seconds taken by the last boot of each node service, by node id and
+        # service name, None for node setup before booting services
+        self.boot_timings = {}
+        # checks readiness of started services for all nodes
+        self.prober = ServiceProber()
+        # generated service files, to skip generating and writing unchanged files
+        self.file_cache = ServiceFileCache()
 
     def reset(self):
         """
         Called when config message with reset flag is received
         """
         self.custom_services.clear()
+        self.file_cache.clear()
+
+    def use_scripts(self):
+        """
+        Check if service commands for a node are run as a single generated script,
+        rather than a node command each.
+
+        :return: True to run commands as a script, False otherwise
+        :rtype: bool
+        """
+        return self.session.options.get_config("service_scripts") == "1"
 
     def get_default_services(self, node_type):
         """
@@ -461,44 +1030,37 @@ class CoreServices:
         :param core.nodes.base.CoreNode node: node to start services on
         :return: nothing
         """
-        boot_paths = ServiceDependencies(node.services).boot_paths()
-        funcs = []
-        for boot_path in boot_paths:
-            args = (node, boot_path)
-            funcs.append((self._start_boot_paths, args, {}))
-        result, exceptions = utils.threadpool(funcs)
+        workers = self.session.options.get_config_int("boot_workers", default=0)
+        scheduler = ServiceBootScheduler(self, workers)
+        scheduler.add(node)
+        exceptions = scheduler.run()
         if exceptions:
-            raise ServiceBootError(*exceptions)
+            raise exceptions[0]
 
-    def _start_boot_paths(self, node, boot_path):
+    def boot_service(self, node, service):
         """
-        Start all service boot paths found, based on dependencies.
+        Start a service on a node. Create private dirs, generate config
+        files, and execute startup commands, waiting for the service to be ready.
 
-        :param core.nodes.base.CoreNode node: node to start services on
-        :param list[CoreService] boot_path: service to start in dependent order
+        :param core.nodes.base.CoreNode node: node to boot services on
+        :param CoreService service: service to start
         :return: nothing
         """
-        logging.info(
-            "booting node(%s) services: %s",
-            node.name,
-            " -> ".join([x.name for x in boot_path]),
-        )
-        for service in boot_path:
-            service = self.get_service(node.id, service.name, default_service=True)
-            try:
-                self.boot_service(node, service)
-            except Exception:
-                logging.exception("exception booting service: %s", service.name)
-                raise
+        ready = self.boot_service_nowait(node, service)
+        if ready is not None:
+            ready.result()
 
-    def boot_service(self, node, service):
+    def boot_service_nowait(self, node, service):
         """
         Start a service on a node. Create private dirs, generate config
-        files, and execute startup commands.
+        files, and execute startup commands, without waiting for the service to
+        be ready, which is checked by the service prober.
 
         :param core.nodes.base.CoreNode node: node to boot services on
         :param CoreService service: service to start
-        :return: nothing
+        :return: future completed when the service is ready, or failing
+            validation, None when already ready
+        :rtype: concurrent.futures.Future
         """
         logging.info(
             "starting node(%s) service(%s) validation(%s)",
@@ -532,28 +1094,178 @@ class CoreServices:
 
         # blocking mode is finished
         if wait:
-            return
+            return None
 
-        # timer mode, sleep and return
+        # timer mode, ready once the timer is up
         if service.validation_mode == ServiceMode.TIMER:
-            time.sleep(service.validation_timer)
-        # non-blocking, attempt to validate periodically, up to validation_timer time
-        elif service.validation_mode == ServiceMode.NON_BLOCKING:
-            start = time.monotonic()
-            while True:
-                status = self.validate_service(node, service)
-                if not status:
-                    break
+            return self.prober.watch(node, service.name, [], service.validation_timer)
+
+        # non-blocking, check readiness periodically, up to validation_timer time
+        probes = self.get_readiness(node, service)
+        if not probes:
+            return None
+        error = ServiceBootError(
+            "node(%s) service(%s) failed validation" % (node.name, service.name)
+        )
+        return self.prober.watch(
+            node,
+            service.name,
+            probes,
+            service.validation_timer,
+            service.validation_period,
+            error,
+        )
 
-                if time.monotonic() - start > service.validation_timer:
-                    break
+    def boot_services_script(self, node, services):
+        """
+        Start services on a node with a single generated script. Config files are
+        created first, then the script creates private dirs and runs startup
+        commands in boot order, waiting for services other services depend on to
+        be ready, and skipping services whose dependencies failed.
 
-                time.sleep(service.validation_period)
+        :param core.nodes.base.CoreNode node: node to boot services on
+        :param list[CoreService] services: services to start, in boot order
+        :return: future completed when the started services are ready, or failing
+            validation, None when already ready
+        :rtype: concurrent.futures.Future
+        :raises ServiceBootError: when services fail to start
+        """
+        for service in services:
+            self.create_service_files(node, service)
 
-            if status:
-                raise ServiceBootError(
+        # services others depend on are waited on within the script
+        dependencies = {x for service in services for x in service.dependencies}
+        script = ServiceScript()
+        steps = {}
+        for service in services:
+            logging.info(
+                "starting node(%s) service(%s) validation(%s)",
+                node.name,
+                service.name,
+                service.validation_mode.name,
+            )
+            for directory in service.dirs:
+                try:
+                    cmd = node.privatedir_cmd(directory)
+                except ValueError as e:
+                    logging.warning(
+                        "error mounting private dir '%s' for service '%s': %s",
+                        directory,
+                        service.name,
+                        e,
+                    )
+                    continue
+                script.add((service, "dir"), cmd)
+            requires = []
+            for name in service.dependencies:
+                requires.extend(steps.get(name, []))
+            cmds = service.startup
+            if not service.custom:
+                cmds = service.get_startup(node)
+            wait = service.validation_mode == ServiceMode.BLOCKING
+            service_steps = list(requires)
+            for cmd in cmds:
+                step = script.add((service, "startup"), cmd, wait, requires)
+                service_steps.append(step)
+            if service.name in dependencies and not wait:
+                probes = []
+                if service.validation_mode == ServiceMode.NON_BLOCKING:
+                    probes = self.get_readiness(node, service)
+                cmd = wait_command(
+                    probes, service.validation_timer, service.validation_period
+                )
+                step = script.add((service, "ready"), cmd, True, service_steps)
+                service_steps.append(step)
+            steps[service.name] = service_steps
+
+        failures = {}
+        for (service, kind), status, output in script.run(node):
+            if not status:
+                continue
+            if kind == "dir":
+                logging.warning(
+                    "error mounting private dir for service '%s': %s",
+                    service.name,
+                    output,
+                )
+            elif service.name not in failures:
+                failures[service.name] = (kind, status, output)
+
+        # services are not started when a dependency failed
+        failed = set()
+        errors = []
+        for service in services:
+            if any(x in failed for x in service.dependencies):
+                failed.add(service.name)
+                continue
+            if service.name not in failures:
+                continue
+            kind, status, output = failures[service.name]
+            logging.error(
+                "node(%s) service(%s) %s failed status(%s): %s",
+                node.name,
+                service.name,
+                kind,
+                status,
+                output,
+            )
+            failed.add(service.name)
+            if kind == "startup":
+                errors.append(
+                    "node(%s) service(%s) error during startup"
+                    % (node.name, service.name)
+                )
+            elif kind == "ready":
+                errors.append(
                     "node(%s) service(%s) failed validation" % (node.name, service.name)
                 )
+        if errors:
+            raise ServiceBootError(*errors)
+
+        # remaining services are checked for readiness by the prober
+        futures = []
+        for service in services:
+            if service.name in dependencies:
+                continue
+            if service.validation_mode == ServiceMode.TIMER:
+                future = self.prober.watch(
+                    node, service.name, [], service.validation_timer
+                )
+                futures.append(future)
+            elif service.validation_mode == ServiceMode.NON_BLOCKING:
+                probes = self.get_readiness(node, service)
+                if not probes:
+                    continue
+                error = ServiceBootError(
+                    "node(%s) service(%s) failed validation" % (node.name, service.name)
+                )
+                future = self.prober.watch(
+                    node,
+                    service.name,
+                    probes,
+                    service.validation_timer,
+                    service.validation_period,
+                    error,
+                )
+                futures.append(future)
+        return gather(futures)
+
+    def get_readiness(self, node, service):
+        """
+        Get the probes checking a service is ready, its declared readiness probes,
+        otherwise its validate commands.
+
+        :param core.nodes.base.CoreNode node: node running service
+        :param CoreService service: service to get probes for
+        :return: readiness probes
+        :rtype: list[core.services.readiness.ReadinessProbe]
+        """
+        if service.readiness:
+            return list(service.readiness)
+        cmds = service.validate
+        if not service.custom:
+            cmds = service.get_validate(node)
+        return [Command(x) for x in cmds]
 
     def copy_service_file(self, node, filename, cfg):
         """
@@ -612,8 +1324,28 @@ class CoreServices:
         :param core.netns.vnode.CoreNode node: node to stop services on
         :return: nothing
         """
+        if not self.use_scripts():
+            for service in node.services:
+                self.stop_service(node, service)
+            return
+
+        script = ServiceScript()
         for service in node.services:
-            self.stop_service(node, service)
+            for args in service.shutdown:
+                script.add(service, args)
+        for service, status, output in script.run(node):
+            if status:
+                self.session.exception(
+                    ExceptionLevels.ERROR,
+                    "services",
+                    node.id,
+                    f"error stopping service {service.name}: {output}",
+                )
+                logging.error(
+                    "error running stop command for service(%s): %s",
+                    service.name,
+                    output,
+                )
 
     def stop_service(self, node, service):
         """
@@ -750,7 +1482,12 @@ class CoreServices:
         if not service.custom:
             config_files = service.get_configs(node)
 
+        fingerprint = self.file_cache.fingerprint(node, service)
         for file_name in config_files:
+            cfg = self.file_cache.get(node, service, file_name, fingerprint)
+            if cfg is not None:
+                self.file_cache.write(node, service, file_name, fingerprint, cfg)
+                continue
             logging.debug(
                 "generating service config custom(%s): %s", service.custom, file_name
             )
@@ -769,7 +1506,7 @@ class CoreServices:
             else:
                 cfg = service.generate_config(node, file_name)
 
-            node.nodefile(file_name, cfg)
+            self.file_cache.write(node, service, file_name, fingerprint, cfg)
 
     def service_reconfigure(self, node, service):
         """
@@ -783,16 +1520,19 @@ class CoreServices:
         if not service.custom:
             config_files = service.get_configs(node)
 
+        fingerprint = self.file_cache.fingerprint(node, service)
         for file_name in config_files:
             if file_name[:7] == "file:///":
                 # TODO: implement this
                 raise NotImplementedError
 
-            cfg = service.config_data.get(file_name)
+            cfg = self.file_cache.get(node, service, file_name, fingerprint)
+            if cfg is None:
+                cfg = service.config_data.get(file_name)
             if cfg is None:
                 cfg = service.generate_config(node, file_name)
 
-            node.nodefile(file_name, cfg)
+            self.file_cache.write(node, service, file_name, fingerprint, cfg)
 
 
 class CoreService:
@@ -839,6 +1579,10 @@ class CoreService:
     # validation period in seconds, how frequent validation is attempted
     validation_period = 0.5
 
+    # readiness probes checked instead of validate commands in non-blocking mode,
+    # see core.services.readiness
+    readiness = ()
+
     # metadata associated with this service
     meta = None
 
@@ -0,0 +1,326 @@
+"""
+readiness.py: probes services declare to check they are ready after startup,
+checked for all nodes by a single prober thread rather than boot workers.
+"""
+
+import concurrent.futures
+import logging
+import math
+import shlex
+import threading
+import time
+
+from core import utils
+from core.errors import CoreCommandError
+
+
+class ReadinessProbe:
+    """
+    Check a service is ready, as a shell command run within the node.
+    """
+
+    def shell(self):
+        """
+        Shell command succeeding when the check passes.
+
+        :return: shell command
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.shell()})"
+
+
+class FileExists(ReadinessProbe):
+    """
+    Ready when a file exists within the node.
+    """
+
+    def __init__(self, path):
+        """
+        Create a FileExists instance.
+
+        :param str path: path to file within node
+        """
+        self.path = path
+
+    def shell(self):
+        return f"test -e {shlex.quote(self.path)}"
+
+
+class PidFile(FileExists):
+    """
+    Ready when a pid file exists within the node, for a running process.
+    """
+
+    def shell(self):
+        path = shlex.quote(self.path)
+        return f'test -s {path} && kill -0 "$(cat {path})"'
+
+
+class TcpPort(ReadinessProbe):
+    """
+    Ready when a port is listening for tcp connections within the node.
+    """
+
+    def __init__(self, port):
+        """
+        Create a TcpPort instance.
+
+        :param int port: port to check
+        """
+        self.port = int(port)
+
+    def shell(self):
+        return f"ss -Hltn 'sport = :{self.port}' | grep -q ."
+
+
+class UdpPort(TcpPort):
+    """
+    Ready when a port is bound for udp within the node.
+    """
+
+    def shell(self):
+        return f"ss -Hlun 'sport = :{self.port}' | grep -q ."
+
+
+class Command(ReadinessProbe):
+    """
+    Ready when a command succeeds within the node.
+    """
+
+    def __init__(self, command):
+        """
+        Create a Command instance.
+
+        :param str command: command to run
+        """
+        self.command = command
+
+    def shell(self):
+        return self.command
+
+
+def wait_command(probes, timeout, period):
+    """
+    Shell command waiting within the node for probes to pass, for running along
+    with other commands.
+
+    :param list[ReadinessProbe] probes: probes that must all pass, empty to wait
+        for the timeout
+    :param float timeout: seconds to wait for probes to pass
+    :param float period: seconds between checking probes
+    :return: shell command, failing when probes have not passed in time
+    :rtype: str
+    """
+    if not probes:
+        return f"sleep {timeout}"
+    checks = " && ".join(f"({x.shell()}) >/dev/null 2>&1" for x in probes)
+    tries = max(1, math.ceil(timeout / period))
+    return (
+        f"i=0; until {checks}; do i=$((i + 1)); "
+        f"[ $i -ge {tries} ] && exit 1; sleep {period}; done"
+    )
+
+
+def gather(futures):
+    """
+    Combine readiness futures into one.
+
+    :param list[concurrent.futures.Future] futures: futures to combine
+    :return: future completed once all futures are, failing with the first
+        failure, None when there are no futures
+    :rtype: concurrent.futures.Future
+    """
+    if not futures:
+        return None
+    if len(futures) == 1:
+        return futures[0]
+    combined = concurrent.futures.Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def done(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        errors = [x.exception() for x in futures if x.exception()]
+        if errors:
+            combined.set_exception(errors[0])
+        else:
+            combined.set_result(None)
+
+    for future in futures:
+        future.add_done_callback(done)
+    return combined
+
+
+class ServiceProber:
+    """
+    Checks readiness probes for services on all nodes from a single thread.
+
+    Each round runs a single command for each node, checking all probes due for
+    the node, with nodes checked in parallel. Services are ready when all their
+    probes pass, or when their wait time is up, for services without probes.
+    """
+
+    def __init__(self, workers=10):
+        """
+        Create a ServiceProber instance.
+
+        :param int workers: maximum nodes checked at once
+        """
+        self.workers = workers
+        self.watches = []
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def watch(self, node, name, probes, timeout, period=0.5, error=None):
+        """
+        Watch for a service to become ready.
+
+        :param core.nodes.base.CoreNode node: node running service
+        :param str name: name of service, for logging
+        :param list[ReadinessProbe] probes: probes that must all pass, empty to
+            be ready when the timeout is up
+        :param float timeout: seconds to wait for probes to pass
+        :param float period: seconds between checking probes
+        :param Exception error: exception the future fails with when probes have
+            not passed within the timeout
+        :return: future completed when the service is ready, or failed
+        :rtype: concurrent.futures.Future
+        """
+        future = concurrent.futures.Future()
+        now = time.monotonic()
+        watch = _Watch(node, name, list(probes), now + timeout, period, error, future)
+        with self.condition:
+            self.watches.append(watch)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+        return future
+
+    def run(self):
+        """
+        Check probes due, until there are no services being watched.
+
+        :return: nothing
+        """
+        while True:
+            with self.condition:
+                while True:
+                    if not self.watches:
+                        self.thread = None
+                        return
+                    now = time.monotonic()
+                    due = min(x.next_check for x in self.watches)
+                    if due <= now:
+                        break
+                    self.condition.wait(due - now)
+                watches = [x for x in self.watches if x.next_check <= now]
+            self.check(watches, now)
+
+    def check(self, watches, now):
+        """
+        Check probes for watched services, a single command for each node.
+
+        :param list watches: watched services due to be checked
+        :param float now: time of check
+        :return: nothing
+        """
+        nodes = {}
+        for watch in watches:
+            if watch.probes:
+                nodes.setdefault(watch.node, []).append(watch)
+        funcs = [(self.check_node, (x, nodes[x]), {}) for x in nodes]
+        if funcs:
+            utils.threadpool(funcs, self.workers)
+        for watch in watches:
+            if not watch.probes:
+                if watch.deadline <= now:
+                    self.finish(watch, None)
+                else:
+                    watch.next_check = watch.deadline
+            elif all(watch.passed):
+                self.finish(watch, None)
+            elif watch.deadline <= now:
+                logging.debug(
+                    "node(%s) service(%s) probes not ready: %s",
+                    watch.node.name,
+                    watch.name,
+                    [x for x, ok in zip(watch.probes, watch.passed) if not ok],
+                )
+                self.finish(watch, watch.error)
+            else:
+                watch.next_check = min(now + watch.period, watch.deadline)
+
+    @staticmethod
+    def check_node(node, watches):
+        """
+        Check probes not yet passed for services on a node, as a single command.
+        The command succeeds when all probes pass, otherwise the indices of
+        passing probes are echoed so they are not checked again.
+
+        :param core.nodes.base.CoreNode node: node to check
+        :param list watches: watched services on node
+        :return: nothing
+        """
+        lines = ["status=0"]
+        pending = []
+        for watch in watches:
+            for index, probe in enumerate(watch.probes):
+                if watch.passed[index]:
+                    continue
+                lines.append(
+                    f"if ({probe.shell()}) >/dev/null 2>&1; "
+                    f"then echo {len(pending)}; else status=1; fi"
+                )
+                pending.append((watch, index))
+        lines.append("exit $status")
+        script = "\n".join(lines)
+        try:
+            node.cmd(f"sh -c {shlex.quote(script)}")
+        except CoreCommandError as e:
+            logging.debug("node(%s) probe check failed: %s", node.name, e)
+            for line in (e.output or "").split():
+                if line.isdigit() and int(line) < len(pending):
+                    watch, index = pending[int(line)]
+                    watch.passed[index] = True
+            return
+        for watch, index in pending:
+            watch.passed[index] = True
+
+    def finish(self, watch, error):
+        """
+        Stop watching a service, completing its future.
+
+        :param watch: watched service
+        :param Exception error: exception to fail with, None when ready
+        :return: nothing
+        """
+        with self.condition:
+            self.watches.remove(watch)
+        if error is None:
+            watch.future.set_result(None)
+        else:
+            watch.future.set_exception(error)
+
+
+class _Watch:
+    """
+    Service being watched for readiness.
+    """
+
+    def __init__(self, node, name, probes, deadline, period, error, future):
+        self.node = node
+        self.name = name
+        self.probes = probes
+        self.passed = [False] * len(probes)
+        self.deadline = deadline
+        self.period = period
+        self.next_check = time.monotonic() if probes else deadline
+        self.error = error
+        self.future = future
@@ -0,0 +1,102 @@
+"""
+script.py: runs a sequence of service commands within a node as a single
+generated shell script, rather than a node command for each.
+"""
+
+import logging
+import shlex
+
+from core.errors import CoreCommandError
+
+# marks the exit status of a step within script output
+STEP_MARKER = "__core_step__"
+
+
+class ServiceScript:
+    """
+    Compiles node commands into a shell script, run with a single node command,
+    reporting the exit status and output of each command.
+    """
+
+    def __init__(self):
+        """
+        Create a ServiceScript instance.
+        """
+        self.steps = []
+
+    def add(self, label, cmd, wait=True, requires=()):
+        """
+        Add a command to the script.
+
+        :param label: label for the command, returned with its result
+        :param str cmd: command to run within the node
+        :param bool wait: True to wait for the command status, False to run it in
+            the background, always succeeding
+        :param requires: steps that must succeed for the command to run, skipped
+            commands are not reached
+        :return: step of the command
+        :rtype: int
+        """
+        self.steps.append((label, cmd, wait, tuple(requires)))
+        return len(self.steps) - 1
+
+    def script(self):
+        """
+        Generate the shell script, printing a marker with the exit status after
+        each command.
+
+        :return: shell script
+        :rtype: str
+        """
+        lines = []
+        for index, (_, cmd, wait, requires) in enumerate(self.steps):
+            if requires:
+                condition = " && ".join(f'[ "$s{x}" = 0 ]' for x in requires)
+                lines.append(f"if {condition}; then")
+            if wait:
+                lines.append(f"({cmd}) 2>&1")
+                lines.append(f"s{index}=$?")
+            else:
+                lines.append(f"({cmd}) >/dev/null 2>&1 &")
+                lines.append(f"s{index}=0")
+            lines.append(f'printf "\\n{STEP_MARKER} {index} %d\\n" $s{index}')
+            if requires:
+                lines.append(f"else s{index}=1; fi")
+        lines.append("true")
+        return "\n".join(lines)
+
+    def run(self, node):
+        """
+        Run the script within a node.
+
+        :param core.nodes.base.CoreNode node: node to run script in
+        :return: label, exit status and output of each command, commands the
+            script did not reach have a status of -1
+        :rtype: list[tuple]
+        """
+        if not self.steps:
+            return []
+        script = self.script()
+        try:
+            output = node.cmd(f"sh -c {shlex.quote(script)}")
+        except CoreCommandError as e:
+            logging.error("node(%s) error running script: %s", node.name, e)
+            output = e.output or ""
+            if isinstance(output, bytes):
+                output = output.decode("utf-8", "replace")
+        statuses = {}
+        outputs = {}
+        lines = []
+        for line in output.splitlines():
+            values = line.split()
+            if len(values) == 3 and values[0] == STEP_MARKER:
+                index = int(values[1])
+                statuses[index] = int(values[2])
+                outputs[index] = "\n".join(lines).strip()
+                lines = []
+            else:
+                lines.append(line)
+        results = []
+        for index, (label, _, _, _) in enumerate(self.steps):
+            results.append((label, statuses.get(index, -1), outputs.get(index, "")))
+        return results
@@ -329,18 +329,19 @@ def load_config(filename, d):
             logging.exception("error reading file to dict: %s", filename)
 
 
-def load_classes(path, clazz):
+def find_modules(path):
     """
-    Dynamically load classes for use within CORE.
+    Find python modules within a path, making them importable.
 
-    :param path: path to load classes from
-    :param clazz: class type expected to be inherited from for loading
-    :return: list of classes loaded
+    :param str path: path to find modules in
+    :return: import name and file path of each module
+    :rtype: list[tuple]
     """
     # validate path exists
-    logging.debug("attempting to load modules from path: %s", path)
+    logging.debug("attempting to find modules from path: %s", path)
     if not os.path.isdir(path):
         logging.warning("invalid custom module directory specified" ": %s", path)
+        return []
     # check if path is in sys.path
     parent_path = os.path.dirname(path)
     if parent_path not in sys.path:
@@ -351,19 +352,39 @@ def load_classes(path, clazz):
     base_module = os.path.basename(path)
     module_names = os.listdir(path)
     module_names = filter(lambda x: _valid_module(path, x), module_names)
-    module_names = map(lambda x: x[:-3], module_names)
+    return [
+        (f"{base_module}.{x[:-3]}", os.path.join(path, x)) for x in sorted(module_names)
+    ]
+
 
+def load_module_classes(import_statement, clazz):
+    """
+    Import a module and load classes defined within it.
+
+    :param str import_statement: name of module to import
+    :param clazz: class type expected to be inherited from for loading
+    :return: list of classes loaded
+    :raises Exception: when the module fails to import
+    """
+    logging.debug("importing custom module: %s", import_statement)
+    module = importlib.import_module(import_statement)
+    members = inspect.getmembers(module, lambda x: _is_class(module, x, clazz))
+    return [x[1] for x in members]
+
+
+def load_classes(path, clazz):
+    """
+    Dynamically load classes for use within CORE.
+
+    :param path: path to load classes from
+    :param clazz: class type expected to be inherited from for loading
+    :return: list of classes loaded
+    """
     # import and add all service modules in the path
     classes = []
-    for module_name in module_names:
-        import_statement = f"{base_module}.{module_name}"
-        logging.debug("importing custom module: %s", import_statement)
+    for import_statement, _ in find_modules(path):
         try:
-            module = importlib.import_module(import_statement)
-            members = inspect.getmembers(module, lambda x: _is_class(module, x, clazz))
-            for member in members:
-                valid_class = member[1]
-                classes.append(valid_class)
+            classes.extend(load_module_classes(import_statement, clazz))
         except Exception:
             logging.exception(
                 "unexpected error during import, skipping: %s", import_statement
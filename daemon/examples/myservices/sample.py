@@ -28,6 +28,8 @@ class MyService(CoreService):
         success in TIMER/NON_BLOCKING modes.
     :var float validation_validation_period: period in seconds to wait before retrying validation,
         only used in NON_BLOCKING mode
+    :var tuple readiness: probes from core.services.readiness checked instead of validation commands
+        in NON_BLOCKING mode, e.g. PidFile, TcpPort, UdpPort, FileExists or Command
     :var tuple shutdown: shutdown commands to stop this service
     """
 
@@ -42,6 +44,7 @@ class MyService(CoreService):
     validation_mode = ServiceMode.NON_BLOCKING
     validation_timer = 5
     validation_period = 0.5
+    readiness = ()
     shutdown = ()
 
     @classmethod
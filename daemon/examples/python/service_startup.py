@@ -0,0 +1,76 @@
+"""
+Measures the time and memory taken to load CORE services in a fresh process,
+with the on-disk service index cold (cleared) and warm.
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+DEFAULT_RUNS = 5
+
+LOAD_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+from core.services.coreservices import ServiceManager
+ServiceManager.cache_dir = sys.argv[1]
+import core.services
+core.services.load()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "time": elapsed,
+    "maxrss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "services": len(ServiceManager.all_services()),
+    "imported": len(ServiceManager.services),
+}))
+"""
+
+
+def load(cache_dir):
+    output = subprocess.check_output([sys.executable, "-c", LOAD_SCRIPT, cache_dir])
+    return json.loads(output)
+
+
+def report(name, results):
+    times = [x["time"] for x in results]
+    maxrss = [x["maxrss"] for x in results]
+    print(
+        f"{name}: median {statistics.median(times):.3f}s "
+        f"min {min(times):.3f}s maxrss {statistics.median(maxrss):.0f}KB "
+        f"services {results[-1]['services']} imported {results[-1]['imported']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CORE service loading")
+    parser.add_argument(
+        "-r",
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help="number of processes to measure for each case",
+    )
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cold = []
+        for _ in range(args.runs):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cold.append(load(cache_dir))
+        warm = [load(cache_dir) for _ in range(args.runs)]
+        uncached = [load("") for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    report("no index", uncached)
+    report("cold index", cold)
+    report("warm index", warm)
+
+
+if __name__ == "__main__":
+    main()
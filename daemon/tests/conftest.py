@@ -19,6 +19,7 @@ from core.emulator.emudata import IpPrefixes
 from core.emulator.enumerations import EventTypes
 from core.emulator.session import Session
 from core.nodes.base import CoreNode
+from core.services.coreservices import ServiceManager
 
 EMANE_SERVICES = "zebra|OSPFv3MDR|IPForward"
 
@@ -48,6 +49,14 @@ class MockServer:
         self.coreemu = coreemu
 
 
+@pytest.fixture(scope="session", autouse=True)
+def services_cache():
+    cache_dir = ServiceManager.cache_dir
+    ServiceManager.cache_dir = None
+    yield
+    ServiceManager.cache_dir = cache_dir
+
+
 @pytest.fixture(scope="session")
 def patcher(request):
     patch_manager = PatchManager()
@@ -164,12 +164,47 @@ class TestCore:
         status = ping(node_one, node_two, ip_prefixes)
         assert not status
 
-    def test_mobility(self, session, ip_prefixes):
+    def test_wlan_range(self, session, ip_prefixes):
+        """
+        Test wlan links follow node range as nodes move.
+
+        :param core.emulator.coreemu.EmuSession session: session for test
+        :param ip_prefixes: generates ip addresses for nodes
+        """
+        # given
+        wlan_node = session.add_node(_type=NodeTypes.WIRELESS_LAN)
+        session.mobility.set_model(wlan_node, BasicRangeModel, {"range": "100"})
+        options = NodeOptions(model="mdr")
+        options.set_position(0, 0)
+        node_one = session.add_node(options=options)
+        node_two = session.add_node(options=options)
+        for node in [node_one, node_two]:
+            interface = ip_prefixes.create_interface(node)
+            session.add_link(node.id, wlan_node.id, interface_one=interface)
+        session.instantiate()
+        netif_one = node_one.netif(0)
+        netif_two = node_two.netif(0)
+        model = wlan_node.model
+        model.set_position(netif_one, 0, 0, 0)
+        model.set_position(netif_two, 50, 0, 0)
+        assert wlan_node.linked(*sorted([netif_one, netif_two]))
+
+        # when
+        model.set_position(netif_two, 1000, 1000, 0)
+
+        # then
+        assert not wlan_node.linked(*sorted([netif_one, netif_two]))
+        model.set_position(netif_two, 0, 50, 0)
+        assert wlan_node.linked(*sorted([netif_one, netif_two]))
+
+    @pytest.mark.parametrize("link_events", ["0", "1"])
+    def test_mobility(self, session, ip_prefixes, link_events):
         """
         Test basic wlan network.
 
         :param core.emulator.coreemu.EmuSession session: session for test
         :param ip_prefixes: generates ip addresses for nodes
+        :param str link_events: schedule range calculations by link changes
         """
 
         # create wlan
@@ -197,6 +232,7 @@ class TestCore:
             "script_start": "",
             "script_pause": "",
             "script_stop": "",
+            "link_events": link_events,
         }
         session.mobility.set_model(wlan_node, Ns2ScriptedMobility, config)
 
@@ -0,0 +1,41 @@
+import threading
+
+from core.location.event import EventLoop
+
+
+class TestEventLoop:
+    def test_run_events(self):
+        # given
+        event_loop = EventLoop()
+        results = []
+        done = threading.Event()
+        event_loop.add_event(0.02, results.append, 2)
+        event_loop.add_event(0.01, results.append, 1)
+        canceled = event_loop.add_event(0.01, results.append, 0)
+        canceled.cancel()
+        event_loop.add_event(0.03, done.set)
+
+        # when
+        event_loop.run()
+        done.wait(1)
+        event_loop.stop()
+
+        # then
+        assert results == [1, 2]
+        stats = event_loop.stats()
+        assert stats["events"] == 4
+        assert stats["queued"] == 0
+
+    def test_earlier_event(self):
+        # given
+        event_loop = EventLoop()
+        done = threading.Event()
+        event_loop.run()
+        event_loop.add_event(10, done.set)
+
+        # when
+        event_loop.add_event(0.01, done.set)
+
+        # then
+        assert done.wait(1)
+        event_loop.stop()
@@ -0,0 +1,170 @@
+import threading
+
+from core.emulator.data import EventData, LinkData, NodeData
+from core.emulator.enumerations import MessageFlags
+from core.emulator.eventbus import EventBus, OverflowPolicy, position_key
+
+ADD = MessageFlags.ADD.value
+DELETE = MessageFlags.DELETE.value
+
+
+class TestEventBus:
+    def test_publish(self):
+        # given
+        bus = EventBus()
+        received = []
+        done = threading.Event()
+
+        def handle_event(event_data):
+            received.append(event_data)
+            done.set()
+
+        bus.subscribe("test", {EventData: handle_event})
+
+        # when
+        bus.publish(NodeData(id=1))
+        bus.publish(EventData(node=1))
+
+        # then
+        assert done.wait(1)
+        assert received == [EventData(node=1)]
+        bus.shutdown()
+
+    def test_drop_oldest(self):
+        # given
+        bus = EventBus()
+        blocked = threading.Event()
+        subscriber = bus.subscribe(
+            "test", {EventData: lambda x: blocked.wait(1)}, maxsize=2
+        )
+
+        # when
+        for node_id in range(4):
+            bus.publish(EventData(node=node_id))
+
+        # then
+        stats = subscriber.stats()
+        assert stats["depth"] == 2
+        assert stats["dropped"] >= 1
+        blocked.set()
+        bus.shutdown()
+
+    def test_coalesce(self):
+        # given
+        bus = EventBus()
+        started = threading.Event()
+        blocked = threading.Event()
+        received = []
+
+        def handle_node(node_data):
+            started.set()
+            blocked.wait(1)
+            received.append(node_data)
+
+        subscriber = bus.subscribe(
+            "test",
+            {NodeData: handle_node, LinkData: received.append},
+            policy=OverflowPolicy.COALESCE,
+        )
+        bus.publish(NodeData(message_type=0, id=0))
+        started.wait(1)
+
+        # when
+        bus.publish(LinkData(node1_id=1, node2_id=2, message_type=ADD))
+        for x in range(3):
+            bus.publish(NodeData(message_type=0, id=1, x_position=x))
+            bus.publish(LinkData(node1_id=1, node2_id=2, message_type=0, delay=x))
+        bus.publish(LinkData(node1_id=1, node2_id=2, message_type=DELETE))
+
+        # then
+        stats = subscriber.stats()
+        assert stats["depth"] == 4
+        assert stats["coalesced"] == 4
+        links = [x for x in subscriber.queue.values() if isinstance(x, LinkData)]
+        assert [(x.message_type, x.delay) for x in links] == [
+            (ADD, None),
+            (0, 2),
+            (DELETE, None),
+        ]
+        blocked.set()
+        bus.shutdown()
+
+    def test_publish_positions(self):
+        # given
+        bus = EventBus()
+        batches = []
+        nodes = []
+        done = threading.Semaphore(0)
+
+        def handle_batch(batch):
+            batches.append(batch)
+            done.release()
+
+        def handle_node(node_data):
+            nodes.append(node_data)
+            done.release()
+
+        bus.subscribe("batches", {list: handle_batch}, policy=OverflowPolicy.BLOCK)
+        bus.subscribe("nodes", {NodeData: handle_node})
+        positions = [NodeData(message_type=0, id=x) for x in range(3)]
+        node_data = [NodeData(message_type=0, id=x, model="router") for x in range(3)]
+
+        # when
+        subscribed = bus.node_subscribed()
+        bus.publish_positions(positions, node_data)
+
+        # then
+        for _ in range(4):
+            assert done.acquire(timeout=1)
+        assert subscribed
+        assert batches == [positions]
+        assert nodes == node_data
+        bus.shutdown()
+
+    def test_select_position_rate(self):
+        # given
+        bus = EventBus()
+        subscriber = bus.subscribe(
+            "test",
+            {list: None},
+            policy=OverflowPolicy.COALESCE,
+            key=position_key,
+            select=lambda x: [y for y in x if y.id != 0] or None,
+            position_rate=1,
+            deliver=False,
+        )
+
+        # when
+        bus.publish_positions([NodeData(message_type=0, id=x) for x in range(2)])
+        first = subscriber.get(timeout=1)
+        bus.publish_positions([NodeData(message_type=0, id=0)])
+        moved = [NodeData(message_type=0, id=x, x_position=1) for x in range(3)]
+        bus.publish_positions(moved)
+        held = subscriber.get(timeout=0.1)
+        second = subscriber.get(timeout=2)
+
+        # then
+        assert [x.id for x in first] == [1]
+        assert held is None
+        assert [(x.id, x.x_position) for x in second] == [(1, 1), (2, 1)]
+        assert subscriber.stats()["depth"] == 0
+        bus.shutdown()
+
+    def test_position_rate_coalesces(self):
+        # given
+        bus = EventBus()
+        subscriber = bus.subscribe("test", {list: None}, position_rate=1, deliver=False)
+
+        # when
+        bus.publish_positions([NodeData(message_type=0, id=0)])
+        first = subscriber.get(timeout=1)
+        for x in range(3):
+            bus.publish_positions([NodeData(message_type=0, id=x, x_position=x)])
+        depth = subscriber.stats()["depth"]
+        second = subscriber.get(timeout=2)
+
+        # then
+        assert [x.id for x in first] == [0]
+        assert depth == 1
+        assert [(x.id, x.x_position) for x in second] == [(0, 0), (1, 1), (2, 2)]
+        bus.shutdown()
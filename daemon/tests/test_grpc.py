@@ -7,9 +7,10 @@ from mock import patch
 
 from core.api.grpc import core_pb2
 from core.api.grpc.client import CoreGrpcClient, InterfaceHelper
+from core.api.grpc.events import EventCache
 from core.config import ConfigShim
 from core.emane.ieee80211abg import EmaneIeee80211abgModel
-from core.emulator.data import EventData
+from core.emulator.data import EventData, NodeData
 from core.emulator.emudata import NodeOptions
 from core.emulator.enumerations import (
     ConfigFlags,
@@ -18,7 +19,11 @@ from core.emulator.enumerations import (
     NodeTypes,
 )
 from core.errors import CoreError
-from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
+from core.location.mobility import (
+    BasicRangeModel,
+    Ns2ScriptedMobility,
+    RandomWaypointMobility,
+)
 from core.xml.corexml import CoreXmlWriter
 
 
@@ -823,6 +828,28 @@ class TestGrpc:
         config = session.mobility.get_model_config(wlan.id, Ns2ScriptedMobility.name)
         assert config[config_key] == config_value
 
+    def test_set_mobility_config_model(self, grpc_server):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        wlan = session.add_node(_type=NodeTypes.WIRELESS_LAN)
+        config_key = "seed"
+        config_value = "7"
+
+        # then
+        with client.context_connect():
+            response = client.set_mobility_config(
+                session.id,
+                wlan.id,
+                {config_key: config_value},
+                model=RandomWaypointMobility.name,
+            )
+
+        # then
+        assert response.result is True
+        config = session.mobility.get_model_config(wlan.id, RandomWaypointMobility.name)
+        assert config[config_key] == config_value
+
     def test_mobility_action(self, grpc_server):
         # given
         client = CoreGrpcClient()
@@ -1003,6 +1030,50 @@ class TestGrpc:
             # then
             queue.get(timeout=5)
 
+    def test_node_events_filtered(self, grpc_server):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        node_one = session.add_node()
+        node_two = session.add_node()
+        queue = Queue()
+
+        def handle_event(event_data):
+            queue.put(event_data)
+
+        # then
+        with client.context_connect():
+            client.events(
+                session.id,
+                handle_event,
+                [core_pb2.EventType.NODE],
+                node_ids=[node_two.id],
+            )
+            time.sleep(0.1)
+            session.broadcast_node(node_one.data(message_type=0))
+            session.broadcast_node(node_two.data(message_type=0))
+
+            # then
+            event_data = queue.get(timeout=5)
+            assert event_data.node_event.node.id == node_two.id
+
+    def test_event_cache(self):
+        # given
+        cache = EventCache()
+        node_data = NodeData(message_type=0, id=1, name="n1", x_position=10)
+        batch = [node_data]
+
+        # when
+        node_event = cache.get(1, node_data)
+        batch_event = cache.get(1, batch)
+
+        # then
+        assert cache.get(1, node_data) is node_event
+        assert cache.get(1, batch) is batch_event
+        assert cache.get(1, list(batch)) is not batch_event
+        assert batch_event.node_event.nodes[0].position.x == 10
+        assert cache.stats()["hits"] == 3
+
     def test_link_events(self, grpc_server, ip_prefixes):
         # given
         client = CoreGrpcClient()
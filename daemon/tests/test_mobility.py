@@ -0,0 +1,338 @@
+import math
+import os
+import random
+import threading
+from functools import total_ordering
+
+import mock
+import pytest
+
+from core.location.mobility import (
+    BasicRangeModel,
+    GaussMarkovMobility,
+    Ns2Script,
+    RandomWalkMobility,
+    RandomWaypointMobility,
+    WayPoint,
+    WayPointMobility,
+)
+from core.location.timeline import LinkTimeline, RangeCrossings
+from core.nodes.base import Position
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@total_ordering
+class Interface:
+    def __init__(self, _id, position):
+        self.id = _id
+        self.position = position
+        self.node = mock.MagicMock(id=_id)
+        self.node.getposition.side_effect = lambda: self.position
+
+    def __eq__(self, other):
+        return self is other
+
+    def __lt__(self, other):
+        return self.id < other.id
+
+    __hash__ = object.__hash__
+
+
+class Wlan:
+    def __init__(self):
+        self.id = 0
+        self.policy = "DROP"
+        self.links = set()
+        self._linked_lock = threading.Lock()
+
+    def linked(self, netif1, netif2):
+        return (netif1, netif2) in self.links
+
+    def link(self, netif1, netif2):
+        self.links.add((netif1, netif2))
+
+    def unlink(self, netif1, netif2):
+        self.links.discard((netif1, netif2))
+
+
+def run_range_model(vectorized, positions, moves):
+    wlan = Wlan()
+    session = mock.MagicMock()
+    session.get_node.return_value = wlan
+    session.options.get_config.return_value = str(vectorized)
+    model = BasicRangeModel(session, wlan.id)
+    config = model.default_values()
+    config["range"] = "100"
+    model.values_from_config(config)
+    netifs = [Interface(_id, position) for _id, position in enumerate(positions)]
+    for netif in netifs:
+        model.set_position(netif, *netif.position)
+    rounds = []
+    for move in moves:
+        for _id, position in move.items():
+            netifs[_id].position = position
+        model.update(True, [netifs[x] for x in move])
+        rounds.append({(a.id, b.id) for a, b in wlan.links})
+    return model, rounds
+
+
+class TestRangeCrossings:
+    def test_update(self):
+        # given
+        crossings = RangeCrossings(100)
+        motions = {1: (0.0, 0.0, None, 0.0, 0.0), 2: (-150.0, 0.0, None, 100.0, 0.0)}
+
+        # when
+        entry_time = crossings.update(motions, {1, 2}, 0.0)
+        entry_pairs = crossings.due(entry_time)
+        exit_time = crossings.update(motions, set(), entry_time)
+        exit_pairs = crossings.due(exit_time)
+
+        # then
+        assert entry_time == pytest.approx(0.5)
+        assert exit_time == pytest.approx(2.5)
+        assert entry_pairs == [(1, 2)]
+        assert exit_pairs == [(1, 2)]
+        assert crossings.update(motions, set(), exit_time) == math.inf
+
+
+class TestLinkTimeline:
+    def test_calculate(self):
+        # given
+        positions = {1: (0.0, 0.0, None), 2: (500.0, 0.0, None)}
+        waypoints = [
+            WayPoint(1.0, 2, (0.0, 0.0, None), 100.0),
+            WayPoint(10.0, 2, (500.0, 0.0, None), 100.0),
+        ]
+
+        # when
+        timeline = LinkTimeline.calculate("key", positions, waypoints, 100)
+
+        # then
+        assert [x[1:] for x in timeline.links] == [[1, 2, True], [1, 2, False]]
+        assert timeline.links[0][0] == pytest.approx(5.0)
+        assert timeline.links[1][0] == pytest.approx(11.0)
+        assert timeline.endtime == pytest.approx(15.0)
+
+    def test_calculate_instant(self):
+        # given
+        positions = {1: (0.0, 0.0, None), 2: (500.0, 0.0, None)}
+        waypoints = [
+            WayPoint(1.0, 2, (50.0, 0.0, None), 0),
+            WayPoint(2.0, 2, (500.0, 0.0, None), 0),
+        ]
+
+        # when
+        timeline = LinkTimeline.calculate("key", positions, waypoints, 100)
+
+        # then
+        assert timeline.links == [[1.0, 1, 2, True], [2.0, 1, 2, False]]
+
+    def test_save_load(self, tmpdir):
+        # given
+        path = str(tmpdir.join("mobility.scen.timeline"))
+        timeline = LinkTimeline("key", [[1.0, 1, 2, True]], [], 1.0)
+
+        # when
+        timeline.save(path)
+
+        # then
+        assert LinkTimeline.load(path, "other") is None
+        loaded = LinkTimeline.load(path, "key")
+        assert loaded.links == timeline.links
+        assert loaded.endtime == timeline.endtime
+
+
+def run_waypoints(use_engine, moves):
+    session = mock.MagicMock()
+    session.options.get_config.return_value = str(use_engine)
+    nodes = []
+    for node_id in range(1, 5):
+        node = mock.MagicMock(id=node_id)
+        node.position = Position(100.0 * node_id, 100.0, None)
+        node.getposition.side_effect = node.position.get
+        nodes.append(node)
+    netifs = [mock.MagicMock(node=node) for node in nodes]
+    session.get_node.return_value.netifs.return_value = netifs
+    mobility = WayPointMobility(session, 10)
+    mobility.timezero = 0.0
+    mobility.lasttime = 0.0
+    mobility.endtime = 0.0
+    mobility.addwaypoint(0.0, 1, 300.0, 400.0, None, 20.0)
+    mobility.addwaypoint(0.0, 2, 250.0, 100.0, None, 0)
+    mobility.addwaypoint(0.0, 3, -50.0, 0.0, None, 30.0)
+    mobility.addwaypoint(1.0, 4, 0.0, 0.0, None, (-10.0, -5.0))
+    mobility.addwaypoint(2.0, 2, 250.0, 100.0, None, 10.0)
+    rounds = []
+    for step in range(1, 21):
+        now = step * 0.5
+        mobility.lasttime = now
+        if step in moves:
+            node = nodes[moves[step][0] - 1]
+            node.position.set(*moves[step][1])
+            mobility.node_moved(node)
+        mobility.updatepoints(now)
+        moved, _ = mobility.movenodes(0.5)
+        positions = [value for x in nodes for value in x.position.get()[:2]]
+        rounds.append((sorted(x.id for x in moved), positions, set(mobility.points)))
+    return mobility, rounds
+
+
+class TestWayPointMobility:
+    @pytest.mark.skipif(numpy is None, reason="numpy not installed")
+    def test_engine(self):
+        # given
+        moves = {4: (1, (50.0, 60.0, None)), 9: (3, (500.0, 500.0, None))}
+
+        # when
+        node_mobility, node_rounds = run_waypoints(False, moves)
+        engine_mobility, engine_rounds = run_waypoints(True, moves)
+
+        # then
+        assert node_mobility.engine is None
+        assert engine_mobility.engine
+        for node_round, engine_round in zip(node_rounds, engine_rounds):
+            assert engine_round[0] == node_round[0]
+            assert engine_round[1] == pytest.approx(node_round[1])
+            assert engine_round[2] == node_round[2]
+        assert engine_mobility.endtime == node_mobility.endtime
+
+
+class TestBasicRangeModel:
+    @pytest.mark.skipif(numpy is None, reason="numpy not installed")
+    def test_update_vectorized(self):
+        # given
+        rng = random.Random(1)
+        positions = [
+            (rng.uniform(0, 500), rng.uniform(0, 500), rng.choice([None, 0.0, 10.0]))
+            for _ in range(50)
+        ]
+        # pairs exactly at range and with a missing z
+        positions[:3] = [(0.0, 0.0, None), (100.0, 0.0, 0.0), (60.0, 80.0, None)]
+        moves = []
+        for _ in range(10):
+            moved = rng.sample(range(len(positions)), 20)
+            moves.append(
+                {
+                    x: (rng.uniform(0, 500), rng.uniform(0, 500), positions[x][2])
+                    for x in moved
+                }
+            )
+        moves.append({0: (0.0, 100.0, None), 2: (0.0, 200.0, None)})
+
+        # when
+        scalar_model, scalar_rounds = run_range_model(False, positions, moves)
+        numpy_model, numpy_rounds = run_range_model(True, positions, moves)
+
+        # then
+        assert not scalar_model.vectorized
+        assert numpy_model.vectorized
+        assert all(scalar_rounds)
+        assert numpy_rounds == scalar_rounds
+
+
+class TestNs2Script:
+    def test_waypoints(self, tmpdir):
+        # given
+        script_file = tmpdir.join("mobility.scen")
+        script_file.write(
+            "$node_(1) set X_ 10.0\n"
+            "$node_(1) set Y_ 20.0\n"
+            "$node_(2) set X_ 30.0\n"
+            "$node_(2) set Y_ 40.0\n"
+            '$ns_ at 1.0 "$node_(1) setdest 50.0 50.0 5.0"\n'
+            '$ns_ at 3.0 "$node_(1) setdest 60.0 60.0 5.0"\n'
+            '$ns_ at 2.0 "$node_(2) setdest 70.0 70.0 5.0"\n'
+            '$ns_ at 4.0 "$node_(2) setdest 80.0 80.0 5.0"\n'
+        )
+
+        # when
+        script = Ns2Script(str(script_file), {2: 5})
+
+        # then
+        assert script.initial == {1: (10.0, 20.0, None), 5: (30.0, 40.0, None)}
+        assert len(script.runs) == 2
+        assert script.count == 4
+        assert script.endtime == 4.0
+        for _ in range(2):
+            waypoints = [(x.time, x.nodenum) for x in script.waypoints()]
+            assert waypoints == [(1.0, 1), (2.0, 5), (3.0, 1), (4.0, 5)]
+
+    def test_waypoints_sorted(self, tmpdir, monkeypatch):
+        # given
+        monkeypatch.setattr(Ns2Script, "MAX_RUNS", 2)
+        monkeypatch.setattr(Ns2Script, "SORT_LINES", 3)
+        script_file = tmpdir.join("mobility.scen")
+        times = [9, 3, 7, 1, 8, 2, 6, 4, 5, 0]
+        script_file.write(
+            "".join(
+                f'$ns_ at {x}.0 "$node_({x % 3 + 1}) setdest 1.0 2.0 3.0"\n'
+                for x in times
+            )
+        )
+
+        # when
+        script = Ns2Script(str(script_file), {})
+
+        # then
+        assert script.runs == [(0, len(script_file.read_binary()))]
+        assert [x.time for x in script.waypoints()] == sorted(map(float, times))
+
+    def test_waypoints_changed(self, tmpdir):
+        # given
+        script_file = tmpdir.join("mobility.scen")
+        script_file.write('$ns_ at 1.0 "$node_(1) setdest 50.0 50.0 5.0"\n')
+        script = Ns2Script(str(script_file), {})
+        assert [x.coords for x in script.waypoints()] == [(50.0, 50.0, None)]
+
+        # when
+        script_file.write('$ns_ at 1.0 "$node_(1) setdest 60.0 60.0 5.0"\n')
+        stat = os.stat(str(script_file))
+        os.utime(str(script_file), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        waypoints = [x.coords for x in script.waypoints()]
+
+        # then
+        assert waypoints == [(60.0, 60.0, None)]
+
+
+class TestRandomMobility:
+    @pytest.mark.parametrize(
+        "model", [RandomWaypointMobility, RandomWalkMobility, GaussMarkovMobility]
+    )
+    def test_waypoints(self, model):
+        # given
+        session = mock.MagicMock()
+        session.get_node.return_value.netifs.return_value = [
+            mock.MagicMock(node=mock.MagicMock(id=node_id)) for node_id in (1, 2, 3)
+        ]
+        mobility = model(session, 10)
+        config = mobility.default_values()
+        config["duration"] = "100"
+        config["width"] = "500"
+        config["height"] = "400"
+        mobility.update_config(config)
+
+        # when
+        mobility.loopwaypoints()
+        initial = {x: wp.coords for x, wp in mobility.initial.items()}
+        waypoints = list(mobility.queue) + list(mobility._waypoints)
+        mobility.loopwaypoints()
+        repeated = list(mobility.queue) + list(mobility._waypoints)
+
+        # then
+        assert mobility.endtime == 100.0
+        assert set(initial) == {1, 2, 3}
+        assert waypoints
+        assert [(x.time, x.nodenum, x.coords) for x in waypoints] == [
+            (x.time, x.nodenum, x.coords) for x in repeated
+        ]
+        for wp in waypoints:
+            x, y, _ = wp.coords
+            assert 0.0 <= x <= 500.0
+            assert 0.0 <= y <= 400.0
+            assert 0.0 <= wp.time <= 100.0
+            assert 5.0 <= wp.speed <= 20.0
@@ -1,8 +1,15 @@
+import threading
+
 import pytest
+from mock import MagicMock
 
+from core import utils
 from core.emulator.emudata import NodeOptions
 from core.emulator.enumerations import NodeTypes
-from core.errors import CoreError
+from core.errors import CoreCommandError, CoreError
+from core.nodes.netclient import LinuxNetClient, NetlinkNetClient
+from core.nodes.netlink import LinkWaiter
+from core.nodes.network import EbtablesQueue, EbtablesRuleset, NftablesQueue
 
 MODELS = ["router", "host", "PC", "mdr"]
 NET_TYPES = [NodeTypes.SWITCH, NodeTypes.HUB, NodeTypes.WIRELESS_LAN]
@@ -57,3 +64,227 @@ class TestNodes:
         # then
         assert node
         assert node.up
+
+    def test_node_channel_cmd(self, request, session):
+        if request.config.getoption("mock"):
+            pytest.skip("mocking calls")
+
+        # given
+        session.options.set_config("vnode_channel", "True")
+        try:
+            node = session.add_node()
+        finally:
+            session.options.set_config("vnode_channel", "False")
+
+        # when
+        output = node.cmd("echo hello")
+
+        # then
+        assert node.client.connected()
+        assert output == "hello"
+        node.client.close()
+        assert not node.client.connected()
+
+
+class TestNetClient:
+    def test_batch(self):
+        # given
+        run = MagicMock(return_value="")
+        net_client = LinuxNetClient(run)
+
+        # when
+        with net_client.batch():
+            net_client.create_veth("veth0", "veth1")
+            net_client.device_up("veth0")
+            net_client.get_mac("veth0")
+            net_client.device_up("veth1")
+
+        # then
+        assert run.call_count == 3
+        batch_args, batch_kwargs = run.call_args_list[0]
+        assert "-batch" in batch_args[0]
+        assert "link set veth0 up" in batch_args[0]
+        assert batch_kwargs["shell"]
+
+    def test_batch_error(self):
+        # given
+        stderr = b'Cannot find device "veth1"\nCommand failed -:2\n'
+        run = MagicMock(side_effect=CoreCommandError(1, "ip", "", stderr))
+        net_client = LinuxNetClient(run)
+
+        # when
+        with pytest.raises(CoreCommandError) as error:
+            with net_client.batch():
+                net_client.device_up("veth0")
+                net_client.device_up("veth1")
+
+        # then
+        assert error.value.cmd.endswith("link set veth1 up")
+
+    def test_netlink(self, request):
+        if request.config.getoption("mock"):
+            pytest.skip("mocking calls")
+
+        # given
+        net_client = NetlinkNetClient(utils.cmd)
+        net_client.create_bridge("b.9999.1")
+
+        # when
+        try:
+            net_client.create_veth("veth9999.1", "veth9999.2")
+            net_client.create_interface("b.9999.1", "veth9999.1")
+            net_client.create_address("veth9999.2", "10.99.0.1/24", "+")
+            output = utils.cmd("ip address show veth9999.2")
+            net_client.delete_device("veth9999.1")
+        finally:
+            net_client.delete_bridge("b.9999.1")
+
+        # then
+        assert "10.99.0.1/24 brd 10.99.0.255" in output
+        assert not net_client.existing_bridges("9999")
+
+    def test_link_waiter(self, request):
+        if request.config.getoption("mock"):
+            pytest.skip("mocking calls")
+
+        # given
+        link_waiter = LinkWaiter()
+        net_client = NetlinkNetClient(utils.cmd)
+        timer = threading.Timer(
+            0.1, net_client.create_veth, args=("veth9999.1", "veth9999.2")
+        )
+
+        # when
+        timer.start()
+        try:
+            result = link_waiter.wait("veth9999.2")
+            missing = link_waiter.wait("veth9999.3", timeout=0.1)
+        finally:
+            timer.join()
+            net_client.delete_device("veth9999.1")
+            link_waiter.close()
+
+        # then
+        assert result
+        assert not missing
+        assert not link_waiter.subscriptions
+
+
+class TestEbtablesRuleset:
+    def test_apply(self):
+        # given
+        data = (
+            "# Generated by ebtables-save\n"
+            "*filter\n"
+            ":INPUT ACCEPT\n"
+            ":FORWARD ACCEPT\n"
+            ":OUTPUT ACCEPT\n"
+            ":b.1.1 DROP\n"
+            "-A FORWARD --logical-in b.1.1 -j b.1.1\n"
+            "-A b.1.1 -i veth1 -o veth2 -j ACCEPT\n"
+            "COMMIT\n"
+        )
+        ruleset = EbtablesRuleset(data)
+
+        # when
+        ruleset.apply("-F b.1.1")
+        ruleset.apply("-A b.1.1 -i veth1 -o veth3 -j ACCEPT")
+        ruleset.apply("-N b.2.1 -P ACCEPT")
+        ruleset.apply("-A FORWARD --logical-in b.2.1 -j b.2.1")
+
+        # then
+        assert str(ruleset) == (
+            "*filter\n"
+            ":INPUT ACCEPT\n"
+            ":FORWARD ACCEPT\n"
+            ":OUTPUT ACCEPT\n"
+            ":b.1.1 DROP\n"
+            ":b.2.1 ACCEPT\n"
+            "-A FORWARD --logical-in b.1.1 -j b.1.1\n"
+            "-A FORWARD --logical-in b.2.1 -j b.2.1\n"
+            "-A b.1.1 -i veth1 -o veth3 -j ACCEPT\n"
+            "COMMIT"
+        )
+
+    def test_apply_invalid(self):
+        # given
+        ruleset = EbtablesRuleset("*filter\n:FORWARD ACCEPT\n")
+
+        # when
+        with pytest.raises(ValueError):
+            ruleset.apply("-A b.1.1 -i veth1 -o veth2 -j ACCEPT")
+
+
+class TestEbtablesQueue:
+    def test_buildcmds_delta(self):
+        # given
+        queue = EbtablesQueue()
+        netifs = [MagicMock(localname=f"veth{x}") for x in range(3)]
+        wlan = MagicMock(
+            brname="b.1.1",
+            policy="DROP",
+            has_ebtables_chain=False,
+            _linked={netifs[0]: {netifs[1]: True, netifs[2]: True}},
+            _linked_lock=threading.Lock(),
+        )
+        queue.buildcmds(wlan)
+        queue.cmds = []
+
+        # when
+        wlan._linked[netifs[0]][netifs[2]] = False
+        queue.ebchange(wlan, netifs[0], netifs[2])
+        queue.buildcmds(wlan)
+
+        # then
+        assert queue.cmds == [
+            "-D b.1.1 -i veth0 -o veth2 -j ACCEPT",
+            "-D b.1.1 -i veth2 -o veth0 -j ACCEPT",
+        ]
+
+    def test_buildcmds_rebuild(self):
+        # given
+        queue = EbtablesQueue()
+        netifs = [MagicMock(localname=f"veth{x}") for x in range(2)]
+        wlan = MagicMock(
+            brname="b.1.1",
+            policy="DROP",
+            has_ebtables_chain=True,
+            _linked={netifs[0]: {netifs[1]: True}},
+            _linked_lock=threading.Lock(),
+        )
+
+        # when
+        queue.ebchange(wlan)
+        queue.buildcmds(wlan)
+
+        # then
+        assert queue.cmds == [
+            "-F b.1.1",
+            "-A b.1.1 -i veth0 -o veth1 -j ACCEPT",
+            "-A b.1.1 -i veth1 -o veth0 -j ACCEPT",
+        ]
+
+    def test_nftables_buildcmds(self):
+        # given
+        queue = NftablesQueue()
+        netifs = [MagicMock(localname=f"veth{x}") for x in range(3)]
+        wlan = MagicMock(
+            brname="b.1.1",
+            policy="DROP",
+            has_ebtables_chain=False,
+            _linked={netifs[0]: {netifs[1]: True, netifs[2]: True}},
+            _linked_lock=threading.Lock(),
+        )
+        queue.buildcmds(wlan)
+        queue.cmds = []
+
+        # when
+        wlan._linked[netifs[0]][netifs[2]] = False
+        queue.ebchange(wlan, netifs[0], netifs[2])
+        queue.buildcmds(wlan)
+
+        # then
+        assert queue.cmds == [
+            "delete element bridge core_b_1_1 links "
+            '{ "veth0" . "veth2", "veth2" . "veth0" }'
+        ]
@@ -0,0 +1,67 @@
+import mock
+
+from core.emulator.data import NodeData
+from core.location.positions import PositionPipeline
+from core.nodes.base import Position
+
+
+def create_node(node_id, x, y):
+    node = mock.MagicMock(id=node_id, apitype=1)
+    node.name = f"n{node_id}"
+    node.position = Position(x, y)
+    node.data.side_effect = lambda message_type, **kwargs: NodeData(
+        message_type=message_type,
+        id=node_id,
+        name=node.name,
+        model="router",
+        x_position=node.position.x,
+        y_position=node.position.y,
+    )
+    return node
+
+
+class TestPositionPipeline:
+    def test_flush(self):
+        # given
+        session = mock.MagicMock()
+        session.event_loop.running = True
+        node_updates = []
+        session.node_handlers = [node_updates.append]
+        pipeline = PositionPipeline(session)
+        node_one = create_node(1, 10, 20)
+        node_two = create_node(2, 30, 40)
+
+        # when
+        pipeline.update(node_one)
+        pipeline.update(node_two)
+        node_one.position.set(50, 60)
+        pipeline.update(node_one)
+        pipeline.flush()
+
+        # then
+        session.event_loop.add_event.assert_called_once_with(0.0, pipeline.flush)
+        batch, node_data = session.bus.publish_positions.call_args[0]
+        positions = {x.id: (x.x_position, x.y_position) for x in batch}
+        assert positions == {1: (50, 60), 2: (30, 40)}
+        assert [x.model for x in batch] == [None, None]
+        assert node_updates == node_data
+        assert [(x.id, x.x_position, x.model) for x in node_data] == [
+            (1, 50, "router"),
+            (2, 30, "router"),
+        ]
+
+    def test_not_running(self):
+        # given
+        session = mock.MagicMock()
+        session.event_loop.running = False
+        node_updates = []
+        session.node_handlers = [node_updates.append]
+        pipeline = PositionPipeline(session)
+
+        # when
+        pipeline.update(create_node(1, 10, 20))
+
+        # then
+        assert [(x.id, x.x_position, x.y_position) for x in node_updates] == [
+            (1, 10, 20)
+        ]
@@ -1,10 +1,22 @@
 import os
+import subprocess
+import sys
 
 import pytest
 from mock import MagicMock
 
 from core.errors import CoreCommandError
-from core.services.coreservices import CoreService, ServiceDependencies, ServiceManager
+from core.services.coreservices import (
+    CoreService,
+    CoreServices,
+    ServiceBootError,
+    ServiceBootScheduler,
+    ServiceDependencies,
+    ServiceManager,
+    ServiceMode,
+)
+from core.services.readiness import Command, FileExists, ServiceProber, TcpPort
+from core.services.script import ServiceScript
 
 _PATH = os.path.abspath(os.path.dirname(__file__))
 _SERVICES_PATH = os.path.join(_PATH, "myservices")
@@ -47,6 +59,40 @@ class ServiceCycleDependency(CoreService):
     name = "G"
 
 
+class ServiceScriptA(CoreService):
+    name = "SA"
+    dirs = ("/var/a",)
+    startup = ("echo a",)
+    validation_mode = ServiceMode.BLOCKING
+
+
+class ServiceScriptB(CoreService):
+    name = "SB"
+    dependencies = ("SA",)
+    startup = ("false",)
+    validation_mode = ServiceMode.BLOCKING
+
+
+class ServiceScriptC(CoreService):
+    name = "SC"
+    dependencies = ("SB",)
+    startup = ("echo c",)
+    validation_mode = ServiceMode.BLOCKING
+
+
+class ServiceScriptD(CoreService):
+    name = "SD"
+    startup = ("echo d",)
+    readiness = (Command("true"),)
+
+
+class ServiceScriptE(CoreService):
+    name = "SE"
+    dependencies = ("SD",)
+    startup = ("echo e",)
+    validation_mode = ServiceMode.BLOCKING
+
+
 class TestServices:
     def test_service_all_files(self, session):
         # given
@@ -285,3 +331,281 @@ class TestServices:
         # when, then
         with pytest.raises(ValueError):
             ServiceDependencies(services).boot_paths()
+
+    def test_services_boot_scheduler(self):
+        # given
+        booted = []
+        services = MagicMock(boot_timings={})
+        services.use_scripts.return_value = False
+        services.get_service.side_effect = lambda node_id, name, **kwargs: name
+
+        def boot_service(node, name):
+            if node.id == 2 and name == "B":
+                raise ValueError("boot failed")
+            booted.append((node.id, name))
+
+        services.boot_service_nowait.side_effect = boot_service
+        scheduler = ServiceBootScheduler(services, workers=4)
+        setup = MagicMock()
+        for node_id in (1, 2):
+            node = MagicMock(id=node_id)
+            node.services = [ServiceA, ServiceB, ServiceC, ServiceD, ServiceF]
+            scheduler.add(node, setup)
+
+        # when
+        exceptions = scheduler.run()
+
+        # then
+        assert setup.call_count == 2
+        node_one = [name for node_id, name in booted if node_id == 1]
+        assert sorted(node_one) == ["A", "B", "C", "D", "F"]
+        assert node_one.index("B") < node_one.index("A")
+        assert node_one.index("D") < node_one.index("C")
+        assert sorted(name for node_id, name in booted if node_id == 2) == ["D", "F"]
+        assert len(exceptions) == 1
+        assert len(services.boot_timings) == 10
+
+    def test_services_boot_scheduler_script(self, monkeypatch):
+        # given
+        monkeypatch.setattr(
+            ServiceManager,
+            "services",
+            {
+                x.name: x
+                for x in (
+                    ServiceScriptA,
+                    ServiceScriptB,
+                    ServiceScriptC,
+                    ServiceScriptD,
+                    ServiceScriptE,
+                )
+            },
+        )
+        session = MagicMock()
+        session.options.get_config.return_value = "1"
+        services = CoreServices(session)
+        outputs = []
+
+        def cmd(args):
+            output = subprocess.check_output(args, shell=True).decode()
+            outputs.append(output)
+            return output
+
+        node = MagicMock(id=1)
+        node.name = "n1"
+        node.cmd.side_effect = cmd
+        node.privatedir_cmd.side_effect = lambda x: "true"
+        node.services = list(ServiceManager.services.values())
+        scheduler = ServiceBootScheduler(services, workers=4)
+        setup = MagicMock()
+
+        # when
+        scheduler.add(node, setup)
+        exceptions = scheduler.run()
+
+        # then
+        setup.assert_called_once_with()
+        assert node.cmd.call_count == 1
+        node.privatedir_cmd.assert_called_once_with("/var/a")
+        lines = outputs[0].split()
+        assert [x for x in lines if x in ("a", "c", "e")] == ["a", "e"]
+        assert len(exceptions) == 1
+        assert isinstance(exceptions[0], ServiceBootError)
+        error = exceptions[0].args[0]
+        assert isinstance(error, ServiceBootError)
+        assert error.args == ("node(n1) service(SB) error during startup",)
+
+    def test_services_boot_scheduler_bad_dependency(self):
+        # given
+        services = MagicMock(boot_timings={})
+        scheduler = ServiceBootScheduler(services, workers=4)
+        setup = MagicMock()
+        node = MagicMock(id=1)
+        node.services = [ServiceBadDependency]
+
+        # when
+        scheduler.add(node, setup)
+        exceptions = scheduler.run()
+
+        # then
+        setup.assert_called_once_with()
+        assert not services.boot_service_nowait.called
+        assert len(exceptions) == 1
+
+    def test_services_prober(self):
+        # given
+        prober = ServiceProber()
+        node = MagicMock()
+        node.cmd.side_effect = [CoreCommandError(1, "sh", ""), ""]
+        other_node = MagicMock()
+        other_node.cmd.side_effect = CoreCommandError(1, "sh", "")
+        probes = [FileExists("/tmp/ready")]
+        error = ValueError("not ready")
+
+        # when
+        ready = prober.watch(node, "A", probes, 5, period=0.01, error=error)
+        timed_out = prober.watch(other_node, "B", [TcpPort(80)], 0.05, 0.01, error)
+        timer = prober.watch(node, "C", [], 0.01)
+
+        # then
+        assert ready.result(timeout=1) is None
+        assert timer.result(timeout=1) is None
+        assert timed_out.exception(timeout=1) is error
+        assert node.cmd.call_count == 2
+
+    def test_services_prober_check_node(self):
+        # given
+        def cmd(args):
+            result = subprocess.run(args, shell=True, stdout=subprocess.PIPE)
+            output = result.stdout.decode()
+            if result.returncode:
+                raise CoreCommandError(result.returncode, args, output)
+            return output
+
+        node = MagicMock()
+        node.cmd.side_effect = cmd
+        probes = [Command("true"), Command("false"), Command("true")]
+        watch = MagicMock(probes=probes, passed=[False, False, True])
+
+        # when
+        ServiceProber.check_node(node, [watch])
+        failed = list(watch.passed)
+        probes[1].command = "true"
+        ServiceProber.check_node(node, [watch])
+
+        # then
+        assert failed == [True, False, True]
+        assert watch.passed == [True, True, True]
+        assert node.cmd.call_count == 2
+
+    def test_services_file_cache(self, tmpdir):
+        # given
+        class ServiceFile(CoreService):
+            name = "File"
+            configs = ("file.sh",)
+            generated = 0
+
+            @classmethod
+            def generate_config(cls, node, filename):
+                cls.generated += 1
+                return "echo file"
+
+        services = CoreServices(MagicMock())
+        node = MagicMock(id=1, server=None, nodedir=str(tmpdir), services=[])
+        node.name = "n1"
+        node.netifs.return_value = []
+        node.hostfilename.side_effect = lambda x: str(tmpdir.join(x))
+        node.nodefile.side_effect = lambda x, data: tmpdir.join(x).write(data)
+
+        # when
+        services.create_service_files(node, ServiceFile)
+        services.create_service_files(node, ServiceFile)
+        node.name = "n2"
+        services.create_service_files(node, ServiceFile)
+        node.session.options.get_configs.return_value = {"quagga_bin_search": "/b"}
+        services.create_service_files(node, ServiceFile)
+        services.create_service_files(node, ServiceFile)
+
+        # then
+        assert ServiceFile.generated == 3
+        assert node.nodefile.call_count == 1
+        assert services.file_cache.stats() == {
+            "size": 1,
+            "hits": 2,
+            "misses": 3,
+            "writes": 1,
+            "skipped": 4,
+        }
+
+    def test_services_script(self):
+        # given
+        node = MagicMock()
+        node.cmd.side_effect = lambda x: subprocess.check_output(x, shell=True).decode()
+        script = ServiceScript()
+        step_a = script.add("A", "echo one")
+        step_b = script.add("B", "false")
+        script.add("C", "echo two; exit 3")
+        script.add("D", "sleep 0", wait=False)
+        step_e = script.add("E", "echo three", requires=[step_b])
+        script.add("F", "echo four", requires=[step_a])
+        script.add("G", "echo five", requires=[step_e])
+
+        # when
+        results = script.run(node)
+
+        # then
+        assert node.cmd.call_count == 1
+        assert results == [
+            ("A", 0, "one"),
+            ("B", 1, ""),
+            ("C", 3, "two"),
+            ("D", 0, ""),
+            ("E", -1, ""),
+            ("F", 0, "four"),
+            ("G", -1, ""),
+        ]
+
+    def test_services_lazy_index(self, tmpdir, monkeypatch):
+        # given
+        monkeypatch.setattr(ServiceManager, "services", {})
+        monkeypatch.setattr(ServiceManager, "index", {})
+        monkeypatch.setattr(ServiceManager, "cache_dir", str(tmpdir.join("cache")))
+        services_path = tmpdir.mkdir("lazyservices")
+        services_path.join("__init__.py").write("")
+        services_path.join("lazy.py").write(
+            "from core.services.coreservices import CoreService\n"
+            "class LazyService(CoreService):\n"
+            "    name = 'Lazy'\n"
+            "    group = 'Utility'\n"
+            "    dependencies = ('MyService',)\n"
+        )
+        ServiceManager.add_services(str(services_path))
+        sys.modules.pop("lazyservices.lazy")
+        ServiceManager.services.clear()
+
+        # when
+        errors = ServiceManager.add_services(str(services_path))
+
+        # then
+        assert errors == []
+        assert "lazyservices.lazy" not in sys.modules
+        service = ServiceManager.all_services()["Lazy"]
+        assert (service.group, service.dependencies) == ("Utility", ("MyService",))
+        service = ServiceManager.get("Lazy")
+        assert "lazyservices.lazy" in sys.modules
+        assert service.__name__ == "LazyService"
+        assert ServiceManager.index == {}
+
+    def test_services_index_base_changed(self, tmpdir, monkeypatch):
+        # given
+        monkeypatch.setattr(ServiceManager, "services", {})
+        monkeypatch.setattr(ServiceManager, "index", {})
+        monkeypatch.setattr(ServiceManager, "cache_dir", str(tmpdir.join("cache")))
+        services_path = tmpdir.mkdir("baseservices")
+        services_path.join("__init__.py").write("")
+        base = services_path.join("base.py")
+        base.write(
+            "from core.services.coreservices import CoreService\n"
+            "class BaseService(CoreService):\n"
+            "    group = 'Base'\n"
+        )
+        services_path.join("derived.py").write(
+            "from baseservices.base import BaseService\n"
+            "class DerivedService(BaseService):\n"
+            "    name = 'Derived'\n"
+        )
+        ServiceManager.add_services(str(services_path))
+
+        # when
+        base.write(
+            "from core.services.coreservices import CoreService\n"
+            "class BaseService(CoreService):\n"
+            "    group = 'Changed'\n"
+        )
+        sys.modules.pop("baseservices.base")
+        sys.modules.pop("baseservices.derived")
+        ServiceManager.services.clear()
+        ServiceManager.add_services(str(services_path))
+
+        # then
+        assert ServiceManager.all_services()["Derived"].group == "Changed"
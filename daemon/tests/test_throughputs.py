@@ -0,0 +1,65 @@
+import mock
+
+from core.emulator.throughputs import ThroughputSampler
+from core.nodes import netlink
+from core.nodes.base import CoreNetworkBase
+
+
+def create_session():
+    session = mock.MagicMock()
+    session.netif_version = 1
+    netif = mock.MagicMock(localname="veth1.0.1", netindex=0)
+    node = mock.MagicMock(id=1)
+    node.netifs.return_value = [netif]
+    network = mock.MagicMock(spec=CoreNetworkBase, id=2, brname="b.2.1")
+    session.nodes = {1: node, 2: network}
+    return session
+
+
+def create_link(index, name, rx, tx):
+    stats = netlink.LINK_STATS64.pack(0, 0, rx, tx) + bytes(8)
+    data = (
+        netlink.ifinfomsg(index)
+        + netlink.pack_string(netlink.IFLA_IFNAME, name)
+        + netlink.pack_attr(netlink.IFLA_STATS64, stats)
+    )
+    return netlink.RTM_NEWLINK, data
+
+
+def create_requests(lo, rx, tx):
+    requests = mock.MagicMock()
+    requests.request.return_value = [
+        create_link(1, "lo", lo, lo),
+        create_link(2, "veth1.0.1", rx, tx),
+        create_link(3, "b.2.1", rx, tx),
+    ]
+    return requests
+
+
+class TestThroughputs:
+    def test_link_stats(self):
+        # given
+        requests = create_requests(5, 100, 200)
+
+        # when
+        stats = netlink.link_stats(requests, {"veth1.0.1"})
+
+        # then
+        requests.request.assert_called_once_with(
+            netlink.RTM_GETLINK, netlink.ifinfomsg(), netlink.NLM_F_DUMP
+        )
+        assert stats == {"veth1.0.1": (100.0, 200.0)}
+
+    def test_sample(self):
+        # given
+        sampler = ThroughputSampler(create_session())
+
+        # when
+        stats, _, _ = sampler.sample(create_requests(5, 100, 200), {}, 0.0)
+        _, interfaces, bridges = sampler.sample(
+            create_requests(10, 200, 400), stats, 2.0
+        )
+
+        # then
+        assert interfaces == {(1, 0): 1200.0}
+        assert bridges == {2: 1200.0}